@@ -0,0 +1,79 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from centreon_sdk.network.intern_table import DEFAULT_FIELDS
+from centreon_sdk.network.network import Network
+from centreon_sdk.util.config import Config
+
+COUNT = 300000
+
+
+def service_row(index):
+    # Realtime services as returned by service_status_get: 10 services per host on 3 pollers
+    return {"id": index, "name": "host-{:05d}".format(index // 10), "description": "service-{}".format(index % 10),
+            "state": ["OK", "WARNING", "CRITICAL", "UNKNOWN"][index % 7 % 4], "state_type": "HARD",
+            "output": "check {} returned".format(index), "instance_name": "poller-{}".format(index % 3),
+            "criticality": "", "check_command": "check_ping", "last_check": 1600000000 + index}
+
+
+def rss():
+    """Current resident set size in bytes"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Only the peak is available on other systems
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def measure(intern):
+    text = json.dumps({"result": [service_row(x) for x in range(COUNT)]})
+    network = Network(Config(), intern_fields=DEFAULT_FIELDS if intern else None)
+    gc.collect()
+    before = rss()
+    start = time.perf_counter()
+    result = network.decode(text)
+    duration = time.perf_counter() - start
+    gc.collect()
+    size = rss() - before
+    # Comparing the host names of all rows, like grouping by host does
+    start = time.perf_counter()
+    rows = result["result"]
+    matches = sum(1 for x, y in zip(rows, rows[1:]) if x["name"] == y["name"])
+    compare = time.perf_counter() - start
+    print("{:<12} {:>8.1f} MB RSS {:>6.0f} bytes/row decode {:>5.2f} s compare {:>5.3f} s ({} equal)".format(
+        "interned" if intern else "plain", size / 2 ** 20, size / COUNT, duration, compare, matches))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        measure(sys.argv[1] == "interned")
+    else:
+        print("{} realtime service rows".format(COUNT))
+        # Every mode runs in its own process, so the memory freed by the other one is not reused
+        for mode in ("plain", "interned"):
+            subprocess.run([sys.executable, __file__, mode], check=True)
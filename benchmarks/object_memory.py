@@ -0,0 +1,90 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import gc
+import time
+import tracemalloc
+
+from centreon_sdk.objects.base.host import Host, HostParam
+from centreon_sdk.objects.base.service import Service
+
+COUNT = 200000
+
+
+class DictHost:
+    """Storage of the objects before they were compact: one dynamic attribute per param plus per object metadata"""
+    def __init__(self, row):
+        self.required_params = [HostParam.NAME, HostParam.ALIAS, HostParam.ADDRESS, HostParam.INSTANCE]
+        self.unset_params = []
+        self.param_class = HostParam
+        for key, value in row.items():
+            setattr(self, HostParam(key)._name_, value)
+
+
+class DictService:
+    def __init__(self, row):
+        for key, value in row.items():
+            setattr(self, key, value)
+
+
+def host_row(index):
+    return {"name": "host-{}".format(index), "alias": "Host {}".format(index), "address": "10.0.{}.{}".format(
+        index // 256 % 256, index % 256), "activate": "1", "instance": "Central"}
+
+
+def service_row(index):
+    return {"host_id": index // 10, "host_name": "host-{}".format(index // 10), "id_unique": index,
+            "description": "service-{}".format(index % 10), "check_command": "check_ping",
+            "check_command_arg": "!200,20%!400,50%", "normal_check_interval": 5, "retry_check_interval": 1,
+            "max_check_attempts": 3, "active_checks_enabled": "2", "passive_checks_enabled": "2", "activate": "1"}
+
+
+def new_host(row):
+    host = Host()
+    for key, value in row.items():
+        host.set(HostParam(key), value)
+    return host
+
+
+def measure(name, rows, factory):
+    # Time and memory are measured in separate runs, as tracing the allocations slows down the construction
+    gc.collect()
+    start = time.perf_counter()
+    objects = [factory(x) for x in rows]
+    duration = time.perf_counter() - start
+    del objects
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory(x) for x in rows]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:<14} {:>8.1f} MB {:>8.0f} bytes/object {:>6.2f} s".format(name, size / 2 ** 20, size / len(objects),
+                                                                     duration))
+    return objects
+
+
+if __name__ == '__main__':
+    host_rows = [host_row(x) for x in range(COUNT)]
+    service_rows = [service_row(x) for x in range(COUNT)]
+    print("{} objects each, row data excluded".format(COUNT))
+    measure("Host (dict)", host_rows, DictHost)
+    measure("Host", host_rows, new_host)
+    measure("Host (row)", host_rows, lambda x: Host(**x))
+    measure("Service (dict)", service_rows, lambda x: DictService(x))
+    measure("Service", service_rows, lambda x: Service(**x))
@@ -0,0 +1,94 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import gc
+import os
+import re
+import resource
+import subprocess
+import sys
+import time
+
+from centreon_sdk.util import perfdata
+
+COUNT = 1000000
+
+# Regex of a typical ad-hoc parser, splitting the metrics first and matching every metric on its own
+AD_HOC = re.compile(r"^'?([^'=]+)'?=([-0-9.]+)([a-zA-Z%]*);?([^;]*);?([^;]*);?([^;]*);?([^;]*)$")
+
+
+def service_row(index):
+    # Perfdata of check_ping, check_disk and check_load style plugins
+    kind = index % 3
+    if kind == 0:
+        text = "rta={:.3f}ms;100.000;500.000;0; pl={}%;20;60;0;100".format(index % 997 / 10, index % 5)
+    elif kind == 1:
+        text = "'/var'={}MB;8000;9000;0;10000 '/var/log'={}MB;800;900;0;1000".format(index % 10000, index % 1000)
+    else:
+        text = "load1={0:.2f};4;8;0; load5={0:.2f};4;8;0; load15={0:.2f};4;8;0;".format(index % 400 / 100)
+    return {"name": "host-{:05d}".format(index // 10), "description": "service-{}".format(index % 10),
+            "perfdata": text}
+
+
+def ad_hoc(rows):
+    result = []
+    for row in rows:
+        for metric in row["perfdata"].split(" "):
+            match = AD_HOC.match(metric)
+            if match:
+                label, value, unit, warn, crit, minimum, maximum = match.groups()
+                result.append((row["name"], row["description"], label, float(value), unit, warn, crit,
+                               float(minimum) if minimum else None, float(maximum) if maximum else None))
+    return result
+
+
+def rss():
+    """Current resident set size in bytes"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Only the peak is available on other systems
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+MODES = {"ad hoc": ad_hoc, "records": lambda rows: list(perfdata.metrics(rows)), "table": perfdata.table}
+
+
+def measure(mode):
+    rows = [service_row(x) for x in range(COUNT)]
+    gc.collect()
+    before = rss()
+    start = time.perf_counter()
+    result = MODES[mode](rows)
+    duration = time.perf_counter() - start
+    gc.collect()
+    size = rss() - before
+    print("{:<8} {:>6.2f} s {:>8.0f} strings/s {:>8.1f} MB RSS {:>8} metrics".format(
+        mode, duration, COUNT / duration, size / 2 ** 20, len(result)))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        measure(sys.argv[1])
+    else:
+        print("{} perfdata strings".format(COUNT))
+        # Every mode runs in its own process, so the memory freed by the other one is not reused
+        for name in MODES:
+            subprocess.run([sys.executable, __file__, name], check=True)
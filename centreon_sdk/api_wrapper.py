@@ -17,13 +17,20 @@ You should have received a copy of the GNU General Public License
 along with this program; if not, write to the Free Software
 Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 """
+import contextlib
+import threading
+
+from centreon_sdk.network.journal import Journal
 from centreon_sdk.network.network import Network, HTTPVerb
+from centreon_sdk.network.status_pager import StatusPager
+from centreon_sdk.network.transaction import Transaction
+from centreon_sdk.network.write_queue import WriteQueue
 from centreon_sdk.objects.base.acl_action import ACLAction
-from centreon_sdk.objects.base.acl_menu import ACLMenu
+from centreon_sdk.objects.base.acl_group import ACLGroup
 from centreon_sdk.objects.base.acl_resource import ACLResource
 from centreon_sdk.objects.base.cent_broker_cfg import CentBrokerCFG
 from centreon_sdk.objects.base.cent_engine_cfg import CentEngineCFG
-from centreon_sdk.objects.base.cmd import CMDType, CMD
+from centreon_sdk.objects.base.cmd import CMD
 from centreon_sdk.objects.base.contact import Contact, ContactAuthenticationType, ContactParam
 from centreon_sdk.objects.base.contact_group import ContactGroup, ContactGroupParam
 from centreon_sdk.objects.base.contact_template import ContactTemplate, ContactTemplateAuthType
@@ -34,7 +41,9 @@ from centreon_sdk.objects.base.host import Host, HostParam
 from centreon_sdk.objects.base.host_category import HostCategory
 from centreon_sdk.objects.base.host_group import HostGroup, HostGroupParam
 from centreon_sdk.objects.base.host_group_service import HostGroupService
+from centreon_sdk.objects.base.host_status import HostStatus
 from centreon_sdk.objects.base.host_template import HostTemplate
+from centreon_sdk.objects.base.identity_map import IdentityMap
 from centreon_sdk.objects.base.instance import Instance
 from centreon_sdk.objects.base.ldap import LDAP, LDAPServer
 from centreon_sdk.objects.base.macro import Macro, MacroParam
@@ -45,14 +54,17 @@ from centreon_sdk.objects.base.resource_cfg import ResourceCFG
 from centreon_sdk.objects.base.service import Service, ServiceNotificationOption
 from centreon_sdk.objects.base.service_category import ServiceCategory
 from centreon_sdk.objects.base.service_group import ServiceGroup
+from centreon_sdk.objects.base.service_status import ServiceStatus
 from centreon_sdk.objects.base.service_template import ServiceTemplate, ServiceTemplateStalkingOption
 from centreon_sdk.objects.base.settings import Settings, SettingsParam
+from centreon_sdk.objects.base.status_table import StatusTable
 from centreon_sdk.objects.base.time_period import TimePeriod, TimePeriodException
 from centreon_sdk.objects.base.trap import Trap, TrapMatching
 from centreon_sdk.objects.base.vendor import Vendor
 from centreon_sdk.util import method_utils
 from centreon_sdk.util.config import Config
 from centreon_sdk.util.method_utils import pack_locals
+from centreon_sdk.util.status_filter import StatusFilter
 
 
 class ApiWrapper:
@@ -66,16 +78,35 @@ class ApiWrapper:
     :type url: str
     :param verify: Optional: Set False if you do not want to verify the SSL certificate
     :type verify: bool
+    :param identity_map: Optional: Specify True to return the same object for every read of an entity. \
+    See :ref:`class_identity_map`. Default False
+    :type identity_map: bool
     """
 
-    def __init__(self, username, password, url, verify=True):
+    def __init__(self, username, password, url, verify=True, *, identity_map=False):
         self.config = Config()
         self.config.vars["URL"] = url
+        self.__local = threading.local()
         self.network = Network(self.config, verify)
+        self.identity_map = IdentityMap() if identity_map else None
         self.config.vars["header"] = {"centreon-auth-token": self.get_auth_token(username, password)}
         self.config.vars["params"] = {"action": "action",
                                       "object": "centreon_clapi"}
 
+    @property
+    def network(self):
+        """Network the requests of the current thread are sent with, the write queue inside a write_behind block"""
+        queue = getattr(self.__local, "queue", None)
+        return queue if queue is not None else self.__network
+
+    @network.setter
+    def network(self, network):
+        # Inside a write_behind block only the network of the current thread is replaced
+        if getattr(self.__local, "queue", None) is not None:
+            self.__local.queue = network
+        else:
+            self.__network = network
+
     def get_auth_token(self, username, password):
         """This method is used to receive the authentication token
 
@@ -94,8 +125,98 @@ class ApiWrapper:
                                              use_header=False)
         return response["authToken"]
 
+    @contextlib.contextmanager
+    def write_behind(self, max_workers=8):
+        """This method is used to buffer all write operations made inside the with block in a write queue.
+        The collapsed operations are flushed when the block is left or when a read operation is made. Write methods
+        called inside the block return True once the operation is queued. The queue is only used by the thread which
+        opened the block, requests of other threads are sent immediately.
+
+        Usage::
+
+            with api.write_behind() as queue:
+                api.host_set_param("host", HostParam.ALIAS, "alias")
+            print(queue.failed)
+
+        :param max_workers: Optional: Maximum number of concurrent requests while flushing. Default 8
+        :type max_workers: int
+
+        :return: Returns the write queue
+        :rtype: :ref:`class_write_queue`
+        """
+        previous = getattr(self.__local, "queue", None)
+        queue = WriteQueue(self.network, self.config.vars["params"], max_workers=max_workers)
+        self.__local.queue = queue
+        try:
+            yield queue
+        finally:
+            self.__local.queue = previous
+            queue.flush()
+
+    @contextlib.contextmanager
+    def journal(self, path, *, sync=True, keep=False):
+        """This method is used to record all write operations made inside the with block in a journal file.
+        If the block is run again with the same journal file, operations which were already applied are skipped.
+        The journal file is deleted when the block is left without errors and no operation failed.
+
+        Usage::
+
+            with api.journal("commit.journal") as journal:
+                api.host_set_param("host", HostParam.ALIAS, "alias")
+            print(journal.skipped, journal.failed)
+
+        :param path: Path of the journal file
+        :type path: str
+        :param sync: Optional: Flush every entry to disk before continuing. Default True
+        :type sync: bool
+        :param keep: Optional: Keep the journal file even if all operations were applied. Default False
+        :type keep: bool
+
+        :return: Returns the journal
+        :rtype: :ref:`class_journal`
+        """
+        network = self.network
+        journal = Journal(path, network, self.config.vars["params"], sync=sync)
+        self.network = journal
+        completed = False
+        try:
+            yield journal
+            completed = True
+        finally:
+            self.network = network
+            journal.close(remove=completed and not keep and not journal.failed)
+
+    @contextlib.contextmanager
+    def transaction(self, max_workers=8):
+        """This method is used to roll back the write operations made inside the with block if it raises an exception.
+        Inside the block failed write operations raise a CentreonRequestFailedError. See
+        :ref:`class_transaction` for the operations that can be rolled back.
+
+        Usage::
+
+            with api.transaction() as transaction:
+                api.host_add_template("host", ["template"])
+                api.host_add_host_group("host", ["group"])
+            print(transaction.irreversible)
+
+        :param max_workers: Optional: Maximum number of concurrent requests while rolling back. Default 8
+        :type max_workers: int
+
+        :return: Returns the transaction
+        :rtype: :ref:`class_transaction`
+        """
+        network = self.network
+        transaction = Transaction(network, self.config.vars["params"], max_workers=max_workers)
+        self.network = transaction
+        try:
+            with transaction.scope():
+                yield transaction
+        finally:
+            self.network = network
+
     def host_status_get(self, *, viewType=None, fields=None, status=None, hostgroup=None, instance=None, search=None,
-                        critically=None, sortType=None, order=None, limit=None, number=None):
+                        critically=None, sortType=None, order=None, limit=None, number=None, columnar=False,
+                        projection=None, where=None):
         """This method is used to get the host status from a host object
 
         :param viewType: Select a predefined filter like in the monitoring view. One of *all*, *unhandled*, *problems*
@@ -120,20 +241,30 @@ class ApiWrapper:
         :type limit: int
         :param number: Specify page number
         :type number: int
+        :param columnar: Optional: Specify True to get a :ref:`class_status_table`, which stores every field in a \
+        column. Default False
+        :type columnar: bool
+        :param projection: Optional: Attributes to get, created with ``project`` of :ref:`class_host_status`. Only \
+        their fields are requested and a record with the attributes is returned for every row
+        :type projection: :ref:`class_projection`
+        :param where: Optional: Filter like ``status in (down, unreachable) and name ~ /db/``. What the endpoint \
+        supports is sent as parameters, the rest is evaluated locally. See :ref:`class_status_filter`
+        :type where: Union[str, :ref:`class_status_filter`]
 
         :return: Returns a list of HostStatus
-        :rtype: list of dict
+        :rtype: Union[list of dict, :ref:`class_status_table`, list of collections.namedtuple]
         """
         param_dict = pack_locals(locals())
-        param_dict["object"] = "centreon_realtime_hosts"
-        param_dict["action"] = "list"
-
-        response = self.network.make_request(HTTPVerb.GET, params=param_dict)
-        return response
+        for item in ("columnar", "projection", "where"):
+            param_dict.pop(item, None)
+        status_filter = _status_filter(where, HostStatus)
+        response = self.__status_request("centreon_realtime_hosts", param_dict, projection, status_filter)
+        return _status_result(response, HostStatus, columnar, projection, status_filter)
 
     def service_status_get(self, *, viewType=None, fields=None, status=None, hostgoup=None, servicegroup=None,
                            instance=None, search=None, searchHost=None, searchOutput=None, criticality=None,
-                           sortType=None, order=None, limit=None, number=None):
+                           sortType=None, order=None, limit=None, number=None, columnar=False,
+                           projection=None, where=None):
         """This method is used to get information about the service status from a service object
 
         :param viewType: Select a predefined filter like in the monitoring view. One of *all*, *unhandled*, *problems*
@@ -165,20 +296,105 @@ class ApiWrapper:
         :type limit: int
         :param number: page number
         :type number: int
+        :param columnar: Optional: Specify True to get a :ref:`class_status_table`, which stores every field in a \
+        column. Default False
+        :type columnar: bool
+        :param projection: Optional: Attributes to get, created with ``project`` of :ref:`class_service_status`. Only \
+        their fields are requested and a record with the attributes is returned for every row
+        :type projection: :ref:`class_projection`
+        :param where: Optional: Filter like ``status in (down, unreachable) and name ~ /db/``. What the endpoint \
+        supports is sent as parameters, the rest is evaluated locally. See :ref:`class_status_filter`
+        :type where: Union[str, :ref:`class_status_filter`]
 
         :return: Returns a list of ServiceStatus
-        :rtype: list of dict
+        :rtype: Union[list of dict, :ref:`class_status_table`, list of collections.namedtuple]
         """
         param_dict = pack_locals(locals())
-        param_dict["object"] = "centreon_realtime_services"
+        for item in ("columnar", "projection", "where"):
+            param_dict.pop(item, None)
+        if "hostgoup" in param_dict:
+            # The keyword argument is misspelled, the endpoint expects "hostgroup"
+            param_dict["hostgroup"] = param_dict.pop("hostgoup")
+        status_filter = _status_filter(where, ServiceStatus)
+        response = self.__status_request("centreon_realtime_services", param_dict, projection, status_filter)
+        return _status_result(response, ServiceStatus, columnar, projection, status_filter)
+
+    def iter_host_status(self, *, page_size=1000, prefetch=True, parallel=1, projection=None, where=None,
+                        **filters):
+        """This method is used to iterate over the host status page by page. The result can be used with ``for`` and
+        with ``async for``
+
+        :param page_size: Optional: Size of the first page, it adapts to the time a request takes. Default 1000
+        :type page_size: int
+        :param prefetch: Optional: Specify False to fetch a page only when the previous one was processed. Default True
+        :type prefetch: bool
+        :param parallel: Optional: Number of pages which are fetched at the same time. Default 1
+        :type parallel: int
+        :param projection: Optional: Attributes to get, see :meth:`host_status_get`
+        :type projection: :ref:`class_projection`
+        :param where: Optional: Filter, see :meth:`host_status_get`
+        :type where: Union[str, :ref:`class_status_filter`]
+        :param filters: Optional: Filters of :meth:`host_status_get`, e.g. status or search
+        :type filters: str
+
+        :return: Returns the host status one by one
+        :rtype: :ref:`class_status_pager`
+        """
+        status_filter = _status_filter(where, HostStatus)
+        return StatusPager(lambda limit, number: self.__status_request(
+            "centreon_realtime_hosts", dict(filters, limit=limit, number=number), projection, status_filter),
+            page_size=page_size, prefetch=prefetch, parallel=parallel,
+            select=lambda rows: _status_result(rows, HostStatus, False, projection, status_filter))
+
+    def iter_service_status(self, *, page_size=1000, prefetch=True, parallel=1, projection=None, where=None,
+                           **filters):
+        """This method is used to iterate over the service status page by page. The result can be used with ``for``
+        and with ``async for``
+
+        :param page_size: Optional: Size of the first page, it adapts to the time a request takes. Default 1000
+        :type page_size: int
+        :param prefetch: Optional: Specify False to fetch a page only when the previous one was processed. Default True
+        :type prefetch: bool
+        :param parallel: Optional: Number of pages which are fetched at the same time. Default 1
+        :type parallel: int
+        :param projection: Optional: Attributes to get, see :meth:`service_status_get`
+        :type projection: :ref:`class_projection`
+        :param where: Optional: Filter, see :meth:`service_status_get`
+        :type where: Union[str, :ref:`class_status_filter`]
+        :param filters: Optional: Filters of :meth:`service_status_get`, e.g. status or searchHost
+        :type filters: str
+
+        :return: Returns the service status one by one
+        :rtype: :ref:`class_status_pager`
+        """
+        status_filter = _status_filter(where, ServiceStatus)
+        return StatusPager(lambda limit, number: self.__status_request(
+            "centreon_realtime_services", dict(filters, limit=limit, number=number), projection, status_filter),
+            page_size=page_size, prefetch=prefetch, parallel=parallel,
+            select=lambda rows: _status_result(rows, ServiceStatus, False, projection, status_filter))
+
+    def __status_request(self, object_name, param_dict, projection, status_filter):
+        if status_filter is not None:
+            for param, value in status_filter.params.items():
+                if param_dict.setdefault(param, value) != value:
+                    raise ValueError("{} is set as parameter and in the filter".format(param))
+        fields = param_dict.get("fields") or (projection.fields if projection is not None else None)
+        if fields and status_filter is not None and status_filter.fields:
+            # The fields the filter evaluates locally have to be requested as well
+            fields = ",".join(dict.fromkeys(fields.split(",") + sorted(status_filter.fields)))
+        if fields:
+            param_dict["fields"] = fields
+        param_dict["object"] = object_name
         param_dict["action"] = "list"
+        return self.network.make_request(HTTPVerb.GET, params=param_dict)
 
-        response = self.network.make_request(HTTPVerb.GET, params=param_dict)
-        return response
-
-    def host_show(self):
+    def host_show(self, *, lazy=False):
         """This method is used to list all available hosts
 
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the objects only when \
+        they are changed. Default False
+        :type lazy: bool
+
         :return: Returns hosts available in centreon
         :rtype: list of :ref:`class_host`:
         """
@@ -186,7 +402,7 @@ class ApiWrapper:
                      "action": "show"}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        return [Host(**x) for x in response]
+        return Host.from_rows(response, lazy=lazy, identity_map=self.identity_map)
 
     def host_add(self, host_name, host_alias, host_address, host_templates, instance, host_groups):
         """This method is used to add a new host
@@ -303,16 +519,7 @@ class ApiWrapper:
                      "object": "host",
                      "values": host_name}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
-        ret = []
-        for macro in response["result"]:
-            m = Macro()
-            m.set(MacroParam.NAME, macro["macro_name"])
-            m.set(MacroParam.VALUE, macro["macro_value"])
-            m.set(MacroParam.SOURCE, macro["source"])
-            m.set(MacroParam.IS_PASSWORD, bool(macro["is_password"]))
-            m.set(MacroParam.DESCRIPTION, macro["description"])
-            ret.append(m)
-        return ret
+        return Macro.from_rows(response["result"], identity_map=self.identity_map)
 
     def host_set_macro(self, host_name, macro_name, macro_value):
         """This method is used to set a macro for a specific host
@@ -357,18 +564,13 @@ class ApiWrapper:
         :type host_name: str
 
         :return: Returns a list of used templates (id, name)
-        :rtype: list of dict
+        :rtype: list of HostTemplate
         """
         data_dict = {"action": "gettemplate",
                      "object": "host",
                      "values": host_name}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
-        ret = []
-        for template in response["result"]:
-            ht = HostTemplate()
-            ht.set(HostParam.NAME, template["name"])
-            ret.append(ht)
-        return ret
+        return HostTemplate.from_rows(response["result"], identity_map=self.identity_map)
 
     def host_set_template(self, host_name, template_name):
         """This method is used to set a template, if other templates are linked to the host, they are removed
@@ -443,18 +645,13 @@ class ApiWrapper:
         :type host_name: str
 
         :return: Returns list of parents
-        :rtype:
+        :rtype: list of :ref:`class_host`
         """
         data_dict = {"action": "getparent",
                      "object": "host",
                      "values": host_name}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
-        ret = []
-        for parent in response["result"]:
-            p = Host()
-            p.set(HostParam.NAME, parent["name"])
-            ret.append(p)
-        return ret
+        return Host.from_rows(response["result"], identity_map=self.identity_map)
 
     def host_set_parent(self, host_name, parent_names):
         """This method is used to set the parent of a host
@@ -761,6 +958,131 @@ class ApiWrapper:
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return method_utils.check_if_empty_list(response)
 
+    def host_template_add(self, template_name, template_alias, template_address="", templates=None, instance="",
+                          host_groups=None):
+        """This method is used to add a new host template
+
+        :param template_name: Name of the host template
+        :type template_name: str
+        :param template_alias: Alias of the host template
+        :type template_alias: str
+        :param template_address: Optional: Address of the host template
+        :type template_address: str
+        :param templates: Optional: List of parent host templates
+        :type templates: list of str
+        :param instance: Optional: Instance the hosts should be checked from
+        :type instance: str
+        :param host_groups: Optional: List of host groups
+        :type host_groups: list of str
+
+        :return: Returns True if operation was successful
+        :rtype: bool
+        """
+        data_dict = {"action": "add",
+                     "object": "htpl",
+                     "values": ";".join([template_name, template_alias, template_address,
+                                         "|".join(templates) if templates else "", instance,
+                                         "|".join(host_groups) if host_groups else ""])}
+        response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
+        return method_utils.check_if_empty_list(response)
+
+    def host_template_del(self, template_name):
+        """This method is used to delete a host template
+
+        :param template_name: Name of the host template
+        :type template_name: str
+
+        :return: Returns True if the operation was successful
+        :rtype: bool
+        """
+        data_dict = {"action": "del",
+                     "object": "htpl",
+                     "values": template_name}
+        response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
+        return method_utils.check_if_empty_list(response)
+
+    def host_template_set_param(self, template_name, param_name, param_value):
+        """This method is used to set a param for a host template
+
+        :param template_name: Name of the host template
+        :type template_name: str
+        :param param_name: Name of the param
+        :type param_name: :ref:`class_host_param`
+        :param param_value: Value of the param
+        :type param_value: str
+
+        :return: Returns True, if operation was successful
+        :rtype: bool
+        """
+        data_dict = {"action": "setparam",
+                     "object": "htpl",
+                     "values": ";".join([template_name, param_name.value, str(int(param_value))
+                     if isinstance(param_value, bool) else param_value])}
+        response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
+        return method_utils.check_if_empty_list(response)
+
+    def host_template_show(self, *, lazy=False):
+        """This method is used to list all available host templates
+
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the objects only when \
+        they are changed. Default False
+        :type lazy: bool
+
+        :return: Returns the host templates
+        :rtype: list of HostTemplate
+        """
+        data_dict = {"action": "show",
+                     "object": "htpl"}
+        response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
+        return HostTemplate.from_rows(response["result"], lazy=lazy, identity_map=self.identity_map)
+
+    def host_template_get_params(self, template_name, params):
+        """This method is used to get parameter(s) of a host template
+
+        :param template_name: Name of the host template
+        :type template_name: str
+        :param params: List of the parameters you want to receive
+        :type params: list of :ref:`class_host_param`
+
+        :return: Returns a dict with the wanted results
+        :rtype: dict
+        """
+        data_dict = {"action": "getparam",
+                     "object": "htpl",
+                     "values": ";".join([template_name, "|".join([x.value for x in params])])}
+        response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
+        return _params_result(response["result"], params)
+
+    def host_template_get_template(self, template_name):
+        """This method is used to get the parent templates of a host template
+
+        :param template_name: Name of the host template
+        :type template_name: str
+
+        :return: Returns a list of the parent templates (id, name)
+        :rtype: list of HostTemplate
+        """
+        data_dict = {"action": "gettemplate",
+                     "object": "htpl",
+                     "values": template_name}
+        response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
+        return HostTemplate.from_rows(response["result"], identity_map=self.identity_map)
+
+    def host_template_get_macro(self, template_name):
+        """This method is used to get the macros of a host template
+
+        :param template_name: Name of the host template
+        :type template_name: str
+
+        :return: Returns list of macros
+        :rtype: list of :ref:`class_macro`
+        """
+        data_dict = {"action": "getmacro",
+                     "object": "htpl",
+                     "values": template_name}
+        response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
+        return Macro.from_rows(response["result"], identity_map=self.identity_map)
+
     def acl_reload(self):
         """This method is used to reload the ACL
 
@@ -789,9 +1111,13 @@ class ApiWrapper:
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return response["result"]
 
-    def acl_action_show(self):
+    def acl_action_show(self, *, lazy=False):
         """This method is used to show the available ACL actions
 
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the objects only when \
+        they are changed. Default False
+        :type lazy: bool
+
         :return: Returns a list of ACL actions
         :rtype: list of :ref:`class_acl_action`
         """
@@ -799,10 +1125,7 @@ class ApiWrapper:
                      "object": "aclaction"}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        for acl_action in response:
-            acl_action["id_unique"] = int(acl_action["id_unique"])
-            acl_action["activate"] = bool(acl_action["activate"])
-        return [ACLAction(**x) for x in response]
+        return ACLAction.from_rows(response, lazy=lazy, identity_map=self.identity_map)
 
     def acl_action_add(self, acl_action_name, acl_action_description):
         """This method is used to add an ACL action
@@ -910,9 +1233,13 @@ class ApiWrapper:
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return method_utils.check_if_empty_list(response)
 
-    def acl_group_show(self):
+    def acl_group_show(self, *, lazy=False):
         """This method is used to retrieve information about ACL groups
 
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the objects only when \
+        they are changed. Default False
+        :type lazy: bool
+
         :return: Returns a list of ACL groups
         :rtype: list of :ref:`class_acl_group`
         """
@@ -920,10 +1247,7 @@ class ApiWrapper:
                      "object": "aclgroup"}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        for acl_group in response:
-            acl_group["id_unique"] = int(acl_group["id_unique"])
-            acl_group["activate"] = bool(acl_group["activate"])
-        return [ACLMenu(**x) for x in acl_group]
+        return ACLGroup.from_rows(response, lazy=lazy, identity_map=self.identity_map)
 
     def acl_group_add(self, acl_group_name, acl_group_alias):
         """This method is used to add an ACL group
@@ -1423,9 +1747,13 @@ class ApiWrapper:
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return method_utils.check_if_empty_list(response)
 
-    def acl_resource_show(self):
+    def acl_resource_show(self, *, lazy=False):
         """This method is used to show the available ACL resources
 
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the objects only when \
+        they are changed. Default False
+        :type lazy: bool
+
         :return: Returns a list of ACL resources
         :rtype: list of :ref:`class_acl_resource`
         """
@@ -1433,10 +1761,7 @@ class ApiWrapper:
                      "object": "aclresource"}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        for acl_resource in response:
-            acl_resource["id_unique"] = int(acl_resource["id_unique"])
-            acl_resource["activate"] = bool(acl_resource["activate"])
-        return [ACLResource(**x) for x in response]
+        return ACLResource.from_rows(response, lazy=lazy, identity_map=self.identity_map)
 
     def acl_resource_add(self, acl_resource_name, acl_resource_alias):
         """This method is used to add a new ACL resource
@@ -1524,9 +1849,13 @@ class ApiWrapper:
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return method_utils.check_if_empty_list(response)
 
-    def cent_broker_cfg_show(self):
+    def cent_broker_cfg_show(self, *, lazy=False):
         """This method is used to show the available Centreon broker cfg
 
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the objects only when \
+        they are changed. Default False
+        :type lazy: bool
+
         :return: Returns the available centreon broker cfg
         :rtype: list of :ref:`class_cent_broker_cfg`
         """
@@ -1534,9 +1863,7 @@ class ApiWrapper:
                      "object": "centbrokercfg"}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        for cent_broker_cfg in response:
-            cent_broker_cfg["id_unique"] = int(cent_broker_cfg["id_unique"])
-        return [CentBrokerCFG(**x) for x in response]
+        return CentBrokerCFG.from_rows(response, lazy=lazy, identity_map=self.identity_map)
 
     def cent_broker_cfg_add(self, cent_broker_cfg_name, cent_broker_cfg_instance):
         """This method is used to add a centreon broker cfg
@@ -1902,9 +2229,13 @@ class ApiWrapper:
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return response["result"]
 
-    def cmd_show(self):
+    def cmd_show(self, *, lazy=False):
         """This method is used to list all available commands
 
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the objects only when \
+        they are changed. Default False
+        :type lazy: bool
+
         :return: Returns the available commands
         :rtype: list of :ref:`class_cmd`
         """
@@ -1912,12 +2243,7 @@ class ApiWrapper:
                      "object": "cmd"}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        for cmd in response:
-            cmd["id_unique"] = int(cmd["id_unique"])
-            cmd["cmd_type"] = CMDType.CHECK if cmd["cmd_type"] == CMDType.CHECK.value else CMDType.DISCOVERY \
-                if cmd["cmd_type"] == CMDType.DISCOVERY.value else CMDType.MISC \
-                if cmd["cmd_type"] == CMDType.MISC.value else CMDType.NOTIFY
-        return [CMD(**x) for x in response]
+        return CMD.from_rows(response, lazy=lazy, identity_map=self.identity_map)
 
     def cmd_add(self, cmd_name, cmd_type, command_line):
         """This method is used to add a command. Generating configuration files and restarting the monitoring engine \
@@ -2007,9 +2333,13 @@ class ApiWrapper:
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return method_utils.check_if_empty_list(response)
 
-    def contact_show(self):
+    def contact_show(self, *, lazy=False):
         """This method is used to list all available contacts
 
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the objects only when \
+        they are changed. Default False
+        :type lazy: bool
+
         :return: Returns all available contacts
         :rtype: list of :ref:`class_contact`
         """
@@ -2017,12 +2347,7 @@ class ApiWrapper:
                      "object": "contact"}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        for contact in response:
-            contact["id_unique"] = int(contact["id_unique"])
-            contact["gui_access"] = bool(contact["gui_access"])
-            contact["admin"] = bool(contact["admin"])
-            contact["activate"] = bool(contact["activate"])
-        return [Contact(**x) for x in response]
+        return Contact.from_rows(response, lazy=lazy, identity_map=self.identity_map)
 
     def contact_add(self, name, alias, email, password, admin, gui_access, language, authentication_type):
         """This method is used to add a contact. Generating configuration files and restarting the monitoring engine \
@@ -2127,9 +2452,13 @@ class ApiWrapper:
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return method_utils.check_if_empty_list(response)
 
-    def contact_template_show(self):
+    def contact_template_show(self, *, lazy=False):
         """This method is used to get all available contact templates
 
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the objects only when \
+        they are changed. Default False
+        :type lazy: bool
+
         :return: Returns all available contact templates
         :rtype: list of :ref:`class_contact_template`
         """
@@ -2137,12 +2466,7 @@ class ApiWrapper:
                      "object": "contacttpl"}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        for contact_template in response:
-            contact_template["admin"] = bool(contact_template["admin"])
-            contact_template["id_unique"] = int(contact_template["id_unique"])
-            contact_template["gui_access"] = bool(contact_template["gui_access"])
-            contact_template["activate"] = bool(contact_template["activate"])
-        return [ContactTemplate(**x) for x in response]
+        return ContactTemplate.from_rows(response, lazy=lazy, identity_map=self.identity_map)
 
     def contact_template_add(self, name, alias, email, password, admin, gui_access, language, authentication_type):
         """This method is used to add a new contact template. Generating configuration files and restarting the \
@@ -2247,10 +2571,14 @@ class ApiWrapper:
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return method_utils.check_if_empty_list(response)
 
-    def contact_group_show(self):
+    def contact_group_show(self, *, lazy=False):
         """This method is used to list all available contact groups. Generating configuration files and restarting the \
         engine is required
 
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the objects only when \
+        they are changed. Default False
+        :type lazy: bool
+
         :return: Returns a list of all available contact groups
         :rtype: :ref:`class_contact_group`
         """
@@ -2258,9 +2586,7 @@ class ApiWrapper:
                      "object": "cg"}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        for contact_group in response:
-            contact_group["id_unique"] = int(contact_group["id_unique"])
-        return [ContactGroup(**x) for x in response]
+        return ContactGroup.from_rows(response, lazy=lazy, identity_map=self.identity_map)
 
     def contact_group_add(self, name, alias):
         """This method is used to add a contact group. Generating configuration files and restarting the \
@@ -2573,9 +2899,13 @@ class ApiWrapper:
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return method_utils.check_if_empty_list(response)
 
-    def service_show(self):
+    def service_show(self, *, lazy=False):
         """This method is used to list all available services
 
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the objects only when \
+        they are changed. Default False
+        :type lazy: bool
+
         :return: Returns a list of all available services
         :rtype: list of :ref:`class_service`
         """
@@ -2583,11 +2913,7 @@ class ApiWrapper:
                      "object": "service"}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        for service in response:
-            service["activate"] = bool(service["activate"])
-            service["id_unique"] = int(service["id_unique"])
-            service["host_id"] = int(service["host_id"])
-        return [Service(**x) for x in response]
+        return Service.from_rows(response, lazy=lazy)
 
     def service_add(self, host_name, service_description, service_template):
         """This method adds a new service to a host. Generating configuration files and restarting the engine is \
@@ -2650,6 +2976,25 @@ class ApiWrapper:
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return method_utils.check_if_empty_list(response)
 
+    def service_get_params(self, host_name, service_description, params):
+        """This method is used to get parameter(s) of a service
+
+        :param host_name: Name of the host
+        :type host_name: str
+        :param service_description: Description of the service
+        :type service_description: str
+        :param params: List of the parameters you want to receive
+        :type params: list of :ref:`class_service_param`
+
+        :return: Returns a dict with the wanted results
+        :rtype: dict
+        """
+        data_dict = {"action": "getparam",
+                     "object": "service",
+                     "values": ";".join([host_name, service_description, "|".join([x.value for x in params])])}
+        response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
+        return _params_result(response["result"], params)
+
     def service_add_host(self, host_name, service_description, host_names_new):
         """This method is used to tia a service to an extra host. The previous definitions will be appended. \
         Generating configuration files and restarting the engine is required
@@ -2726,7 +3071,7 @@ class ApiWrapper:
                      "values": ";".join([host_name, service_description])}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        return [Macro(**x) for x in response]
+        return Macro.from_rows(response, identity_map=self.identity_map)
 
     def service_set_macro(self, host_name, service_description, macro_name, macro_value, macro_is_password,
                           macro_description):
@@ -3197,7 +3542,7 @@ class ApiWrapper:
         """
         data_dict = {"action": "add",
                      "object": "downtime",
-                     "values": ";".join(downtime_name, downtime_description)}
+                     "values": ";".join([downtime_name, downtime_description])}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return method_utils.check_if_empty_list(response)
 
@@ -4001,9 +4346,13 @@ class ApiWrapper:
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return method_utils.check_if_empty_list(response)
 
-    def host_group_show(self):
+    def host_group_show(self, *, lazy=False):
         """This method is used to list all available hostgroups
 
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the objects only when \
+        they are changed. Default False
+        :type lazy: bool
+
         :return: Returns a list of hostgroups
         :rtype: list of :ref:`class_host_group`
         """
@@ -4011,9 +4360,7 @@ class ApiWrapper:
                      "object": "hg"}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        for hostgroup in response:
-            hostgroup["id_unique"] = int(hostgroup["id_unique"])
-        return [HostGroup(**x) for x in response]
+        return HostGroup.from_rows(response, lazy=lazy, identity_map=self.identity_map)
 
     def host_group_add(self, host_group_name, host_group_alias):
         """This method is used to add a new hostgroup. \
@@ -4076,14 +4423,17 @@ class ApiWrapper:
         :param host_group_name: Name of the hostgroup
         :type host_group_name: str
 
-        :return: Returns a list of linked members
-        :rtype: list of dict
+        :return: Returns a list of linked members (id, name). If the identity map is enabled, the members are the \
+        registered hosts
+        :rtype: Union[list of dict, list of :ref:`class_host`]
         """
         data_dict = {"action": "getmember",
                      "object": "hg",
                      "values": host_group_name}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
-        return response["result"]
+        if self.identity_map is None:
+            return response["result"]
+        return Host.from_rows(response["result"], identity_map=self.identity_map)
 
     def host_group_add_member(self, host_group_name, member_names):
         """This method is used to add members to a hostgroup. \
@@ -4297,7 +4647,7 @@ class ApiWrapper:
                      "values": ";".join([host_group_name, service_description])}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        return [Macro(**x) for x in response]
+        return Macro.from_rows(response, identity_map=self.identity_map)
 
     def host_group_service_set_macro(self, host_group_name, service_description, macro_name, macro_value,
                                      macro_is_password, macro_description):
@@ -4911,6 +5261,23 @@ class ApiWrapper:
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return method_utils.check_if_empty_list(response)
 
+    def service_template_get_params(self, template_description, params):
+        """This method is used to get parameter(s) of a service template
+
+        :param template_description: Description of the service template
+        :type template_description: str
+        :param params: List of the parameters you want to receive
+        :type params: list of :ref:`class_service_template_param`
+
+        :return: Returns a dict with the wanted results
+        :rtype: dict
+        """
+        data_dict = {"action": "getparam",
+                     "object": "stpl",
+                     "values": ";".join([template_description, "|".join([x.value for x in params])])}
+        response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
+        return _params_result(response["result"], params)
+
     def service_template_add_host_template(self, service_template_description, host_templates):
         """This method is used to link host templates to a service template. \
         Generating configuration files and restarting the engine is required
@@ -4979,7 +5346,7 @@ class ApiWrapper:
                      "values": template_description}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        return [Macro(**x) for x in response]
+        return Macro.from_rows(response, identity_map=self.identity_map)
 
     def service_template_set_macro(self, template_description, macro_name, macro_value, macro_description=None,
                                    is_password=None):
@@ -6156,13 +6523,7 @@ class ApiWrapper:
                      "values": "HOST;" + host_name}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        print(response)
-        for rt_acknowledgement in response:
-            rt_acknowledgement["sticky"] = True if rt_acknowledgement == "2" else False
-            rt_acknowledgement["id_unique"] = int(rt_acknowledgement["id_unique"])
-            rt_acknowledgement["notify_contacts"] = bool(rt_acknowledgement["notify_contacts"])
-            rt_acknowledgement["persistent_comment"] = bool(rt_acknowledgement["persistent_comment"])
-        return [RealTimeAcknowledgement(**x) for x in response]
+        return RealTimeAcknowledgement.from_rows(response, identity_map=self.identity_map)
 
     def real_time_acknowledgement_show_service(self, service_name):
         """This method is used to show all available real time acknowledgements for a service
@@ -6178,12 +6539,7 @@ class ApiWrapper:
                      "values": "SVC;" + service_name}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         response = response["result"]
-        for rt_acknowledgement in response:
-            rt_acknowledgement["sticky"] = True if rt_acknowledgement == "2" else False
-            rt_acknowledgement["id_unique"] = int(rt_acknowledgement["id_unique"])
-            rt_acknowledgement["notify_contacts"] = bool(rt_acknowledgement["notify_contacts"])
-            rt_acknowledgement["persistent_comment"] = bool(rt_acknowledgement["persistent_comment"])
-        return [RealTimeAcknowledgement(**x) for x in response]
+        return RealTimeAcknowledgement.from_rows(response, identity_map=self.identity_map)
 
     def real_time_acknowledgement_add_host(self, host_name, description, sticky, notify_contacts, persistent_comment):
         """This method is used to add a new acknowledgement for a host
@@ -6252,3 +6608,31 @@ class ApiWrapper:
                      "values": acknowledgement_name}
         response = self.network.make_request(HTTPVerb.POST, params=self.config.vars["params"], data=data_dict)
         return method_utils.check_if_empty_list(response)
+
+
+def _params_result(rows, params):
+    # getparam returns the values by parameter name
+    result = {}
+    for row in rows:
+        for param in params:
+            if param.value in row:
+                result[param] = row[param.value]
+    return result
+
+
+def _status_filter(where, status_type):
+    if where is None or isinstance(where, StatusFilter):
+        return where
+    return StatusFilter(where, service=status_type is ServiceStatus)
+
+
+def _status_result(rows, status_type, columnar, projection, status_filter):
+    if rows is None:
+        return rows
+    if status_filter is not None:
+        rows = status_filter.filter(rows)
+    if columnar:
+        return StatusTable.from_rows(rows, status_type.column_types)
+    if projection is not None:
+        return projection.records(rows)
+    return rows
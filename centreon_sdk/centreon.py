@@ -17,27 +17,50 @@ You should have received a copy of the GNU General Public License
 along with this program; if not, write to the Free Software
 Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 """
-from centreon_sdk import ACLGroupParam
 from centreon_sdk.objects.base.acl_action import ACLAction, ACLActionParam
-from centreon_sdk.objects.base.acl_group import ACLGroup
+from centreon_sdk.objects.base.acl_group import ACLGroup, ACLGroupParam
 from centreon_sdk.objects.base.acl_menu import ACLMenuParam, ACLMenu
 from centreon_sdk.objects.base.acl_resource import ACLResourceParam, ACLResource
+from centreon_sdk.objects.base.base import Base
 from centreon_sdk.objects.base.cent_broker_cfg import CentBrokerCFG, CentBrokerCFGParam
+from centreon_sdk.objects.base.cent_engine_cfg import CentEngineCFG, CentEngineCFGParam
 from centreon_sdk.objects.base.cmd import CMD, CMDParam
 from centreon_sdk.objects.base.contact import ContactParam, Contact
-from centreon_sdk.objects.base.contact_group import ContactGroupParam
+from centreon_sdk.objects.base.contact_group import ContactGroup, ContactGroupParam
 from centreon_sdk.objects.base.contact_template import ContactTemplate, ContactTemplateParam
+from centreon_sdk.objects.base.dependency import Dependency, DependencyParam
+from centreon_sdk.objects.base.downtime import Downtime, DowntimeParam
 from centreon_sdk.objects.base.host import HostParam, Host
 from centreon_sdk.api_wrapper import ApiWrapper
 from centreon_sdk.exceptions.attributes_missing import AttributesMissingError
 from centreon_sdk.exceptions.item_exsting_error import CentreonItemAlreadyExistingError
 from centreon_sdk.objects.base.host_category import HostCategory
-from centreon_sdk.objects.base.host_group import HostGroup
-from centreon_sdk.objects.base.instance import Instance
+from centreon_sdk.objects.base.host_group import HostGroup, HostGroupParam
+from centreon_sdk.objects.base.host_group_service import HostGroupService, HostGroupServiceParam
+from centreon_sdk.objects.base.host_template import HostTemplate
+from centreon_sdk.objects.base.instance import Instance, InstanceParam
+from centreon_sdk.objects.base.ldap import LDAP, LDAPParam
+from centreon_sdk.network.batch_executor import BatchExecutor
+from centreon_sdk.network.relation_sync import RelationSync, Relation
 from centreon_sdk.objects.base.real_time_acknowledgement import RealTimeAcknowledgement, RealTimeAcknowledgementParam
+from centreon_sdk.objects.base.real_time_downtime import RealTimeDowntimeHost, RealTimeDowntimeService
+from centreon_sdk.objects.base.resource_cfg import ResourceCFG, ResourceCFGParam
+from centreon_sdk.objects.base.result_set import ResultSet, RowView
 from centreon_sdk.objects.base.service import Service, ServiceParam
-from centreon_sdk.objects.base.service_category import ServiceCategory
-from centreon_sdk.objects.base.service_group import ServiceGroup
+from centreon_sdk.objects.base.service_category import ServiceCategory, ServiceCategoryParam
+from centreon_sdk.objects.base.service_group import ServiceGroup, ServiceGroupParam
+from centreon_sdk.objects.base.service_template import ServiceTemplate, ServiceTemplateParam
+from centreon_sdk.objects.base.settings import Settings, SettingsParam
+from centreon_sdk.objects.base.time_period import TimePeriod, TimePeriodParam
+from centreon_sdk.objects.base.trap import Trap, TrapParam
+from centreon_sdk.objects.base.vendor import Vendor, VendorParam
+from centreon_sdk.util import method_utils
+
+COMMIT_ORDER = (Instance, TimePeriod, CMD, Vendor, Trap, ResourceCFG, ContactTemplate, Contact, ContactGroup,
+                HostCategory, HostTemplate, HostGroup, Host, ServiceCategory, ServiceTemplate, Service, HostGroupService,
+                ServiceGroup, Dependency, Downtime, ACLMenu, ACLAction, ACLResource, ACLGroup, CentEngineCFG,
+                CentBrokerCFG, LDAP, Settings, RealTimeAcknowledgement, RealTimeDowntimeHost, RealTimeDowntimeService)
+"""Order in which the object types of a list are committed, so objects are created before they are referenced"""
 
 
 class Centreon:
@@ -51,25 +74,71 @@ class Centreon:
     :type url: str
     :param verify: Optional: You can turn off verifying the SSL certificate, Default True
     :type verify: bool
+    :param identity_map: Optional: Specify True to return the same object for every read of an entity. \
+    See :ref:`class_identity_map`. Default False
+    :type identity_map: bool
     """
 
-    def __init__(self, username, password, url, verify=True):
-        self.api = ApiWrapper(username, password, url, verify)
+    def __init__(self, username, password, url, verify=True, *, identity_map=False):
+        self.api = ApiWrapper(username, password, url, verify, identity_map=identity_map)
+        self.relations = RelationSync(self.api)
 
-    def commit(self, obj, *, overwrite=False):
+    def commit(self, obj, *, overwrite=False, max_workers=8, journal=None, transactional=False):
         """This method is used to commit any changes made to a local object.
 
-        :param obj: Object to commit
-        :param obj: Union[:ref:`class_base`, list]
+        The objects of a list are committed by type in the order of COMMIT_ORDER, objects of the same type are
+        committed concurrently. Host templates are committed after the templates of the list they inherit from.
+
+        :param obj: Object to commit. Of a :ref:`class_result_set` only the rows which were changed are committed
+        :param obj: Union[:ref:`class_base`, list, :ref:`class_result_set`]
         :param overwrite: Optional: Specify True if you want to overwrite any existing values. Default False
         :param overwrite: bool
+        :param max_workers: Optional: Maximum number of objects of a list which are committed concurrently. Default 8
+        :type max_workers: int
+        :param journal: Optional: Path of a journal file. All operations are recorded in it, so a commit which was \
+        interrupted can be resumed by running it again with the same journal file. See :ref:`class_journal`
+        :type journal: str
+        :param transactional: Optional: Specify True to undo all changes made to an object if its commit fails. \
+        The objects of a list are rolled back one by one, a single object raises the error after its rollback. \
+        See :ref:`class_transaction`. Default False
+        :type transactional: bool
+
+        :return: Returns the objects of a list that could not be committed together with their error
+        :rtype: list of tuple
         """
+        if isinstance(obj, ResultSet):
+            # Only the rows which were changed have an object to commit
+            obj = obj.changed()
+        elif isinstance(obj, RowView):
+            obj = obj.object
+
+        if journal is not None:
+            with self.api.journal(journal, keep=True) as commit_journal:
+                failed = self.commit(obj, overwrite=overwrite, max_workers=max_workers, transactional=transactional)
+            # The journal is only kept if the commit has to be resumed
+            if not failed and not commit_journal.failed:
+                commit_journal.close(remove=True)
+            return failed
+
+        if transactional:
+            with self.api.transaction(max_workers=max_workers) as transaction:
+                if isinstance(obj, list):
+                    return BatchExecutor(max_workers).run(
+                        obj, lambda x: self.__commit_transactional(transaction, x, overwrite), rank=_commit_ranks(obj))
+                return self.__commit_transactional(transaction, obj, overwrite)
+
         if isinstance(obj, list):
-            for item in obj:
-                self.commit(item, overwrite=overwrite)
+            return BatchExecutor(max_workers).run(obj, lambda x: self.commit(x, overwrite=overwrite),
+                                                  rank=_commit_ranks(obj))
 
         if isinstance(obj, Host):
             self.__commit_host(obj, overwrite)
+        elif isinstance(obj, HostTemplate):
+            self.__commit_host_template(obj, overwrite)
+        elif isinstance(obj, HostGroup):
+            self.__commit_host_group(obj, overwrite)
+        elif isinstance(obj, HostCategory):
+            self.__commit_host_category(obj, overwrite)
         elif isinstance(obj, ACLAction):
             self.__commit_acl_action(obj, overwrite)
         elif isinstance(obj, ACLGroup):
@@ -80,26 +149,82 @@ class Centreon:
             self.__commit_acl_resource(obj, overwrite)
         elif isinstance(obj, RealTimeAcknowledgement):
             self.__commit_real_time_acknowledgement(obj)
+        elif isinstance(obj, RealTimeDowntimeHost):
+            self.__commit_real_time_downtime_host(obj)
+        elif isinstance(obj, RealTimeDowntimeService):
+            self.__commit_real_time_downtime_service(obj)
         elif isinstance(obj, CentBrokerCFG):
             self.__commit_cent_broker_cfg(obj, overwrite)
+        elif isinstance(obj, CentEngineCFG):
+            self.__commit_cent_engine_cfg(obj, overwrite)
         elif isinstance(obj, CMD):
             self.__commit_cmd(obj, overwrite)
         elif isinstance(obj, Contact):
             self.__commit_contact(obj, overwrite)
         elif isinstance(obj, ContactTemplate):
             self.__commit_contact_template(obj, overwrite)
+        elif isinstance(obj, ContactGroup):
+            self.__commit_contact_group(obj, overwrite)
+        elif isinstance(obj, Service):
+            self.__commit_service(obj, overwrite)
+        elif isinstance(obj, HostGroupService):
+            self.__commit_host_group_service(obj, overwrite)
+        elif isinstance(obj, ServiceTemplate):
+            self.__commit_service_template(obj, overwrite)
+        elif isinstance(obj, ServiceGroup):
+            self.__commit_service_group(obj, overwrite)
+        elif isinstance(obj, ServiceCategory):
+            self.__commit_service_category(obj, overwrite)
+        elif isinstance(obj, TimePeriod):
+            self.__commit_time_period(obj, overwrite)
+        elif isinstance(obj, Trap):
+            self.__commit_trap(obj, overwrite)
+        elif isinstance(obj, Vendor):
+            self.__commit_vendor(obj, overwrite)
+        elif isinstance(obj, Instance):
+            self.__commit_instance(obj, overwrite)
+        elif isinstance(obj, ResourceCFG):
+            self.__commit_resource_cfg(obj, overwrite)
+        elif isinstance(obj, Dependency):
+            self.__commit_dependency(obj, overwrite)
+        elif isinstance(obj, Downtime):
+            self.__commit_downtime(obj, overwrite)
+        elif isinstance(obj, LDAP):
+            self.__commit_ldap(obj, overwrite)
+        elif isinstance(obj, Settings):
+            self.__commit_settings(obj)
+        if isinstance(obj, Base):
+            # The committed values are the ones of the server, so later reads may refresh them again
+            obj._mark_clean()
+
+    def __commit_transactional(self, transaction, obj, overwrite):
+        try:
+            with transaction.scope():
+                self.commit(obj, overwrite=overwrite)
+        except Exception:
+            # The relations were changed by the rollback, so the cached members are outdated
+            self.relations.invalidate()
+            raise
 
     def __commit_host(self, obj, overwrite):
         try:
             for param in obj.required_params:
                 if not obj.has(param):
                     raise AttributesMissingError("Required Attribute is missing: {}".format(param))
-            self.api.host_add(obj.get(HostParam.NAME),
-                              obj.get(HostParam.ALIAS),
-                              obj.get(HostParam.ADDRESS),
-                              obj.get(HostParam.TEMPLATE, default=[]),
-                              obj.get(HostParam.INSTANCE),
-                              obj.get(HostParam.HOST_GROUPS, default=[]))
+            if self.api.host_add(obj.get(HostParam.NAME),
+                                 obj.get(HostParam.ALIAS),
+                                 obj.get(HostParam.ADDRESS),
+                                 obj.get(HostParam.TEMPLATE, default=[]),
+                                 obj.get(HostParam.INSTANCE),
+                                 obj.get(HostParam.HOST_GROUPS, default=[])):
+                # The relations of a new host are known, so they don't have to be fetched before syncing
+                host_name = obj.get(HostParam.NAME)
+                self.relations.prime(Relation.HOST_TEMPLATE, host_name,
+                                     method_utils.to_list(obj.get(HostParam.TEMPLATE, default=[])))
+                self.relations.prime(Relation.HOST_HOST_GROUP, host_name,
+                                     method_utils.to_list(obj.get(HostParam.HOST_GROUPS, default=[])))
+                for relation in (Relation.HOST_CONTACT, Relation.HOST_CONTACT_GROUP, Relation.HOST_PARENT):
+                    self.relations.prime(relation, host_name, [])
 
         except CentreonItemAlreadyExistingError as err:
             if not overwrite:
@@ -118,46 +243,42 @@ class Centreon:
                         else:
                             self.api.host_set_param(obj.get(HostParam.NAME), param, obj.get(param))
             if obj.has(HostParam.TEMPLATE):
-                self.api.host_set_template(obj.get(HostParam.NAME), obj.get(HostParam.TEMPLATE))
+                self.relations.sync(Relation.HOST_TEMPLATE, obj.get(HostParam.NAME),
+                                    method_utils.to_list(obj.get(HostParam.TEMPLATE)))
             if obj.has(HostParam.HOST_GROUPS):
-                self.api.host_set_host_group(obj.get(HostParam.NAME), obj.get(HostParam.HOST_GROUPS))
+                self.relations.sync(Relation.HOST_HOST_GROUP, obj.get(HostParam.NAME),
+                                    method_utils.to_list(obj.get(HostParam.HOST_GROUPS)))
         # Set other parameters
-        for attribute in obj.__dict__:
-            if attribute is not "required_params" and attribute is not "param_class" and attribute is not "unset_params":
-                param = getattr(HostParam, attribute)
-                if param not in obj.required_params and param is not HostParam.TEMPLATE \
-                        and param is not HostParam.HOST_GROUPS:
-                    if param is HostParam.INSTANCE:
-                        self.api.host_set_instance(obj.get(HostParam.NAME), obj.get(HostParam.INSTANCE))
-                    elif param is HostParam.CONTACTS:
-                        self.api.host_set_contact(obj.get(HostParam.NAME), obj.get(HostParam.CONTACTS))
-                    elif param is HostParam.CONTACT_GROUPS:
-                        self.api.host_set_contact_group(obj.get(HostParam.NAME), obj.get(HostParam.CONTACT_GROUPS))
-                    else:
-                        self.api.host_set_param(obj.get(HostParam.NAME), param, obj.get(param))
+        for param in obj.params():
+            if param not in obj.required_params and param is not HostParam.TEMPLATE \
+                    and param is not HostParam.HOST_GROUPS:
+                if param is HostParam.INSTANCE:
+                    self.api.host_set_instance(obj.get(HostParam.NAME), obj.get(HostParam.INSTANCE))
+                elif param is HostParam.CONTACTS:
+                    self.relations.sync(Relation.HOST_CONTACT, obj.get(HostParam.NAME),
+                                        method_utils.to_list(obj.get(HostParam.CONTACTS)))
+                elif param is HostParam.CONTACT_GROUPS:
+                    self.relations.sync(Relation.HOST_CONTACT_GROUP, obj.get(HostParam.NAME),
+                                        method_utils.to_list(obj.get(HostParam.CONTACT_GROUPS)))
+                else:
+                    self.api.host_set_param(obj.get(HostParam.NAME), param, obj.get(param))
         # Unset parameters
         if overwrite:
             for param in obj.unset_params:
                 if param is HostParam.TEMPLATE:
-                    existing_templates = self.api.host_get_template(obj.get(HostParam.NAME))
-                    for template in existing_templates:
-                        self.api.host_del_template(obj.get(HostParam.NAME), template.get(HostParam.NAME))
+                    self.relations.clear(Relation.HOST_TEMPLATE, obj.get(HostParam.NAME))
                 elif param is HostParam.HOST_GROUPS:
-                    existing_host_groups = self.api.host_get_host_group(obj.get(HostParam.NAME))
-                    self.api.host_del_host_group(obj.get(HostParam.NAME), existing_host_groups)
+                    self.relations.clear(Relation.HOST_HOST_GROUP, obj.get(HostParam.NAME))
                 elif param is HostParam.CONTACTS:
-                    existing_contacts = self.api.host_get_contact(obj.get(HostParam.NAME))
-                    self.api.host_del_contact(obj.get(HostParam.NAME), existing_contacts)
+                    self.relations.clear(Relation.HOST_CONTACT, obj.get(HostParam.NAME))
                 elif param is HostParam.MACRO:
                     existing_macros = self.api.host_get_macro(obj.get(HostParam.NAME))
                     for macro in existing_macros:
                         self.api.host_del_macro(obj.get(HostParam.NAME), macro)
                 elif param is HostParam.CONTACT_GROUPS:
-                    existing_contact_groups = self.api.host_get_contact_group(obj.get(HostParam.NAME))
-                    self.api.host_del_contact_group(obj.get(HostParam.NAME), existing_contact_groups)
+                    self.relations.clear(Relation.HOST_CONTACT_GROUP, obj.get(HostParam.NAME))
                 elif param is HostParam.PARENT:
-                    existing_parents = self.api.host_get_parent(obj.get(HostParam.NAME))
-                    self.api.host_del_parent(obj.get(HostParam.NAME), existing_parents)
+                    self.relations.clear(Relation.HOST_PARENT, obj.get(HostParam.NAME))
                 else:
                     self.api.host_set_param(obj.get(HostParam.NAME), param, "")
             obj.unset_params = []
@@ -414,11 +535,9 @@ class Centreon:
 
         # Set other parameter
         cent_broker_name = obj.get(CentBrokerCFGParam.NAME)
-        for attribute in obj.__dict__:
-            if attribute is not "required_params" and attribute is not "param_class" and attribute is not "unset_params":
-                param = getattr(CentBrokerCFGParam, attribute)
-                if param not in obj.required_params:
-                    self.api.cent_broker_cfg_set_param(obj.get(CentBrokerCFGParam.NAME), param, obj.get(param))
+        for param in obj.params():
+            if param not in obj.required_params:
+                self.api.cent_broker_cfg_set_param(obj.get(CentBrokerCFGParam.NAME), param, obj.get(param))
 
         # Unset parameter
         for param in obj.unset_params:
@@ -444,11 +563,9 @@ class Centreon:
                     self.api.cmd_set_param(obj.get(CMDParam.NAME), param, obj.get(param))
         # Set other parameter
         cmd_name = obj.get(CMDParam.NAME)
-        for attribute in obj.__dict__:
-            if attribute is not "required_params" and attribute is not "param_class" and attribute is not "unset_params":
-                param = getattr(CMDParam, attribute)
-                if param not in obj.required_params:
-                    self.api.cmd_set_param(obj.get(CMDParam.NAME), param, obj.get(param))
+        for param in obj.params():
+            if param not in obj.required_params:
+                self.api.cmd_set_param(obj.get(CMDParam.NAME), param, obj.get(param))
         # Unset parameter
         for param in obj.unset_params:
             self.api.cmd_set_param(cmd_name, param, obj.get(param))
@@ -476,17 +593,15 @@ class Centreon:
                     self.api.contact_set_param(obj.get(ContactParam.NAME), param, obj.get(param))
         # Set other parameter
         contact_name = obj.get(ContactParam.ALIAS)
-        for attribute in obj.__dict__:
-            if attribute is not "required_params" and attribute is not "param_class" and attribute is not "unset_params":
-                param = getattr(ContactParam, attribute)
-                if param not in obj.required_params:
-                    if param is ContactParam.ENABLED:
-                        if obj.get(param):
-                            self.api.contact_enable(contact_name)
-                        else:
-                            self.api.contact_disable(contact_name)
+        for param in obj.params():
+            if param not in obj.required_params:
+                if param is ContactParam.ENABLED:
+                    if obj.get(param):
+                        self.api.contact_enable(contact_name)
                     else:
-                        self.api.contact_set_param(contact_name, param, obj.get(param))
+                        self.api.contact_disable(contact_name)
+                else:
+                    self.api.contact_set_param(contact_name, param, obj.get(param))
         # Unset parameter
         for param in obj.unset_params:
             if param is ContactParam.ENABLED:
@@ -518,22 +633,306 @@ class Centreon:
                     self.api.contact_template_set_param(obj.get(ContactTemplateParam.NAME), param, obj.get(param))
         # Set other parameter
         contact_template_name = obj.get(ContactTemplateParam.ALIAS)
-        for attribute in obj.__dict__:
-            if attribute is not "required_params" and attribute is not "param_class" and attribute is not "unset_params":
-                param = getattr(ContactTemplateParam, attribute)
-                if param not in obj.required_params:
-                    if param is ContactTemplateParam.ENABLED:
-                        if obj.get(param):
-                            self.api.contact_template_enable(contact_template_name)
-                        else:
-                            self.api.contact_template_disable(contact_template_name)
+        for param in obj.params():
+            if param not in obj.required_params:
+                if param is ContactTemplateParam.ENABLED:
+                    if obj.get(param):
+                        self.api.contact_template_enable(contact_template_name)
                     else:
-                        self.api.contact_template_set_param(contact_template_name, param, obj.get(param))
+                        self.api.contact_template_disable(contact_template_name)
+                else:
+                    self.api.contact_template_set_param(contact_template_name, param, obj.get(param))
         # Unset parameter
         for param in obj.unset_params:
             if param is ContactTemplateParam.ENABLED:
                 self.api.contact_enable(contact_template_name)
             else:
                 self.api.contact_template_set_param(obj.get(ContactTemplateParam.ALIAS), param, obj.get(param))
->>>>>>> dev
 
+    def __commit_base(self, obj, overwrite, add, set_param, relations=None, ignore=()):
+        # Generic commit for objects based on Base, whose required params are the arguments of the add action
+        param_class = obj.param_class
+        relations = relations or {}
+        try:
+            for param in obj.required_params:
+                if not obj.has(param):
+                    raise AttributesMissingError("Required Attribute is missing: {}".format(param))
+            if add():
+                # A new object has no relations yet, so they don't have to be fetched before syncing
+                for relation in relations.values():
+                    self.relations.prime(relation, obj.get(param_class.NAME), [])
+        except CentreonItemAlreadyExistingError as err:
+            if not overwrite:
+                print(err)
+                return
+            # Set required parameters
+            name = obj.get(param_class.NAME)
+            if isinstance(name, list):
+                set_param(name[0], param_class.NAME, name[1])
+                obj.unset(param_class.NAME)
+                obj.set(param_class.NAME, name[1])
+            for param in obj.required_params:
+                if param is not param_class.NAME:
+                    set_param(obj.get(param_class.NAME), param, obj.get(param))
+        # Set other parameters
+        name = obj.get(param_class.NAME)
+        for param in obj.params():
+            if param in obj.required_params or param in ignore:
+                continue
+            if param in relations:
+                self.relations.sync(relations[param], name, method_utils.to_list(obj.get(param)))
+            else:
+                set_param(name, param, method_utils.to_param_value(obj.get(param)))
+        # Unset parameters
+        if overwrite:
+            for param in obj.unset_params:
+                if param in ignore:
+                    continue
+                if param in relations:
+                    self.relations.clear(relations[param], name)
+                else:
+                    set_param(name, param, "")
+            obj.unset_params = []
+
+    @staticmethod
+    def __commit_plain(overwrite, add, set_param, params, required=()):
+        # Generic commit for plain objects. The required params are only set if the object exists already
+        try:
+            add()
+        except CentreonItemAlreadyExistingError as err:
+            if not overwrite:
+                print(err)
+                return
+            for param in required:
+                if param in params:
+                    set_param(param, params[param])
+        for param, value in params.items():
+            if param not in required:
+                set_param(param, value)
+
+    def __commit_host_template(self, obj, overwrite):
+        self.__commit_base(obj, overwrite,
+                           lambda: self.api.host_template_add(obj.get(HostParam.NAME), obj.get(HostParam.ALIAS)),
+                           self.api.host_template_set_param,
+                           {HostParam.TEMPLATE: Relation.HOST_TEMPLATE_TEMPLATE,
+                            HostParam.CONTACTS: Relation.HOST_TEMPLATE_CONTACT,
+                            HostParam.CONTACT_GROUPS: Relation.HOST_TEMPLATE_CONTACT_GROUP},
+                           (HostParam.INSTANCE, HostParam.HOST_GROUPS, HostParam.PARENT, HostParam.MACRO))
+
+    def __commit_host_group(self, obj, overwrite):
+        self.__commit_base(obj, overwrite,
+                           lambda: self.api.host_group_add(obj.get(HostGroupParam.NAME), obj.get(HostGroupParam.ALIAS)),
+                           self.api.host_group_set_param)
+
+    def __commit_contact_group(self, obj, overwrite):
+        self.__commit_base(obj, overwrite,
+                           lambda: self.api.contact_group_add(obj.get(ContactGroupParam.NAME),
+                                                              obj.get(ContactGroupParam.ALIAS)),
+                           self.api.contact_group_set_param,
+                           {ContactGroupParam.MEMBERS: Relation.CONTACT_GROUP_CONTACT})
+
+    def __commit_host_category(self, obj, overwrite):
+        # Host categories have no parameters that can be set after creation
+        self.__commit_plain(overwrite, lambda: self.api.host_category_add(obj.name, obj.alias), None, {})
+
+    def __commit_service(self, obj, overwrite):
+        params = _plain_params(obj, ServiceParam, ignore=("description",),
+                               aliases={"check_command_arg": ServiceParam.CHECK_COMMAND_ARGUMENTS,
+                                        "active_checks_enabled": ServiceParam.ACTIVATE_CHECKS_ENABLED})
+        self.__commit_plain(overwrite,
+                            lambda: self.api.service_add(obj.host_name, obj.description,
+                                                         params.get(ServiceParam.TEMPLATE, "")),
+                            lambda param, value: self.api.service_set_param(obj.host_name, obj.description, param,
+                                                                            value),
+                            params, (ServiceParam.TEMPLATE,))
+
+    def __commit_host_group_service(self, obj, overwrite):
+        params = _plain_params(obj, HostGroupServiceParam, ignore=("description",),
+                               aliases={"check_command_arg": HostGroupServiceParam.CHECK_COMMAND_ARGUMENTS,
+                                        "active_checks_enabled": HostGroupServiceParam.ACTIVATE_CHECKS_ENABLED})
+        self.__commit_plain(overwrite,
+                            lambda: self.api.host_group_service_add(obj.host_group_name, obj.description,
+                                                                    params.get(HostGroupServiceParam.TEMPLATE, "")),
+                            lambda param, value: self.api.host_group_service_set_param(obj.host_group_name,
+                                                                                       obj.description, param, value),
+                            params, (HostGroupServiceParam.TEMPLATE,))
+
+    def __commit_service_template(self, obj, overwrite):
+        params = _plain_params(obj, ServiceTemplateParam, ignore=("description",),
+                               aliases={"check_command_arg": ServiceTemplateParam.CHECK_COMMAND_ARGUMENTS})
+        self.__commit_plain(overwrite,
+                            lambda: self.api.service_template_add(obj.description, obj.alias,
+                                                                  params.get(ServiceTemplateParam.TEMPLATE, "")),
+                            lambda param, value: self.api.service_template_set_param(obj.description, param, value),
+                            params, (ServiceTemplateParam.ALIAS, ServiceTemplateParam.TEMPLATE))
+
+    def __commit_service_group(self, obj, overwrite):
+        self.__commit_plain(overwrite, lambda: self.api.service_group_add(obj.name, obj.alias),
+                            lambda param, value: self.api.service_group_set_param(obj.name, param, value),
+                            _plain_params(obj, ServiceGroupParam, ignore=("name",)), (ServiceGroupParam.ALIAS,))
+
+    def __commit_service_category(self, obj, overwrite):
+        self.__commit_plain(overwrite, lambda: self.api.service_category_add(obj.name, obj.description),
+                            lambda param, value: self.api.service_category_set_param(obj.name, param, value),
+                            _plain_params(obj, ServiceCategoryParam, ignore=("name",)),
+                            (ServiceCategoryParam.DESCRIPTION,))
+
+    def __commit_time_period(self, obj, overwrite):
+        self.__commit_plain(overwrite, lambda: self.api.time_period_add(obj.name, obj.alias),
+                            lambda param, value: self.api.time_period_set_param(obj.name, param, value),
+                            _plain_params(obj, TimePeriodParam, ignore=("name",)), (TimePeriodParam.ALIAS,))
+
+    def __commit_trap(self, obj, overwrite):
+        self.__commit_plain(overwrite, lambda: self.api.trap_add(obj.name, obj.oid),
+                            lambda param, value: self.api.trap_set_param(obj.name, param, value),
+                            _plain_params(obj, TrapParam, ignore=("name",), aliases={"manufacturer": TrapParam.VENDOR}),
+                            (TrapParam.OID,))
+
+    def __commit_vendor(self, obj, overwrite):
+        self.__commit_plain(overwrite, lambda: self.api.vendor_add(obj.name, obj.alias),
+                            lambda param, value: self.api.vendor_set_param(obj.name, param, value),
+                            _plain_params(obj, VendorParam, ignore=("name",)), (VendorParam.ALIAS,))
+
+    def __commit_instance(self, obj, overwrite):
+        params = _plain_params(obj, InstanceParam, ignore=("name",),
+                               aliases={"bin_scheduler": InstanceParam.NAGIOS_BIN,
+                                        "stats_bin": InstanceParam.NAGIOS_STATS_BIN})
+        self.__commit_plain(overwrite,
+                            lambda: self.api.instance_add(obj.name, obj.ip_address, str(obj.ssh_port)),
+                            lambda param, value: self.api.instance_set_param(obj.name, param, value),
+                            params, (InstanceParam.IP_ADDRESS, InstanceParam.SSH_PORT))
+
+    def __commit_resource_cfg(self, obj, overwrite):
+        # Resources can only be changed by their id, so an existing resource is only updated if the id is known
+        params = _plain_params(obj, ResourceCFGParam)
+        try:
+            self.api.resource_cfg_add(obj.name, obj.value, method_utils.to_list(obj.instance or []),
+                                      obj.comment or "")
+        except CentreonItemAlreadyExistingError as err:
+            if not overwrite or obj.id_unique is None:
+                print(err)
+                return
+            for param, value in params.items():
+                self.api.resource_cfg_set_param(obj.id_unique, param, value)
+
+    def __commit_dependency(self, obj, overwrite):
+        params = _plain_params(obj, DependencyParam, ignore=("name", "description"))
+        for param in (DependencyParam.EXECUTION_FAILURE_CRITERIA, DependencyParam.NOTIFICATION_FAILURE_CRITERIA):
+            value = getattr(obj, param.value)
+            if isinstance(value, list):
+                params[param] = ",".join(method_utils.to_param_value(x) for x in value)
+        try:
+            if obj.dependency_type is None or not obj.parent_names:
+                raise AttributesMissingError("Required Attribute is missing: dependency_type, parent_names")
+            self.api.dependency_add(obj.name, obj.description, obj.dependency_type,
+                                    method_utils.to_list(obj.parent_names))
+        except CentreonItemAlreadyExistingError as err:
+            if not overwrite:
+                print(err)
+                return
+            self.api.dependency_set_param(obj.name, DependencyParam.DESCRIPTION, obj.description)
+        for param, value in params.items():
+            self.api.dependency_set_param(obj.name, param, value)
+        if obj.child_names:
+            self.api.dependency_add_child(obj.name, method_utils.to_list(obj.child_names))
+
+    def __commit_downtime(self, obj, overwrite):
+        self.__commit_plain(overwrite, lambda: self.api.downtime_add(obj.name, obj.description),
+                            lambda param, value: self.api.downtime_set_param(obj.name, param, value),
+                            _plain_params(obj, DowntimeParam, ignore=("name",)), (DowntimeParam.DESCRIPTION,))
+        # The resources of the downtime are replaced as a whole
+        if obj.hosts is not None:
+            self.api.downtime_set_host(obj.name, method_utils.to_list(obj.hosts))
+        if obj.host_groups is not None:
+            self.api.downtime_set_host_group(obj.name, method_utils.to_list(obj.host_groups))
+        if obj.services is not None:
+            self.api.downtime_set_service(obj.name, method_utils.to_list(obj.services))
+        if obj.service_groups is not None:
+            self.api.downtime_set_service_group(obj.name, method_utils.to_list(obj.service_groups))
+
+    def __commit_cent_engine_cfg(self, obj, overwrite):
+        self.__commit_plain(overwrite,
+                            lambda: self.api.cent_engine_cfg_add(obj.name, obj.instance, obj.comment or ""),
+                            lambda param, value: self.api.cent_engine_cfg_set_param(obj.name, param, value),
+                            _plain_params(obj, CentEngineCFGParam, ignore=("name",)), (CentEngineCFGParam.COMMENT,))
+
+    def __commit_ldap(self, obj, overwrite):
+        self.__commit_plain(overwrite, lambda: self.api.ldap_add(obj.name, obj.description),
+                            lambda param, value: self.api.ldap_set_param(obj.name, param, value),
+                            _plain_params(obj, LDAPParam, ignore=("name",), aliases={"status": LDAPParam.ENABLED}),
+                            (LDAPParam.DESCRIPTION,))
+
+    def __commit_settings(self, obj):
+        params = _plain_params(obj, SettingsParam,
+                               aliases={"broker_correlation_script": SettingsParam.BROKER_CORRELATOR_SCRIPT})
+        for param, value in params.items():
+            self.api.settings_set_param(param, value)
+
+    def __commit_real_time_downtime_host(self, obj):
+        self.api.real_time_downtime_add_host(obj.host_name, obj.start_time, obj.end_time, bool(obj.fixed),
+                                             method_utils.to_param_value(obj.duration), obj.comment_data, False)
+
+    def __commit_real_time_downtime_service(self, obj):
+        self.api.real_time_downtime_add_service([",".join([obj.host_name, obj.service_name])], obj.start_time,
+                                                obj.end_time, bool(obj.fixed),
+                                                method_utils.to_param_value(obj.duration), obj.comment_data)
+
+
+def _commit_rank(obj):
+    for rank, object_type in enumerate(COMMIT_ORDER):
+        if isinstance(obj, object_type):
+            return rank
+    return len(COMMIT_ORDER)
+
+
+def _commit_ranks(objects):
+    # Host templates which inherit from a template of the same list are committed in a later stage than their parent,
+    # one stage per inheritance depth. Service templates have no parent template attribute, so they need no ordering
+    templates = {}
+    for obj in objects:
+        if isinstance(obj, HostTemplate) and obj.has(HostParam.NAME):
+            name = obj.get(HostParam.NAME)
+            templates[name[-1] if isinstance(name, list) else name] = obj
+    depths = {}
+
+    def depth(obj, stack=()):
+        if id(obj) in depths:
+            return depths[id(obj)]
+        result = 0
+        for name in _template_names(obj):
+            parent = templates.get(name)
+            if parent is not None and parent is not obj and id(parent) not in stack:
+                result = max(result, depth(parent, stack + (id(obj),)) + 1)
+        depths[id(obj)] = result
+        return result
+
+    def rank(obj):
+        return _commit_rank(obj), depth(obj) if isinstance(obj, HostTemplate) else 0
+
+    return rank
+
+
+def _template_names(obj):
+    value = obj.get(HostParam.TEMPLATE, default=[])
+    if isinstance(value, str):
+        value = value.split("|")
+    return [x for x in method_utils.to_list(value) if x]
+
+
+def _plain_params(obj, param_class, *, aliases=None, ignore=()):
+    # Maps the attributes of a plain object to the params of its setparam action. Attributes without a matching param,
+    # like ids or realtime values, are left out, as well as attributes which are not set
+    aliases = aliases or {}
+    params = {}
+    for attribute, value in method_utils.attributes(obj).items():
+        if attribute in ignore or value is None:
+            continue
+        param = aliases.get(attribute)
+        if param is None:
+            try:
+                param = param_class(attribute)
+            except ValueError:
+                param = getattr(param_class, attribute.upper(), None)
+        if param is not None:
+            params[param] = method_utils.to_param_value(value)
+    return params
@@ -0,0 +1,79 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from centreon_sdk.exceptions.request_failed import CentreonRequestFailedError
+
+
+class BatchExecutor:
+    """This class is used to run a function for many items with a bounded number of concurrent calls.
+
+    Items are grouped into stages by their rank. Stages are run one after another in ascending order, the items of a
+    stage are run concurrently. This way objects can be committed in parallel while objects they depend on are
+    committed in an earlier stage. An item whose request fails does not stop the other items, other errors are raised.
+
+    :param max_workers: Optional: Maximum number of concurrent calls. Default 8
+    :type max_workers: int
+    """
+    def __init__(self, max_workers=8):
+        self.max_workers = max_workers
+
+    def stages(self, items, rank=None):
+        """This method is used to group the items into stages
+
+        :param items: Items to group
+        :type items: list
+        :param rank: Optional: Function which returns the stage of an item. Default puts all items in one stage
+        :type rank: callable
+
+        :return: Returns the stages in the order they are run
+        :rtype: list of list
+        """
+        stages = {}
+        for item in items:
+            stages.setdefault(rank(item) if rank else 0, []).append(item)
+        return [stages[x] for x in sorted(stages)]
+
+    def run(self, items, function, *, rank=None):
+        """This method is used to call the function for every item
+
+        :param items: Items to process
+        :type items: list
+        :param function: Function which is called with a single item
+        :type function: callable
+        :param rank: Optional: Function which returns the stage of an item. Default puts all items in one stage
+        :type rank: callable
+
+        :return: Returns the items whose request failed together with their error
+        :rtype: list of tuple
+        """
+        failed = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for stage in self.stages(items, rank):
+                futures = [(item, executor.submit(function, item)) for item in stage]
+                for item, future in futures:
+                    error = future.exception()
+                    if isinstance(error, (CentreonRequestFailedError, requests.RequestException)):
+                        failed.append((item, error))
+                    elif error is not None:
+                        raise error
+        return failed
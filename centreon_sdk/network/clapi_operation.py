@@ -0,0 +1,161 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import enum
+
+
+class OperationKind(enum.Enum):
+    """This class represents the effect a CLAPI operation has on its target"""
+    READ = 1
+    """Operation does not change anything, e.g. show, getparam"""
+    CREATE = 2
+    """Operation creates the target, e.g. add"""
+    DELETE = 3
+    """Operation deletes the target, e.g. del"""
+    PARAM = 4
+    """Operation overwrites a single attribute of the target, e.g. setparam, setmacro, enable"""
+    RELATION_ADD = 5
+    """Operation adds members to a relation of the target, e.g. addhostgroup"""
+    RELATION_DEL = 6
+    """Operation removes members from a relation of the target, e.g. delhostgroup"""
+    RELATION_SET = 7
+    """Operation replaces all members of a relation of the target, e.g. sethostgroup"""
+    OTHER = 8
+    """Operation with unknown side effects on its target, e.g. applytpl, grant"""
+    GLOBAL = 9
+    """Operation without a target which affects the whole configuration, e.g. applycfg, reload"""
+
+
+RELATION_KINDS = (OperationKind.RELATION_ADD, OperationKind.RELATION_DEL, OperationKind.RELATION_SET)
+
+TARGET_WIDTHS = {"service": 2,
+                 "hgservice": 2,
+                 "settings": 0}
+"""Number of leading values which identify the target of an operation, if it differs from 1"""
+
+GLOBAL_OBJECTS = ("acl",)
+REALTIME_OBJECTS = ("rtdowntime", "rtacknowledgement")
+READ_ACTION_PREFIXES = ("show", "get", "list")
+STATE_ACTIONS = ("enable", "disable")
+MACRO_ACTIONS = ("setmacro", "delmacro")
+RELATION_ACTION_KINDS = {"add": OperationKind.RELATION_ADD,
+                         "del": OperationKind.RELATION_DEL,
+                         "set": OperationKind.RELATION_SET}
+
+
+class ClapiOperation:
+    """This class represents a single call to the CLAPI endpoint
+
+    :param object_name: Name of the CLAPI object, e.g. "host". None for operations without an object
+    :type object_name: str
+    :param action: Name of the CLAPI action, e.g. "setparam"
+    :type action: str
+    :param values: Optional: Values of the operation, which are sent separated by ";"
+    :type values: list of str
+    """
+    def __init__(self, object_name, action, values=None):
+        self.object_name = object_name
+        self.action = action
+        self.values = list(values) if values else []
+        self.kind, self.attribute = self.__classify()
+
+    @classmethod
+    def from_data_dict(cls, data_dict):
+        """This method is used to create an operation from the data dict of a CLAPI request
+
+        :param data_dict: Data dict of the request
+        :type data_dict: dict
+
+        :return: Returns the operation
+        :rtype: :ref:`class_clapi_operation`
+        """
+        values = data_dict.get("values")
+        return cls(data_dict.get("object"), data_dict["action"], values.split(";") if values is not None else None)
+
+    def to_data_dict(self):
+        """This method is used to build the data dict of the CLAPI request of this operation
+
+        :return: Returns the data dict
+        :rtype: dict
+        """
+        data_dict = {"action": self.action}
+        if self.object_name is not None:
+            data_dict["object"] = self.object_name
+        if self.values:
+            data_dict["values"] = ";".join(self.values)
+        return data_dict
+
+    @property
+    def width(self):
+        """Number of leading values which identify the target"""
+        return TARGET_WIDTHS.get(self.object_name, 1)
+
+    @property
+    def target(self):
+        """Tuple of the object name and the values identifying the target, None for global operations"""
+        if self.kind is OperationKind.GLOBAL:
+            return None
+        return (self.object_name,) + tuple(self.values[:self.width])
+
+    @property
+    def members(self):
+        """Members of a relation operation"""
+        if self.kind not in RELATION_KINDS or not self.values[self.width]:
+            return []
+        return self.values[self.width].split("|")
+
+    def with_members(self, members):
+        """This method is used to get a copy of a relation operation with other members
+
+        :param members: Members of the new operation
+        :type members: list of str
+
+        :return: Returns the new operation
+        :rtype: :ref:`class_clapi_operation`
+        """
+        return ClapiOperation(self.object_name, self.action, self.values[:self.width] + ["|".join(members)])
+
+    def __classify(self):
+        action = self.action.lower()
+        width = self.width
+        if self.object_name is None or self.object_name in GLOBAL_OBJECTS:
+            return OperationKind.GLOBAL, None
+        if action.startswith(READ_ACTION_PREFIXES):
+            return OperationKind.READ, None
+        if self.object_name in REALTIME_OBJECTS:
+            return OperationKind.OTHER, None
+        if action == "add":
+            return OperationKind.CREATE, None
+        if action == "del" and len(self.values) == width:
+            return OperationKind.DELETE, None
+        if action == "setparam" and len(self.values) == width + 2:
+            # Renaming changes the target of all following operations
+            if self.values[width] == "name":
+                return OperationKind.OTHER, None
+            return OperationKind.PARAM, ("param", self.values[width])
+        if action in STATE_ACTIONS and len(self.values) == width:
+            return OperationKind.PARAM, ("state",)
+        if action in MACRO_ACTIONS and len(self.values) > width:
+            return OperationKind.PARAM, ("macro", self.values[width])
+        if action[:3] in RELATION_ACTION_KINDS and len(action) > 3 and len(self.values) == width + 1:
+            return RELATION_ACTION_KINDS[action[:3]], action[3:]
+        return OperationKind.OTHER, None
+
+    def __repr__(self):
+        return "{} {} {}".format(self.object_name, self.action, ";".join(self.values))
@@ -0,0 +1,315 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import re
+import threading
+
+from centreon_sdk.objects.base.cmd import CMDParam
+from centreon_sdk.objects.base.host import HostParam
+from centreon_sdk.objects.base.service import ServiceParam
+from centreon_sdk.network.template_resolver import TemplateResolver
+
+MACRO = re.compile(r"\$([A-Za-z0-9_:]*)\$")
+"""Regular expression matching a macro, $$ is an escaped dollar sign"""
+
+_USER = re.compile(r"USER[0-9]+")
+_ARG = re.compile(r"ARG([0-9]+)")
+_HOST = "host"
+_SERVICE = "service"
+_ARGUMENT = "argument"
+
+
+class CommandRenderer:
+    """This class is used to render the command lines the monitoring engine would execute for hosts and services,
+    without deploying the configuration.
+
+    The command lines of :meth:`~centreon_sdk.api_wrapper.ApiWrapper.cmd_show` are compiled once when they are
+    loaded: they are split into literal text and macros, and the $USERn$ macros of
+    :meth:`~centreon_sdk.api_wrapper.ApiWrapper.resource_cfg_show` are substituted right away. For every host the
+    compiled command is then bound to the host macros ($HOSTNAME$, $HOSTADDRESS$, $HOSTALIAS$ and $_HOSTxxx$), and
+    this partial expansion is shared by all services of the host which use the same command. Rendering a service
+    only fills in the remaining $ARGn$ and service macros. The arguments are compiled once per distinct value, they
+    may contain macros themselves.
+
+    The check commands, arguments and macros are inherited through the templates by a :ref:`class_template_resolver`.
+    Unknown macros are kept as they are, so they are visible in the rendered command line.
+
+    :param api: Api wrapper to use
+    :type api: :ref:`class_api_wrapper`
+    :param resolver: Optional: Resolver of the templates to use. Default a new resolver using the api
+    :type resolver: :ref:`class_template_resolver`
+    """
+
+    def __init__(self, api, *, resolver=None):
+        self.api = api
+        self.resolver = TemplateResolver(api) if resolver is None else resolver
+        self.commands = {}
+        self.resources = {}
+        self.hosts = {}
+        self.__compiled = {}
+        self.__bound = {}
+        self.__host_values = {}
+        self.__arguments = {}
+        self.__lock = threading.RLock()
+
+    def load(self, host_names=None, services=None):
+        """This method is used to request the commands, the resource variables, the hosts and the configuration of
+        the hosts and services with their templates
+
+        :param host_names: Optional: Names of the hosts. Default all hosts
+        :type host_names: Iterable[str]
+        :param services: Optional: (host name, service description) of the services. Default all services
+        :type services: Iterable[tuple]
+
+        :return: Returns the objects whose configuration could not be requested together with their error
+        :rtype: dict
+        """
+        commands = {x.get(CMDParam.NAME): x.get(CMDParam.LINE) or "" for x in self.api.cmd_show()}
+        resources = {x.name.strip("$").upper(): x.value for x in self.api.resource_cfg_show() if x.activate}
+        hosts = {x.get(HostParam.NAME): x for x in self.api.host_show()}
+        if host_names is None:
+            host_names = list(hosts)
+        failed = self.resolver.load(host_names, services)
+        with self.__lock:
+            self.commands = commands
+            self.resources = resources
+            self.hosts = hosts
+            self.__compiled = {name: _compile(line, resources) for name, line in commands.items()}
+            self.__bound = {}
+            self.__host_values = {}
+            self.__arguments = {}
+        return failed
+
+    def invalidate(self):
+        """This method is used to forget the cached expansions, e.g. after the configuration was changed"""
+        with self.__lock:
+            self.resolver.invalidate()
+            self.__compiled = {name: _compile(line, self.resources) for name, line in self.commands.items()}
+            self.__bound = {}
+            self.__host_values = {}
+            self.__arguments = {}
+
+    def host(self, host_name):
+        """This method is used to render the check command of a host
+
+        :param host_name: Name of the host
+        :type host_name: str
+
+        :return: Returns the command line or None if the host has no known check command
+        :rtype: str
+        """
+        effective = self.resolver.host(host_name)
+        command = effective.params.get(HostParam.CHECK_COMMAND)
+        if command not in self.__compiled:
+            return None
+        parts = self.__bind(command, host_name)
+        return self.__render(parts, effective.params.get(HostParam.CHECK_COMMAND_ARGUMENTS), host_name, {})
+
+    def service(self, host_name, service_description):
+        """This method is used to render the check command of a service
+
+        :param host_name: Name of the host
+        :type host_name: str
+        :param service_description: Description of the service
+        :type service_description: str
+
+        :return: Returns the command line or None if the service has no known check command
+        :rtype: str
+        """
+        effective = self.resolver.service(host_name, service_description)
+        command = effective.params.get(ServiceParam.CHECK_COMMAND)
+        if command not in self.__compiled:
+            return None
+        parts = self.__bind(command, host_name)
+        service = {"_SERVICE" + name: value for name, value in _custom(effective.macros, "_SERVICE")}
+        service["SERVICEDESC"] = service_description
+        return self.__render(parts, effective.params.get(ServiceParam.CHECK_COMMAND_ARGUMENTS), host_name, service)
+
+    def render_all(self):
+        """This method is used to render the check commands of all loaded hosts and services
+
+        :return: Returns the command lines by host name and by (host name, service description). Hosts and services \
+        without a known check command are left out
+        :rtype: tuple
+        """
+        hosts = {}
+        for name in self.resolver.hosts:
+            line = self.host(name)
+            if line is not None:
+                hosts[name] = line
+        services = {}
+        for key in self.resolver.services:
+            line = self.service(*key)
+            if line is not None:
+                services[key] = line
+        return hosts, services
+
+    def __bind(self, command, host_name):
+        # The expansion up to the host macros is shared by all services of the host using the command
+        key = (command, host_name)
+        parts = self.__bound.get(key)
+        if parts is None:
+            parts = _bind(self.__compiled[command], _HOST, self.__host(host_name))
+            self.__bound[key] = parts
+        return parts
+
+    def __host(self, host_name):
+        values = self.__host_values.get(host_name)
+        if values is not None:
+            return values
+        values = {"_HOST" + name: value for name, value in _custom(self.resolver.host(host_name).macros, "_HOST")}
+        values["HOSTNAME"] = host_name
+        host = self.hosts.get(host_name)
+        if host is not None:
+            values["HOSTADDRESS"] = host.get(HostParam.ADDRESS)
+            values["HOSTALIAS"] = host.get(HostParam.ALIAS)
+        self.__host_values[host_name] = values
+        return values
+
+    def __render(self, parts, arguments, host_name, service):
+        arguments = _split_arguments(arguments)
+        result = []
+        for part in parts:
+            if part.__class__ is str:
+                result.append(part)
+                continue
+            scope, name, text = part
+            if scope is _ARGUMENT:
+                if name > len(arguments):
+                    continue
+                argument = self.__argument(arguments[name - 1])
+                if argument.__class__ is str:
+                    result.append(argument)
+                else:
+                    # Arguments using host or service macros are bound for every host and service
+                    argument = _bind(_bind(argument, _HOST, self.__host(host_name)), _SERVICE, service)
+                    result.extend(x if x.__class__ is str else x[2] for x in argument)
+            elif scope is _SERVICE:
+                value = service.get(name)
+                result.append(text if value is None else value)
+            else:
+                result.append(text)
+        return "".join(result)
+
+    def __argument(self, argument):
+        compiled = self.__arguments.get(argument)
+        if compiled is None:
+            parts = _compile(argument, self.resources, arguments=False)
+            compiled = parts[0] if len(parts) == 1 and parts[0].__class__ is str else "" if not parts else parts
+            self.__arguments[argument] = compiled
+        return compiled
+
+
+def diff(before, after):
+    """This function is used to compare two renderings of command lines, e.g. the results of \
+    :meth:`CommandRenderer.render_all` before and after a change of the configuration
+
+    :param before: Command lines by key of the first rendering
+    :type before: dict
+    :param after: Command lines by key of the second rendering
+    :type after: dict
+
+    :return: Returns (old command line, new command line) by key for all changed keys. The old or the new command \
+    line is None if the key was added or removed
+    :rtype: dict
+    """
+    changes = {}
+    for key, line in before.items():
+        other = after.get(key)
+        if other != line:
+            changes[key] = (line, other)
+    for key in after.keys() - before.keys():
+        changes[key] = (None, after[key])
+    return changes
+
+
+def _compile(line, resources, arguments=True):
+    # A compiled command is a list of literal strings and (scope, name, original text) macros,
+    # adjacent literals are merged
+    parts = []
+    position = 0
+    for match in MACRO.finditer(line):
+        literal = line[position:match.start()]
+        position = match.end()
+        name = match.group(1).upper()
+        if not name:
+            literal += "$"
+            macro = None
+        elif _USER.fullmatch(name) and name in resources:
+            literal += resources[name]
+            macro = None
+        else:
+            macro = _macro(name, match.group(0), arguments)
+            if macro is None:
+                literal += match.group(0)
+        _append(parts, literal)
+        if macro is not None:
+            parts.append(macro)
+    _append(parts, line[position:])
+    return parts
+
+
+def _macro(name, text, arguments):
+    argument = _ARG.fullmatch(name)
+    if argument is not None:
+        return (_ARGUMENT, int(argument.group(1)), text) if arguments else None
+    if name in ("HOSTNAME", "HOSTADDRESS", "HOSTALIAS") or name.startswith("_HOST"):
+        return _HOST, name, text
+    if name == "SERVICEDESC" or name.startswith("_SERVICE"):
+        return _SERVICE, name, text
+    return None
+
+
+def _bind(parts, scope, values):
+    bound = []
+    for part in parts:
+        if part.__class__ is not str and part[0] is scope:
+            value = values.get(part[1])
+            part = part[2] if value is None else value
+        if part.__class__ is str:
+            _append(bound, part)
+        else:
+            bound.append(part)
+    return bound
+
+
+def _append(parts, literal):
+    if not literal:
+        return
+    if parts and parts[-1].__class__ is str:
+        parts[-1] += literal
+    else:
+        parts.append(literal)
+
+
+def _split_arguments(arguments):
+    # Centreon stores the arguments as "!first!second"
+    if not arguments:
+        return ()
+    if arguments.startswith("!"):
+        arguments = arguments[1:]
+    return arguments.split("!")
+
+
+def _custom(macros, prefix):
+    for name, value in macros.items():
+        name = name.strip("$").upper()
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+        yield name, value
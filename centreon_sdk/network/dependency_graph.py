@@ -0,0 +1,269 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from centreon_sdk.exceptions.request_failed import CentreonRequestFailedError
+from centreon_sdk.objects.base.dependency import DependencyType
+from centreon_sdk.objects.base.host import HostParam
+from centreon_sdk.objects.base.host_group import HostGroupParam
+from centreon_sdk.util import method_utils
+
+#: States of a failure criteria letter, for parents which are hosts and for parents which are services
+HOST_CRITERIA = {"o": 0, "d": 1, "u": 2, "p": 4}
+SERVICE_CRITERIA = {"o": 0, "w": 1, "c": 2, "u": 3, "p": 4}
+
+_KINDS = {"HG": DependencyType.HOST_GROUP, "HOSTGROUP": DependencyType.HOST_GROUP,
+          "SG": DependencyType.SERVICE_GROUP, "SERVICEGROUP": DependencyType.SERVICE_GROUP}
+
+
+class DependencyGraph:
+    """This class represents the dependencies between hosts and services.
+
+    The definitions of all dependencies are requested in parallel, the host groups and service groups of host group
+    and service group dependencies are resolved to their members. As the rows of dependency_show have no type, a
+    dependency without :attr:`dependency_type` is taken as a group dependency if all of its names are groups of one
+    kind. Every child is indexed with its parents, the states of the parents which fail the dependency and
+    whether the dependency inherits the dependencies of the parent. Keys are host names or (host name, service
+    description).
+
+    :meth:`analyze` joins the graph with the realtime status: a problem is derived if a parent it depends on is in a
+    failing state, otherwise it is a root cause. Only the hosts and services with a problem are looked at, so the
+    analysis can run on every poll.
+
+    :param api: Api wrapper to use
+    :type api: :ref:`class_api_wrapper`
+    :param max_workers: Optional: Maximum number of concurrent requests. Default 8
+    :type max_workers: int
+    :param criteria: Optional: Failure criteria to use, "notification" or "execution". Default "notification"
+    :type criteria: str
+    :param services_depend_on_host: Optional: Specify False to not derive the problems of services from a problem of \
+    their host. Default True
+    :type services_depend_on_host: bool
+    """
+
+    def __init__(self, api, *, max_workers=8, criteria="notification", services_depend_on_host=True):
+        if criteria not in ("notification", "execution"):
+            raise ValueError("The criteria must be notification or execution")
+        self.api = api
+        self.max_workers = max_workers
+        self.criteria = criteria
+        self.services_depend_on_host = services_depend_on_host
+        self.parents = {}
+        self.failed = {}
+        self.__host_groups = None
+        self.__service_groups = None
+        self.__lock = threading.Lock()
+
+    def load(self):
+        """This method is used to request all dependencies and build the graph
+
+        :return: Returns the dependencies whose definitions could not be requested together with their error
+        :rtype: dict
+        """
+        dependencies = self.api.dependency_show()
+        host_groups = {x.get(HostGroupParam.NAME) for x in self.api.host_group_show()}
+        service_groups = {x.name for x in self.api.service_group_show()}
+        failed = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [(x, executor.submit(self.api.dependency_list_dependencies, x.name)) for x in dependencies]
+            definitions = []
+            for dependency, future in futures:
+                error = future.exception()
+                if error is not None:
+                    failed[dependency.name] = error
+                else:
+                    definitions.append((dependency, future.result()))
+            # Only the names of host group and service group dependencies are groups, the names of host and
+            # service dependencies are hosts and services, even if a group has the same name
+            kinds = [_kind(dependency, rows, host_groups, service_groups) for dependency, rows in definitions]
+            used = {kind: set() for kind in (DependencyType.HOST_GROUP, DependencyType.SERVICE_GROUP)}
+            for kind, (_, rows) in zip(kinds, definitions):
+                if kind in used:
+                    used[kind].update(name for row in rows for name in _names(row, "parents") + _names(row, "children"))
+            host_group_futures = {name: executor.submit(self.api.host_group_get_member, name)
+                                  for name in used[DependencyType.HOST_GROUP]}
+            service_group_futures = {name: executor.submit(self.api.service_group_get_service, name)
+                                     for name in used[DependencyType.SERVICE_GROUP]}
+            members = {DependencyType.HOST_GROUP: {}, DependencyType.SERVICE_GROUP: {}}
+            for name, future in host_group_futures.items():
+                members[DependencyType.HOST_GROUP][name] = [x["name"] if isinstance(x, dict) else x.get(HostParam.NAME)
+                                                            for x in future.result()]
+            for name, future in service_group_futures.items():
+                members[DependencyType.SERVICE_GROUP][name] = [_service_key(x) for x in future.result()]
+
+        parents = {}
+        for kind, (dependency, rows) in zip(kinds, definitions):
+            criteria = getattr(dependency, self.criteria + "_failure_criteria")
+            inherits = dependency.inherits_parent is not None and method_utils.to_bool(dependency.inherits_parent)
+            group_members = members.get(kind, {})
+            for row in rows:
+                parent_keys = _resolve(_names(row, "parents"), group_members)
+                for child in _resolve(_names(row, "children"), group_members):
+                    edges = parents.setdefault(child, [])
+                    for parent in parent_keys:
+                        edges.append((parent, _states(criteria, isinstance(parent, tuple)), inherits))
+        with self.__lock:
+            self.parents = parents
+            self.failed = failed
+        return failed
+
+    def depends_on(self, key):
+        """This method is used to get the direct parents of a host or service
+
+        :param key: Host name or (host name, service description)
+        :type key: Union[str, tuple]
+
+        :return: Returns the parents
+        :rtype: list
+        """
+        parents = [x[0] for x in self.parents.get(key, ())]
+        if self.services_depend_on_host and isinstance(key, tuple):
+            parents.append(key[0])
+        return parents
+
+    def analyze(self, host_states=None, service_states=None):
+        """This method is used to find the root causes of the current problems and the problems derived from them
+
+        :param host_states: Optional: State by host name. Default the states of the realtime endpoint
+        :type host_states: dict
+        :param service_states: Optional: State by (host name, service description). Default the states of the \
+        realtime endpoint
+        :type service_states: dict
+
+        :return: Returns the root causes and the derived problems with the parent they depend on
+        :rtype: tuple
+        """
+        if host_states is None:
+            rows = self.api.host_status_get(fields="name,state")
+            if rows is None:
+                raise CentreonRequestFailedError("The host status could not be requested")
+            host_states = {row["name"]: int(row["state"]) for row in rows}
+        if service_states is None:
+            rows = self.api.service_status_get(fields="name,description,state")
+            if rows is None:
+                raise CentreonRequestFailedError("The service status could not be requested")
+            service_states = {(row["name"], row["description"]): int(row["state"]) for row in rows}
+
+        def state(key):
+            return (service_states if isinstance(key, tuple) else host_states).get(key, 0)
+
+        blocked = {}
+
+        def blocking_parent(key, visiting):
+            # Returns the parent which fails a dependency of the key, memoized as inherited dependencies look at
+            # the same parents again
+            if key in blocked:
+                return blocked[key]
+            visiting.add(key)
+            result = None
+            if self.services_depend_on_host and isinstance(key, tuple) and host_states.get(key[0], 0) != 0:
+                result = key[0]
+            for parent, failing, inherits in self.parents.get(key, ()) if result is None else ():
+                if state(parent) in failing:
+                    result = parent
+                    break
+                if inherits and parent not in visiting:
+                    # An inherited dependency is failed by the parent of the parent, which is the cause
+                    result = blocking_parent(parent, visiting)
+                    if result is not None:
+                        break
+            visiting.discard(key)
+            blocked[key] = result
+            return result
+
+        causes = set()
+        derived = {}
+        with self.__lock:
+            for states in (host_states, service_states):
+                for key, value in states.items():
+                    if value == 0:
+                        continue
+                    parent = blocking_parent(key, set())
+                    if parent is None:
+                        causes.add(key)
+                    else:
+                        derived[key] = parent
+        return causes, derived
+
+    def root_cause(self, key, derived):
+        """This method is used to follow the derived problems to their root cause
+
+        :param key: Host name or (host name, service description)
+        :type key: Union[str, tuple]
+        :param derived: Derived problems returned by :meth:`analyze`
+        :type derived: dict
+
+        :return: Returns the root cause, the key itself if it is not derived
+        :rtype: Union[str, tuple]
+        """
+        seen = {key}
+        while key in derived and derived[key] not in seen:
+            key = derived[key]
+            seen.add(key)
+        return key
+
+
+def _names(row, field):
+    value = row.get(field) or ()
+    if isinstance(value, str):
+        value = value.split("|")
+    return [x for x in value if x]
+
+
+def _service_key(row):
+    return (row.get("host name", row.get("host_name")), row.get("service description", row.get("service_description")))
+
+
+def _kind(dependency, rows, host_groups, service_groups):
+    kind = dependency.dependency_type
+    if kind is not None:
+        kind = getattr(kind, "value", kind)
+        return _KINDS.get(str(kind).upper(), DependencyType.HOST)
+    # The type is not part of the rows of dependency_show, a dependency whose names are all groups of one kind is
+    # taken as a dependency of that kind
+    names = {name for row in rows for name in _names(row, "parents") + _names(row, "children")}
+    if names and names <= host_groups:
+        return DependencyType.HOST_GROUP
+    if names and names <= service_groups:
+        return DependencyType.SERVICE_GROUP
+    return DependencyType.HOST
+
+
+def _resolve(names, members):
+    keys = []
+    for name in names:
+        if name in members:
+            keys.extend(members[name])
+        elif "," in name:
+            keys.append(tuple(name.split(",", 1)))
+        else:
+            keys.append(name)
+    return keys
+
+
+def _states(criteria, service):
+    # Failure criteria are letters separated by commas, "n" means the dependency never fails
+    if isinstance(criteria, (list, tuple)):
+        letters = [x.value if hasattr(x, "value") else x for x in criteria]
+    else:
+        letters = str(criteria or "").replace(" ", "").split(",")
+    mapping = SERVICE_CRITERIA if service else HOST_CRITERIA
+    return frozenset(mapping[x] for x in letters if x in mapping)
@@ -0,0 +1,106 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+
+#: Fields with few distinct values which repeat across the rows of large results, like the name of the host of every
+#: service. Names, descriptions and arguments are mostly unique, so they are not shared
+DEFAULT_FIELDS = ("host_name", "template", "instance", "instance_name", "check_command", "state", "state_type",
+                  "criticality", "activate", "acknowledged", "active_checks_enabled", "passive_checks_enabled",
+                  "max_check_attempts", "normal_check_interval", "retry_check_interval")
+
+
+class InternTable:
+    """This class is used to share equal strings of decoded responses.
+
+    Every value of one of the fields is replaced by the first equal string the table has seen, so a string which is
+    repeated in hundreds of thousands of rows is only stored once. Shared strings are also compared by identity first.
+    The table lives as long as the network it belongs to. It is cleared when it holds more than max_size strings, so a
+    long running process does not keep every string it has ever seen, and it can be cleared at any time.
+
+    :param fields: Optional: Names of the fields whose values are shared. Default DEFAULT_FIELDS
+    :type fields: Iterable[str]
+    :param max_size: Optional: Number of strings after which the table is cleared. Default 65536
+    :type max_size: int
+    """
+
+    def __init__(self, fields=DEFAULT_FIELDS, max_size=65536):
+        self.fields = frozenset(fields)
+        self.max_size = max_size
+        self.__strings = {}
+
+    def __len__(self):
+        return len(self.__strings)
+
+    def intern(self, value):
+        """This method is used to get the shared string which is equal to a value
+
+        :param value: Value to share
+        :type value: str
+
+        :return: Returns the shared string
+        :rtype: str
+        """
+        strings = self.__strings
+        if len(strings) >= self.max_size:
+            strings.clear()
+        return strings.setdefault(value, value)
+
+    def intern_row(self, row):
+        """This method is used to share the string values of the fields of a row. The row is changed in place
+
+        :param row: Decoded row
+        :type row: dict
+
+        :return: Returns the row
+        :rtype: dict
+        """
+        strings = self.__strings
+        if len(strings) >= self.max_size:
+            strings.clear()
+        for key in self.fields.intersection(row):
+            value = row[key]
+            if value.__class__ is str:
+                row[key] = strings.setdefault(value, value)
+        return row
+
+    def pairs_hook(self, rename=None):
+        """This method is used to get an object_pairs_hook for :func:`json.loads`, which creates every row with the
+        values of the fields already shared. This is faster than sharing them after the row was created
+
+        :param rename: Optional: New names of keys, the fields are matched by the new names
+        :type rename: dict
+
+        :return: Returns the hook
+        :rtype: callable
+        """
+        rename = rename or {}
+        fields = self.fields | {key for key, name in rename.items() if name in self.fields}
+        strings = self.__strings
+        setdefault = strings.setdefault
+
+        def hook(pairs):
+            if len(strings) >= self.max_size:
+                strings.clear()
+            return {rename.get(key, key): setdefault(value, value) if key in fields and value.__class__ is str
+                    else value for key, value in pairs}
+        return hook
+
+    def clear(self):
+        """This method is used to forget all strings. Strings which are already shared stay shared"""
+        self.__strings.clear()
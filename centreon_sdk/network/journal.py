@@ -0,0 +1,194 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import collections
+import enum
+import json
+import os
+import threading
+
+from centreon_sdk.exceptions.item_exsting_error import CentreonItemAlreadyExistingError
+from centreon_sdk.network.clapi_operation import ClapiOperation, OperationKind
+from centreon_sdk.network.network import HTTPVerb
+from centreon_sdk.util import method_utils
+
+
+class JournalState(enum.Enum):
+    """This class represents the state of an operation in the journal"""
+    PLANNED = "planned"
+    """Operation is about to be sent. Without a following state it is unknown whether it was applied"""
+    DONE = "done"
+    """Operation was applied"""
+    EXISTS = "exists"
+    """Operation was rejected because the object exists already"""
+    FAILED = "failed"
+    """Operation was not applied"""
+
+
+class Journal:
+    """This class is used to record CLAPI write operations in a write-ahead journal on disk, so an interrupted bulk
+    commit can be resumed.
+
+    It offers the same *make_request* method as :ref:`object_network`, so it can be put in front of an
+    :ref:`class_api_wrapper`. Every write operation is recorded as planned before it is sent and with its outcome
+    after it was sent. If the journal file exists already, operations it records as done are not sent again but
+    answered from the journal, so rerunning the same commit continues where the last run stopped. Operations which
+    failed, or whose outcome was never recorded, are sent again.
+
+    :param path: Path of the journal file
+    :type path: str
+    :param network: Network to send the operations with
+    :type network: :ref:`object_network`
+    :param params: URL parameters of CLAPI requests
+    :type params: dict
+    :param sync: Optional: Flush every entry to disk before continuing. Default True
+    :type sync: bool
+    """
+    def __init__(self, path, network, params, *, sync=True):
+        self.path = path
+        self.network = network
+        self.params = params
+        self.sync = sync
+        self.skipped = 0
+        self.failed = []
+        self.__lock = threading.Lock()
+        self.__completed = collections.Counter()
+        self.__exists = collections.Counter()
+        self.__pending = collections.OrderedDict()
+        self.__sequence = 0
+        self.__load()
+        self.__file = open(path, "a", encoding="utf-8")
+
+    def make_request(self, verb, *, params=None, data=None, use_encode_json=True, use_header=True):
+        """This method is used to journal write requests and to pass through all other requests
+
+        :param verb: HTTP Verb to use
+        :type :ref:object_http_verb:
+        :param params: Optional: dict to get encoded in url
+        :type params: dict
+        :param data: Optional: dict to get encoded in body
+        :type data: dict
+        :param use_encode_json: Optional: Set False to do not use json serialization in data
+        :type use_encode_json: bool
+        :param use_header: Optional: Set false to do not use header
+        :type use_header: bool
+
+        :return: Returns the decoded response
+        :rtype: dict
+        """
+        if verb == HTTPVerb.POST and use_encode_json and use_header and isinstance(data, dict) and "action" in data:
+            operation = ClapiOperation.from_data_dict(data)
+            if operation.kind is not OperationKind.READ:
+                return self.execute(operation)
+        return self.network.make_request(verb, params=params, data=data, use_encode_json=use_encode_json,
+                                         use_header=use_header)
+
+    def execute(self, operation):
+        """This method is used to send a single write operation, unless the journal records it as done
+
+        :param operation: Operation to send
+        :type operation: :ref:`class_clapi_operation`
+
+        :return: Returns the decoded response
+        :rtype: dict
+        """
+        key = _key(operation)
+        with self.__lock:
+            if self.__completed[key] > 0:
+                self.__completed[key] -= 1
+                self.skipped += 1
+                return {"result": []}
+            if self.__exists[key] > 0:
+                self.__exists[key] -= 1
+                self.skipped += 1
+                raise CentreonItemAlreadyExistingError("Object already exists: {}".format(operation))
+            self.__sequence += 1
+            sequence = self.__sequence
+            self.__write(sequence, JournalState.PLANNED, operation)
+        try:
+            response = self.network.make_request(HTTPVerb.POST, params=self.params, data=operation.to_data_dict())
+        except CentreonItemAlreadyExistingError:
+            self.__record(sequence, JournalState.EXISTS, operation)
+            raise
+        except Exception:
+            self.__record(sequence, JournalState.FAILED, operation)
+            raise
+        self.__record(sequence, JournalState.DONE if method_utils.check_if_empty_list(response)
+                      else JournalState.FAILED, operation)
+        return response
+
+    def pending(self):
+        """This method is used to get the operations of the previous run whose outcome is unknown, because the run
+        stopped after they were planned
+
+        :return: Returns the operations
+        :rtype: list of :ref:`class_clapi_operation`
+        """
+        return list(self.__pending.values())
+
+    def close(self, *, remove=False):
+        """This method is used to close the journal file
+
+        :param remove: Optional: Delete the journal file, e.g. after all operations were applied. Default False
+        :type remove: bool
+        """
+        with self.__lock:
+            if not self.__file.closed:
+                self.__file.close()
+        if remove and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __record(self, sequence, state, operation):
+        with self.__lock:
+            if state is JournalState.FAILED:
+                self.failed.append(operation)
+            self.__write(sequence, state, operation)
+
+    def __write(self, sequence, state, operation):
+        self.__file.write(json.dumps({"sequence": sequence, "state": state.value,
+                                      "operation": operation.to_data_dict()}) + "\n")
+        self.__file.flush()
+        if self.sync:
+            os.fsync(self.__file.fileno())
+
+    def __load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # The last line can be incomplete if the process was killed while writing it
+                    continue
+                operation = ClapiOperation.from_data_dict(entry["operation"])
+                state = JournalState(entry["state"])
+                self.__sequence = max(self.__sequence, entry["sequence"])
+                if state is JournalState.PLANNED:
+                    self.__pending[entry["sequence"]] = operation
+                    continue
+                self.__pending.pop(entry["sequence"], None)
+                if state is JournalState.DONE:
+                    self.__completed[_key(operation)] += 1
+                elif state is JournalState.EXISTS:
+                    self.__exists[_key(operation)] += 1
+
+
+def _key(operation):
+    return json.dumps([operation.object_name, operation.action, operation.values])
@@ -22,7 +22,7 @@ import json
 import requests
 
 from centreon_sdk.exceptions.item_exsting_error import CentreonItemAlreadyExistingError
-from centreon_sdk.util import method_utils
+from centreon_sdk.network import intern_table
 
 
 class HTTPVerb(enum.Enum):
@@ -35,9 +35,13 @@ class Network:
 
     :param config: Config to use
     :type config: :ref:object_config:
+    :param intern_fields: Optional: Fields whose repeated values are shared through a :ref:`class_intern_table`, \
+    None to not share them. Default DEFAULT_FIELDS of the intern table
+    :type intern_fields: Iterable[str]
     """
-    def __init__(self, config, verify=True):
+    def __init__(self, config, verify=True, intern_fields=intern_table.DEFAULT_FIELDS):
         self.config = config
+        self.intern_table = intern_table.InternTable(intern_fields) if intern_fields is not None else None
         self.session = requests.Session()
         self.session.verify = verify
         self.replace_keys_dict = {"hg name": "host_group_name",
@@ -70,6 +74,9 @@ class Network:
                                   "macro name": "macro_name",
                                   "id": "id_unique",
                                   "type": "cmd_type"}
+        self.__intern_hook = None
+        if self.intern_table is not None:
+            self.__intern_hook = self.intern_table.pairs_hook(self.replace_keys_dict)
 
     def make_request(self, verb, *, params=None, data=None, use_encode_json=True, use_header=True):
         """This method is used to make request to the REST endpoint
@@ -99,10 +106,31 @@ class Network:
 
         if response.status_code == 409:
             raise CentreonItemAlreadyExistingError(response.text)
-        elif response.status_code is not 200:
+        elif response.status_code != 200:
             print(response.status_code, response.text)
             return
-        json_decoded = json.loads(response.text)
-        json_decoded = method_utils.replace_keys_from_dict(self.replace_keys_dict, json_decoded)
-        return json_decoded
+        return self.decode(response.text)
+
+    def decode(self, text):
+        """This method is used to decode a response. Keys are replaced by the names used in the SDK and repeated values
+        are shared through the :ref:`class_intern_table` of the network
+
+        :param text: Text of the response
+        :type text: str
+
+        :return: Returns the decoded response
+        :rtype: Union[dict, list]
+        """
+        if self.__intern_hook is not None:
+            # The keys are replaced and the values shared while the rows are created
+            return json.loads(text, object_pairs_hook=self.__intern_hook)
+        return json.loads(text, object_hook=self.__decode_object)
+
+    def __decode_object(self, obj):
+        # Called for every decoded object from the innermost, so every dict is only visited once
+        replace_keys_dict = self.replace_keys_dict
+        if not replace_keys_dict.keys().isdisjoint(obj):
+            for key in [x for x in obj if x in replace_keys_dict]:
+                obj[replace_keys_dict[key]] = obj.pop(key)
+        return obj
 
@@ -0,0 +1,244 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import enum
+import threading
+
+from centreon_sdk.exceptions.request_failed import CentreonRequestFailedError
+from centreon_sdk.network.clapi_operation import ClapiOperation
+from centreon_sdk.network.network import HTTPVerb
+from centreon_sdk.util import method_utils
+
+
+class Relation(enum.Enum):
+    """This class represents a relation that can be synchronized. The value is the CLAPI object and the suffix of
+    the get, add, del and set actions"""
+    HOST_TEMPLATE = ("host", "template")
+    HOST_PARENT = ("host", "parent")
+    HOST_CONTACT = ("host", "contact")
+    HOST_CONTACT_GROUP = ("host", "contactgroup")
+    HOST_HOST_GROUP = ("host", "hostgroup")
+    HOST_TEMPLATE_TEMPLATE = ("htpl", "template")
+    HOST_TEMPLATE_CONTACT = ("htpl", "contact")
+    HOST_TEMPLATE_CONTACT_GROUP = ("htpl", "contactgroup")
+    HOST_GROUP_MEMBER = ("hg", "member")
+    HOST_CATEGORY_MEMBER = ("hc", "member")
+    CONTACT_GROUP_CONTACT = ("cg", "contact")
+    SERVICE_HOST = ("service", "host")
+    SERVICE_CONTACT = ("service", "contact")
+    SERVICE_CONTACT_GROUP = ("service", "contactgroup")
+    SERVICE_TRAP = ("service", "trap")
+    SERVICE_GROUP_SERVICE = ("sg", "service")
+    SERVICE_GROUP_HOST_GROUP_SERVICE = ("sg", "hostgroupservice")
+    SERVICE_CATEGORY_SERVICE = ("sc", "service")
+    SERVICE_CATEGORY_SERVICE_TEMPLATE = ("sc", "servicetemplate")
+    SERVICE_TEMPLATE_HOST_TEMPLATE = ("stpl", "hosttemplate")
+    SERVICE_TEMPLATE_CONTACT = ("stpl", "contact")
+    SERVICE_TEMPLATE_CONTACT_GROUP = ("stpl", "contactgroup")
+    SERVICE_TEMPLATE_TRAP = ("stpl", "trap")
+    ACL_GROUP_CONTACT = ("aclgroup", "contact")
+    ACL_GROUP_CONTACT_GROUP = ("aclgroup", "contactgroup")
+    ACL_GROUP_MENU = ("aclgroup", "menu")
+    ACL_GROUP_ACTION = ("aclgroup", "action")
+    ACL_GROUP_RESOURCE = ("aclgroup", "resource")
+
+
+ORDERED_RELATIONS = (Relation.HOST_TEMPLATE, Relation.HOST_TEMPLATE_TEMPLATE)
+"""Relations where the order of the members matters, e.g. the priority of templates"""
+
+SINGLE_DEL_RELATIONS = (Relation.CONTACT_GROUP_CONTACT, Relation.ACL_GROUP_CONTACT,
+                        Relation.ACL_GROUP_CONTACT_GROUP, Relation.ACL_GROUP_MENU, Relation.ACL_GROUP_ACTION,
+                        Relation.ACL_GROUP_RESOURCE)
+"""Relations where CLAPI only accepts a single member per del action"""
+
+
+class RelationSync:
+    """This class is used to synchronize the members of relations with the minimal number of CLAPI calls.
+
+    The current members of a relation are fetched once and cached. Synchronizing compares them with the desired
+    members and only sends the missing members in one "|" joined add action and the surplus members in one del
+    action, instead of replacing the whole list with a set action.
+
+    :param api: Api wrapper to use
+    :type api: :ref:`class_api_wrapper`
+    """
+    def __init__(self, api):
+        self.api = api
+        self.__cache = {}
+        self.__lock = threading.RLock()
+
+    def get(self, relation, target, *, refresh=False):
+        """This method is used to get the current members of a relation. The members are fetched only once
+
+        :param relation: Relation to get
+        :type relation: :ref:`class_relation`
+        :param target: Name of the object. Services are identified by [host_name, service_description]
+        :type target: Union[str, list of str]
+        :param refresh: Optional: Set True to ignore the cached members
+        :type refresh: bool
+
+        :return: Returns the names of the members
+        :rtype: list of str
+        """
+        key = (relation, _target_values(target))
+        with self.__lock:
+            if not refresh and key in self.__cache:
+                return list(self.__cache[key])
+        response = self.__send(ClapiOperation(relation.value[0], "get" + relation.value[1], list(key[1])))
+        if not response or "result" not in response:
+            raise CentreonRequestFailedError("Could not get {} of {}".format(relation, target))
+        members = [_member_name(x) for x in response["result"]]
+        with self.__lock:
+            self.__cache[key] = members
+        return list(members)
+
+    def prime(self, relation, target, members):
+        """This method is used to put already known members in the cache, e.g. after an object was created
+
+        :param relation: Relation to prime
+        :type relation: :ref:`class_relation`
+        :param target: Name of the object
+        :type target: Union[str, list of str]
+        :param members: Current members of the relation
+        :type members: list of str
+        """
+        with self.__lock:
+            self.__cache[(relation, _target_values(target))] = list(members)
+
+    def invalidate(self, relation=None, target=None):
+        """This method is used to remove cached members
+
+        :param relation: Optional: Relation to invalidate. Default all relations
+        :type relation: :ref:`class_relation`
+        :param target: Optional: Name of the object to invalidate. Default all objects
+        :type target: Union[str, list of str]
+        """
+        values = _target_values(target) if target is not None else None
+        with self.__lock:
+            for key in list(self.__cache):
+                if (relation is None or key[0] is relation) and (values is None or key[1] == values):
+                    del self.__cache[key]
+
+    def sync(self, relation, target, members):
+        """This method is used to set the members of a relation. Only the differences to the current members are sent
+
+        :param relation: Relation to synchronize
+        :type relation: :ref:`class_relation`
+        :param target: Name of the object
+        :type target: Union[str, list of str]
+        :param members: Desired members of the relation
+        :type members: list of str
+
+        :return: Returns the operations that were sent
+        :rtype: list of :ref:`class_clapi_operation`
+        """
+        members = _unique(members)
+        current = self.get(relation, target)
+        if relation in ORDERED_RELATIONS and members != current:
+            return self.__apply(relation, target, "set", members, members)
+        operations = self.remove(relation, target, [x for x in current if x not in members])
+        operations += self.add(relation, target, [x for x in members if x not in current])
+        return operations
+
+    def add(self, relation, target, members):
+        """This method is used to add members to a relation. Members which are already linked are not sent
+
+        :param relation: Relation to add the members to
+        :type relation: :ref:`class_relation`
+        :param target: Name of the object
+        :type target: Union[str, list of str]
+        :param members: Members to add
+        :type members: list of str
+
+        :return: Returns the operations that were sent
+        :rtype: list of :ref:`class_clapi_operation`
+        """
+        current = self.get(relation, target)
+        missing = [x for x in _unique(members) if x not in current]
+        if not missing:
+            return []
+        return self.__apply(relation, target, "add", missing, current + missing)
+
+    def remove(self, relation, target, members):
+        """This method is used to remove members from a relation. Members which are not linked are not sent
+
+        :param relation: Relation to remove the members from
+        :type relation: :ref:`class_relation`
+        :param target: Name of the object
+        :type target: Union[str, list of str]
+        :param members: Members to remove
+        :type members: list of str
+
+        :return: Returns the operations that were sent
+        :rtype: list of :ref:`class_clapi_operation`
+        """
+        current = self.get(relation, target)
+        surplus = [x for x in _unique(members) if x in current]
+        if not surplus:
+            return []
+        return self.__apply(relation, target, "del", surplus, [x for x in current if x not in surplus])
+
+    def clear(self, relation, target):
+        """This method is used to remove all members from a relation
+
+        :param relation: Relation to clear
+        :type relation: :ref:`class_relation`
+        :param target: Name of the object
+        :type target: Union[str, list of str]
+
+        :return: Returns the operations that were sent
+        :rtype: list of :ref:`class_clapi_operation`
+        """
+        return self.remove(relation, target, self.get(relation, target))
+
+    def __apply(self, relation, target, prefix, members, result):
+        values = list(_target_values(target))
+        action = prefix + relation.value[1]
+        if prefix == "del" and relation in SINGLE_DEL_RELATIONS:
+            operations = [ClapiOperation(relation.value[0], action, values + [x]) for x in members]
+        else:
+            operations = [ClapiOperation(relation.value[0], action, values + ["|".join(members)])]
+        for operation in operations:
+            if not method_utils.check_if_empty_list(self.__send(operation)):
+                self.invalidate(relation, target)
+                raise CentreonRequestFailedError("Operation failed: {}".format(operation))
+        self.prime(relation, target, result)
+        return operations
+
+    def __send(self, operation):
+        return self.api.network.make_request(HTTPVerb.POST, params=self.api.config.vars["params"],
+                                             data=operation.to_data_dict())
+
+
+def _target_values(target):
+    return tuple(target) if isinstance(target, (list, tuple)) else (target,)
+
+
+def _unique(members):
+    ret = []
+    for member in members:
+        if member not in ret:
+            ret.append(member)
+    return ret
+
+
+def _member_name(row):
+    if "service description" in row:
+        return ",".join([row.get("host_name", row.get("host_group_name")), row["service description"]])
+    return row["name"]
@@ -0,0 +1,346 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import collections
+import http.server
+import math
+import socketserver
+import threading
+import time
+
+import requests
+
+from centreon_sdk.exceptions.request_failed import CentreonRequestFailedError
+from centreon_sdk.objects.base.host import HostParam
+from centreon_sdk.objects.base.host_group import HostGroupParam
+from centreon_sdk.objects.base.host_status import HostStatus
+from centreon_sdk.objects.base.service_status import ServiceStatus
+from centreon_sdk.util import perfdata
+
+HOST_STATES = {0: "up", 1: "down", 2: "unreachable", 4: "pending"}
+SERVICE_STATES = {0: "ok", 1: "warning", 2: "critical", 3: "unknown", 4: "pending"}
+
+#: Name, type and help of the metric families, in the order they are exported
+FAMILIES = (
+    ("host_state", "gauge", "State of the host: 0 up, 1 down, 2 unreachable, 4 pending"),
+    ("host_acknowledged", "gauge", "1 if the problem of the host is acknowledged"),
+    ("service_state", "gauge", "State of the service: 0 ok, 1 warning, 2 critical, 3 unknown, 4 pending"),
+    ("service_acknowledged", "gauge", "1 if the problem of the service is acknowledged"),
+    ("perfdata", "gauge", "Value of a metric of the performance data of a service"),
+    ("perfdata_min", "gauge", "Minimum of a metric of the performance data of a service"),
+    ("perfdata_max", "gauge", "Maximum of a metric of the performance data of a service"),
+    ("hosts", "gauge", "Number of hosts by poller and state"),
+    ("services", "gauge", "Number of services by poller and state"),
+    ("host_group_hosts", "gauge", "Number of hosts by host group and state"),
+)
+
+PROMETHEUS_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+class StatusExporter:
+    """This class is used to export the realtime status in the Prometheus and OpenMetrics text format.
+
+    The exporter polls the realtime endpoints with projections of the exported fields and keeps the samples of every
+    host and service. A poll only renders the samples of rows which changed and updates the counts by poller, host
+    group and state with the difference. The exposition is built once per poll, so a scrape is answered from memory
+    and never queries Centreon.
+
+    :param api: API to use
+    :type api: ApiWrapper
+    :param address: Optional: Address to listen on. Default 127.0.0.1
+    :type address: str
+    :param port: Optional: Port to listen on. Default 9585
+    :type port: int
+    :param interval: Optional: Interval between polls in seconds. Default 60
+    :type interval: float
+    :param host_where: Optional: Filter of the exported hosts. See :ref:`class_status_filter`
+    :type host_where: str
+    :param service_where: Optional: Filter of the exported services. See :ref:`class_status_filter`
+    :type service_where: str
+    :param host_groups: Optional: Specify True to count the hosts by host group. The members are requested when the \
+    exporter starts and with :meth:`load_host_groups`. Default False
+    :type host_groups: bool
+    :param with_perfdata: Optional: Specify False to not export the performance data of the services. Default True
+    :type with_perfdata: bool
+    :param prefix: Optional: Prefix of the names of the metrics. Default "centreon"
+    :type prefix: str
+    """
+    host_projection = HostStatus.project("name", "state", "acknowledged", "instance_name")
+    service_projection = ServiceStatus.project("name", "description", "state", "acknowledged", "instance_name",
+                                               "perfdata")
+
+    def __init__(self, api, *, address="127.0.0.1", port=9585, interval=60.0, host_where=None, service_where=None,
+                 host_groups=False, with_perfdata=True, prefix="centreon"):
+        self.api = api
+        self.address = address
+        self.port = port
+        self.interval = interval
+        self.host_where = host_where
+        self.service_where = service_where
+        self.host_groups = host_groups
+        self.with_perfdata = with_perfdata
+        self.prefix = prefix
+        self.polls = 0
+        self.errors = 0
+        self.last_poll = None
+        self.poll_duration = None
+        self.__groups_by_host = {}
+        self.__hosts = {}
+        self.__services = {}
+        self.__counts = collections.Counter()
+        self.__exposition = (b"", b"# EOF\n")
+        self.__lock = threading.RLock()
+        self.__stop = threading.Event()
+        self.__server = None
+        self.__threads = []
+
+    def load_host_groups(self):
+        """This method is used to request the members of the host groups, which are used to count the hosts by host
+        group"""
+        groups_by_host = {}
+        for host_group in self.api.host_group_show():
+            name = host_group.get(HostGroupParam.NAME)
+            for host in self.api.host_group_get_member(name):
+                host_name = host["name"] if isinstance(host, dict) else host.get(HostParam.NAME)
+                groups_by_host.setdefault(host_name, []).append(name)
+        with self.__lock:
+            self.__groups_by_host = groups_by_host
+            # The counts of the host groups are rebuilt from the current hosts
+            for key in [x for x in self.__counts if x[0] == "host_group_hosts"]:
+                del self.__counts[key]
+            for record in self.__hosts.values():
+                # The other counts of the hosts are unchanged
+                self.__count([x for x in self.__host_counts(record[0]) if x[0] == "host_group_hosts"], 1)
+            self.__render()
+
+    def poll(self):
+        """This method is used to request the status of all hosts and services and update the exported samples
+
+        :return: Returns True if the status could be requested
+        :rtype: bool
+        """
+        start = time.perf_counter()
+        try:
+            hosts = self.api.host_status_get(projection=self.host_projection, where=self.host_where)
+            services = self.api.service_status_get(projection=self.service_projection, where=self.service_where)
+            if hosts is None or services is None:
+                raise CentreonRequestFailedError("The status could not be requested")
+        except (CentreonRequestFailedError, requests.RequestException):
+            with self.__lock:
+                self.errors += 1
+                self.__render()
+            return False
+        with self.__lock:
+            self.polls += 1
+            self.last_poll = time.time()
+            self.poll_duration = time.perf_counter() - start
+            self.update(hosts, services)
+        return True
+
+    def update(self, hosts, services):
+        """This method is used to update the samples with the records of the realtime endpoints. Only changed records
+        are rendered again
+
+        :param hosts: Records of :attr:`host_projection`
+        :type hosts: list of collections.namedtuple
+        :param services: Records of :attr:`service_projection`
+        :type services: list of collections.namedtuple
+        """
+        with self.__lock:
+            self.__update(self.__hosts, {x.name: x for x in hosts}, self.__host_samples, self.__host_counts)
+            self.__update(self.__services, {(x.name, x.description): x for x in services}, self.__service_samples,
+                          self.__service_counts)
+            self.__render()
+
+    def __update(self, entries, records, samples, counts):
+        for key, record in records.items():
+            entry = entries.get(key)
+            # Most records did not change, they are skipped with one comparison
+            if entry is not None and entry[0] == record:
+                continue
+            if entry is not None:
+                self.__count(counts(entry[0]), -1)
+            self.__count(counts(record), 1)
+            entries[key] = (record, samples(record))
+        for key in entries.keys() - records.keys():
+            self.__count(counts(entries.pop(key)[0]), -1)
+
+    def __count(self, keys, difference):
+        for key in keys:
+            self.__counts[key] += difference
+            if not self.__counts[key]:
+                del self.__counts[key]
+
+    def __host_counts(self, record):
+        state = HOST_STATES.get(record.state, "unknown")
+        keys = [("hosts", (("instance", record.instance_name), ("state", state)))]
+        for group in self.__groups_by_host.get(record.name, ()):
+            keys.append(("host_group_hosts", (("hostgroup", group), ("state", state))))
+        return keys
+
+    @staticmethod
+    def __service_counts(record):
+        return [("services", (("instance", record.instance_name),
+                              ("state", SERVICE_STATES.get(record.state, "unknown"))))]
+
+    def __host_samples(self, record):
+        labels = _labels((("host", record.name), ("instance", record.instance_name)))
+        return {"host_state": self.__sample("host_state", labels, record.state),
+                "host_acknowledged": self.__sample("host_acknowledged", labels, record.acknowledged)}
+
+    def __service_samples(self, record):
+        labels = _labels((("host", record.name), ("service", record.description),
+                          ("instance", record.instance_name)))
+        samples = {"service_state": self.__sample("service_state", labels, record.state),
+                   "service_acknowledged": self.__sample("service_acknowledged", labels, record.acknowledged)}
+        if self.with_perfdata and record.perfdata:
+            lines = {"perfdata": [], "perfdata_min": [], "perfdata_max": []}
+            for metric in perfdata.parse(record.perfdata):
+                metric_labels = _labels((("host", record.name), ("service", record.description),
+                                         ("label", metric.label), ("unit", metric.unit or "")))
+                for family, value in (("perfdata", metric.value), ("perfdata_min", metric.min),
+                                      ("perfdata_max", metric.max)):
+                    if value is not None:
+                        lines[family].append(self.__sample(family, metric_labels, value))
+            samples.update((family, "".join(x)) for family, x in lines.items() if x)
+        return samples
+
+    def __sample(self, family, labels, value):
+        return "{}_{}{{{}}} {}\n".format(self.prefix, family, labels, _value(value))
+
+    def __render(self):
+        # The samples are joined once per poll, every scrape sends the same bytes without copying them
+        parts = []
+        for family, metric_type, description in FAMILIES:
+            name = "{}_{}".format(self.prefix, family)
+            parts.append("# HELP {} {}\n# TYPE {} {}\n".format(name, description, name, metric_type))
+            if family in ("hosts", "services", "host_group_hosts"):
+                parts.extend(self.__sample(family, _labels(labels), value)
+                             for (counted, labels), value in sorted(self.__counts.items()) if counted == family)
+            else:
+                entries = self.__hosts if family.startswith("host_") else self.__services
+                parts.extend(entry[1][family] for entry in entries.values() if family in entry[1])
+        name = "{}_exporter".format(self.prefix)
+        if self.last_poll is not None:
+            parts.append("# HELP {0}_last_poll_timestamp_seconds Time of the last successful poll\n"
+                         "# TYPE {0}_last_poll_timestamp_seconds gauge\n{0}_last_poll_timestamp_seconds {1}\n"
+                         "# HELP {0}_poll_duration_seconds Duration of the last successful poll\n"
+                         "# TYPE {0}_poll_duration_seconds gauge\n{0}_poll_duration_seconds {2}\n".format(
+                             name, _value(self.last_poll), _value(self.poll_duration)))
+        body = "".join(parts)
+        # The type of a counter is declared for the name with _total in the Prometheus format, without in OpenMetrics
+        counters = "# HELP {0}_polls{1} Number of successful polls\n# TYPE {0}_polls{1} counter\n" \
+                   "{0}_polls_total {2}\n# HELP {0}_poll_errors{1} Number of failed polls\n" \
+                   "# TYPE {0}_poll_errors{1} counter\n{0}_poll_errors_total {3}\n"
+        self.__exposition = ((body + counters.format(name, "_total", self.polls, self.errors)).encode("utf-8"),
+                             (body + counters.format(name, "", self.polls, self.errors) + "# EOF\n").encode("utf-8"))
+
+    def exposition(self, openmetrics=False):
+        """This method is used to get the exported samples, as they are sent to a scrape
+
+        :param openmetrics: Optional: Specify True to get the OpenMetrics format. Default the Prometheus text format
+        :type openmetrics: bool
+
+        :return: Returns the exposition
+        :rtype: bytes
+        """
+        return self.__exposition[1 if openmetrics else 0]
+
+    def start(self):
+        """This method is used to start the HTTP server and the polls in background threads"""
+        self.__stop.clear()
+        if self.host_groups:
+            self.load_host_groups()
+        self.poll()
+        self.__server = _Server((self.address, self.port), _handler(self))
+        self.__threads = [threading.Thread(target=self.__server.serve_forever, daemon=True),
+                          threading.Thread(target=self.__poll_until_stopped, daemon=True)]
+        for thread in self.__threads:
+            thread.start()
+
+    def run(self):
+        """This method is used to serve and poll until :meth:`stop` is called"""
+        self.start()
+        self.__stop.wait()
+        for thread in self.__threads:
+            thread.join()
+
+    def stop(self):
+        """This method is used to stop the HTTP server and the polls"""
+        self.__stop.set()
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+
+    @property
+    def server_address(self):
+        """Address and port the HTTP server listens on, None if it is not started"""
+        return self.__server.server_address if self.__server is not None else None
+
+    def __poll_until_stopped(self):
+        while not self.__stop.wait(self.interval):
+            self.poll()
+
+
+class _Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def _handler(exporter):
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+            body = exporter.exposition(openmetrics)
+            self.send_response(200)
+            self.send_header("Content-Type", OPENMETRICS_TYPE if openmetrics else PROMETHEUS_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Scrapes are not logged
+            pass
+
+    return Handler
+
+
+def _labels(labels):
+    return ",".join('{}="{}"'.format(name, _escape(value)) for name, value in labels)
+
+
+def _escape(value):
+    return str(value if value is not None else "").replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _value(value):
+    if value is None:
+        return "NaN"
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+    return str(int(value))
@@ -0,0 +1,404 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import array
+import bisect
+import itertools
+import json
+import mmap
+import os
+import threading
+import time
+
+from centreon_sdk.exceptions.request_failed import CentreonRequestFailedError
+
+COLUMNS = (("time_delta", "i"), ("key", "i"), ("state", "b"))
+"""Files of the columns in the directory of a history and their type codes"""
+
+
+class StatusHistory:
+    """This class stores the state transitions of hosts or services.
+
+    Only transitions are stored: a host or service appears again when its state changed. New transitions are kept in
+    a ring buffer of a fixed capacity. If the history has a directory, a full buffer is rolled to it, otherwise the
+    oldest transitions are overwritten. In the directory every column is a file of fixed size values, so it can be
+    mapped into memory. The times are stored as the seconds since the previous transition.
+
+    Queries use an index of the positions and times of the transitions of every key. It is built with one pass over the
+    mapped files when it is first used, afterwards only new transitions are added to it. The states are read from the
+    mapped files and the ring buffer directly.
+
+    :param path: Optional: Directory of the history on disk. Existing history in it is continued
+    :type path: str
+    :param capacity: Optional: Number of transitions of the ring buffer. Default 65536
+    :type capacity: int
+    """
+
+    def __init__(self, path=None, *, capacity=65536):
+        self.path = path
+        self.capacity = capacity
+        self.keys = []
+        self.states = {}
+        self.last_time = None
+        self.__key_ids = {}
+        self.__times = array.array("q", bytes(8 * capacity))
+        self.__key_column = array.array("i", bytes(4 * capacity))
+        self.__state_column = array.array("b", bytes(capacity))
+        self.__head = 0
+        self.__size = 0
+        self.__base = None
+        self.__written_time = None
+        self.__disk = None
+        self.__disk_count = 0
+        self.__total = 0
+        self.__index = None
+        self.__lock = threading.RLock()
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+            self.__load_meta()
+            state_path = os.path.join(path, "state")
+            # Every transition on disk has one byte in the state column
+            self.__disk_count = self.__total = os.path.getsize(state_path) if os.path.exists(state_path) else 0
+
+    def __load_meta(self):
+        try:
+            with open(os.path.join(self.path, "meta.json")) as file:
+                meta = json.load(file)
+        except FileNotFoundError:
+            return
+        self.keys = [tuple(x) if isinstance(x, list) else x for x in meta["keys"]]
+        self.__key_ids = {key: index for index, key in enumerate(self.keys)}
+        self.states = {self.keys[int(x)]: state for x, state in meta["states"].items()}
+        self.__base = meta["base"]
+        self.__written_time = meta["written_time"]
+        self.last_time = meta["last_time"]
+
+    def record(self, states, timestamp=None):
+        """This method is used to record the states of a snapshot. Only the changed states are stored
+
+        :param states: State by host name or (host name, service description)
+        :type states: dict
+        :param timestamp: Optional: Time of the snapshot in seconds. Default now
+        :type timestamp: int
+
+        :return: Returns the number of transitions
+        :rtype: int
+        """
+        timestamp = int(time.time() if timestamp is None else timestamp)
+        with self.__lock:
+            count = 0
+            previous = self.states
+            for key, state in states.items():
+                if previous.get(key) != state:
+                    self.__append(timestamp, self.__key_id(key), state)
+                    previous[key] = state
+                    count += 1
+            self.last_time = timestamp
+            return count
+
+    def __key_id(self, key):
+        key_id = self.__key_ids.get(key)
+        if key_id is None:
+            key_id = self.__key_ids[key] = len(self.keys)
+            self.keys.append(key)
+        return key_id
+
+    def __append(self, timestamp, key_id, state):
+        if self.__size == self.capacity:
+            if self.path is not None:
+                self.flush()
+            else:
+                # Without a directory the oldest transition is overwritten, it is the first one of its key
+                if self.__index is not None:
+                    offsets, times = self.__index[self.__key_column[self.__head]]
+                    del offsets[0]
+                    del times[0]
+                self.__head = (self.__head + 1) % self.capacity
+                self.__size -= 1
+        position = (self.__head + self.__size) % self.capacity
+        self.__times[position] = timestamp
+        self.__key_column[position] = key_id
+        self.__state_column[position] = state
+        self.__size += 1
+        if self.__index is not None:
+            self.__add_to_index(self.__index, key_id, self.__total, timestamp)
+        self.__total += 1
+
+    def flush(self):
+        """This method is used to roll the transitions of the ring buffer to the directory"""
+        if self.path is None:
+            return
+        with self.__lock:
+            times = self.__buffer(self.__times)
+            if times:
+                if self.__base is None:
+                    self.__base = self.__written_time = times[0]
+                deltas = array.array("i", (x - y for x, y in zip(times, itertools.chain([self.__written_time], times))))
+                columns = {"time_delta": deltas, "key": array.array("i", self.__buffer(self.__key_column)),
+                           "state": array.array("b", self.__buffer(self.__state_column))}
+                for name, _ in COLUMNS:
+                    with open(os.path.join(self.path, name), "ab") as file:
+                        columns[name].tofile(file)
+                self.__written_time = times[-1]
+                self.__disk_count += len(times)
+                self.__head = self.__size = 0
+                self.__close_disk()
+            meta = {"keys": self.keys, "base": self.__base, "written_time": self.__written_time,
+                    "last_time": self.last_time,
+                    "states": {str(self.__key_ids[key]): state for key, state in self.states.items()}}
+            temporary = os.path.join(self.path, "meta.json.tmp")
+            with open(temporary, "w") as file:
+                json.dump(meta, file)
+            os.replace(temporary, os.path.join(self.path, "meta.json"))
+
+    def __buffer(self, column):
+        end = self.__head + self.__size
+        if end <= self.capacity:
+            return column[self.__head:end]
+        return column[self.__head:] + column[:end - self.capacity]
+
+    def __open_disk(self):
+        # The columns on disk are mapped into memory, they are only read when they are used
+        if self.__disk is None:
+            self.__disk = {}
+            for name, type_code in COLUMNS:
+                file_path = os.path.join(self.path, name) if self.path is not None else None
+                if file_path is None or not os.path.exists(file_path) or not os.path.getsize(file_path):
+                    self.__disk[name] = (None, memoryview(array.array(type_code)))
+                    continue
+                with open(file_path, "rb") as file:
+                    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                self.__disk[name] = (mapped, memoryview(mapped).cast(type_code))
+        return self.__disk
+
+    def __close_disk(self):
+        if self.__disk is not None:
+            for mapped, view in self.__disk.values():
+                view.release()
+                if mapped is not None:
+                    mapped.close()
+            self.__disk = None
+
+    def close(self):
+        """This method is used to flush the ring buffer and release the mapped files"""
+        with self.__lock:
+            self.flush()
+            self.__close_disk()
+
+    def __get_index(self):
+        # Positions count all transitions ever recorded, so they stay valid when the ring buffer is rolled to disk
+        if self.__index is None:
+            disk = self.__open_disk()
+            times = array.array("q")
+            if len(disk["time_delta"][1]):
+                times.extend(itertools.accumulate(itertools.chain([self.__base],
+                                                                  itertools.islice(disk["time_delta"][1], 1, None))))
+            times.extend(self.__buffer(self.__times))
+            key_ids = array.array("i")
+            key_ids.frombytes(disk["key"][1].cast("B"))
+            key_ids.extend(self.__buffer(self.__key_column))
+            # Only a history without a directory drops transitions, it has none on disk
+            start = self.__total - self.__size - self.__disk_count
+            positions = {}
+            for position, key_id in enumerate(key_ids, start):
+                positions.setdefault(key_id, []).append(position)
+            self.__index = {key_id: (array.array("q", offsets),
+                                     array.array("q", map(times.__getitem__, map((-start).__add__, offsets))))
+                            for key_id, offsets in positions.items()}
+        return self.__index
+
+    @staticmethod
+    def __add_to_index(index, key_id, position, timestamp):
+        entry = index.get(key_id)
+        if entry is None:
+            entry = index[key_id] = (array.array("q"), array.array("q"))
+        entry[0].append(position)
+        entry[1].append(timestamp)
+
+    def __all(self):
+        # Yields (time, key id, state) of all transitions, from the mapped files followed by the ring buffer
+        disk = self.__open_disk()
+        deltas = disk["time_delta"][1]
+        if len(deltas):
+            times = itertools.accumulate(itertools.chain([self.__base], itertools.islice(deltas, 1, None)))
+            yield from zip(times, disk["key"][1], disk["state"][1])
+        for index in range(self.__size):
+            position = (self.__head + index) % self.capacity
+            yield self.__times[position], self.__key_column[position], self.__state_column[position]
+
+    def __state(self, position):
+        if position < self.__disk_count:
+            return self.__open_disk()["state"][1][position]
+        return self.__state_column[(self.__head + position - self.__total + self.__size) % self.capacity]
+
+    def __entry(self, key):
+        key_id = self.__key_ids.get(key)
+        return self.__get_index().get(key_id) if key_id is not None else None
+
+    def series(self, key):
+        """This method is used to get the transitions of a host or service as columns
+
+        :param key: Host name or (host name, service description)
+        :type key: Union[str, tuple]
+
+        :return: Returns the times and the states of the transitions in the order of their time
+        :rtype: tuple
+        """
+        with self.__lock:
+            entry = self.__entry(key)
+            if entry is None:
+                return array.array("q"), []
+            offsets, times = entry
+            return array.array("q", times), [self.__state(x) for x in offsets]
+
+    def transitions(self, key=None, *, start=None, end=None):
+        """This method is used to get the transitions
+
+        :param key: Optional: Host name or (host name, service description). Default all
+        :type key: Union[str, tuple]
+        :param start: Optional: Earliest time in seconds
+        :type start: int
+        :param end: Optional: Latest time in seconds
+        :type end: int
+
+        :return: Returns the transitions as (time, key, state)
+        :rtype: list of tuple
+        """
+        with self.__lock:
+            if key is None:
+                return [(timestamp, self.keys[key_id], state) for timestamp, key_id, state in self.__all()
+                        if (start is None or timestamp >= start) and (end is None or timestamp <= end)]
+            entry = self.__entry(key)
+            if entry is None:
+                return []
+            offsets, times = entry
+            first = bisect.bisect_left(times, start) if start is not None else 0
+            last = bisect.bisect_right(times, end) if end is not None else len(times)
+            return [(times[x], key, self.__state(offsets[x])) for x in range(first, last)]
+
+    def time_in_state(self, key, *, start=None, end=None):
+        """This method is used to get how long a host or service was in each state
+
+        :param key: Host name or (host name, service description)
+        :type key: Union[str, tuple]
+        :param start: Optional: Start of the period in seconds. Default the first transition
+        :type start: int
+        :param end: Optional: End of the period in seconds. Default the last recorded snapshot
+        :type end: int
+
+        :return: Returns the seconds by state. Time before the first transition is not counted
+        :rtype: dict
+        """
+        with self.__lock:
+            entry = self.__entry(key)
+            end = self.last_time if end is None else end
+            if entry is None or end is None:
+                return {}
+            offsets, key_times = entry
+            count = len(key_times)
+            first = max(0, bisect.bisect_right(key_times, start) - 1) if start is not None else 0
+            durations = {}
+            # Transitions after the end of the period are not looked at
+            for index in range(first, bisect.bisect_left(key_times, end, first)):
+                begin = key_times[index] if start is None else max(start, key_times[index])
+                finish = min(end, key_times[index + 1]) if index + 1 < count else end
+                if finish > begin:
+                    state = self.__state(offsets[index])
+                    durations[state] = durations.get(state, 0) + finish - begin
+            return durations
+
+    def availability(self, key, *, start=None, end=None, ok_states=(0,)):
+        """This method is used to get the share of the time a host or service was in an ok state
+
+        :param key: Host name or (host name, service description)
+        :type key: Union[str, tuple]
+        :param start: Optional: Start of the period in seconds. Default the first transition
+        :type start: int
+        :param end: Optional: End of the period in seconds. Default the last recorded snapshot
+        :type end: int
+        :param ok_states: Optional: States which count as available. Default (0,)
+        :type ok_states: tuple
+
+        :return: Returns the availability between 0 and 1 or None if nothing was recorded in the period
+        :rtype: float
+        """
+        durations = self.time_in_state(key, start=start, end=end)
+        total = sum(durations.values())
+        if not total:
+            return None
+        return sum(durations.get(x, 0) for x in ok_states) / total
+
+
+class StatusRecorder:
+    """This class is used to record the status of hosts or services into a :ref:`class_status_history` periodically
+
+    :param api: API to use
+    :type api: ApiWrapper
+    :param history: History to record into
+    :type history: :ref:`class_status_history`
+    :param service: Optional: Specify False to record hosts instead of services. Default True
+    :type service: bool
+    :param where: Optional: Filter of the recorded hosts or services. See :ref:`class_status_filter`
+    :type where: str
+    :param interval: Optional: Seconds between two snapshots. Default 60
+    :type interval: float
+    """
+
+    def __init__(self, api, history, *, service=True, where=None, interval=60.0):
+        self.api = api
+        self.history = history
+        self.service = service
+        self.where = where
+        self.interval = interval
+        self.__stop = threading.Event()
+
+    def capture(self, timestamp=None):
+        """This method is used to record a snapshot
+
+        :param timestamp: Optional: Time of the snapshot in seconds. Default now
+        :type timestamp: int
+
+        :return: Returns the number of transitions
+        :rtype: int
+        """
+        if self.service:
+            rows = self.api.service_status_get(fields="name,description,state", where=self.where)
+        else:
+            rows = self.api.host_status_get(fields="name,state", where=self.where)
+        if rows is None:
+            raise CentreonRequestFailedError("The status could not be requested")
+        if self.service:
+            states = {(x.get("name"), x.get("description")): int(x.get("state")) for x in rows}
+        else:
+            states = {x.get("name"): int(x.get("state")) for x in rows}
+        return self.history.record(states, timestamp)
+
+    def run(self):
+        """This method is used to record snapshots until :meth:`stop` is called. The history is flushed at the end"""
+        self.__stop.clear()
+        try:
+            while not self.__stop.is_set():
+                self.capture()
+                self.__stop.wait(self.interval)
+        finally:
+            self.history.flush()
+
+    def stop(self):
+        """This method is used to stop :meth:`run`"""
+        self.__stop.set()
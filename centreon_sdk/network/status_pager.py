@@ -0,0 +1,169 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import asyncio
+import collections
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from centreon_sdk.exceptions.request_failed import CentreonRequestFailedError
+
+
+class StatusPager:
+    """This class is used to iterate over the rows of a realtime endpoint page by page.
+
+    It can be used with ``for`` as well as with ``async for``. While the rows of a page are processed, the next pages
+    are already fetched in the background. The page size adapts to the time a request takes: it is doubled while
+    requests are faster than half the target time and halved while they are slower than twice the target time. The
+    page size only changes where the pages still line up, as pages are requested by their number.
+
+    :param fetch: Function which is called with limit and number and returns the rows of a page
+    :type fetch: callable
+    :param page_size: Optional: Size of the first page. Default 1000
+    :type page_size: int
+    :param min_page_size: Optional: Smallest page size. Default 100
+    :type min_page_size: int
+    :param max_page_size: Optional: Largest page size. Default 20000
+    :type max_page_size: int
+    :param target_time: Optional: Time in seconds a request should take. Default 1.0
+    :type target_time: float
+    :param prefetch: Optional: Specify False to fetch a page only when the previous one was processed. Default True
+    :type prefetch: bool
+    :param parallel: Optional: Number of pages which are fetched at the same time. Default 1
+    :type parallel: int
+    :param select: Optional: Function which is called with the rows of a page and returns the rows to yield, e.g. to \
+    filter them. The end is detected before, by the number of rows returned by the endpoint
+    :type select: callable
+    """
+
+    def __init__(self, fetch, *, page_size=1000, min_page_size=100, max_page_size=20000, target_time=1.0,
+                 prefetch=True, parallel=1, select=None):
+        self.fetch = fetch
+        self.select = select
+        self.page_size = page_size
+        self.__first_page_size = page_size
+        self.min_page_size = min_page_size
+        self.max_page_size = max_page_size
+        self.target_time = target_time
+        self.parallel = max(1, parallel)
+        self.window = self.parallel + 1 if prefetch else self.parallel
+        self.offset = 0
+
+    def next_page(self):
+        """This method is used to plan the next request
+
+        :return: Returns limit and number of the next page
+        :rtype: tuple
+        """
+        limit = self.page_size
+        number = self.offset // limit
+        self.offset += limit
+        return limit, number
+
+    def record(self, duration):
+        """This method is used to adapt the page size to the duration of a request
+
+        :param duration: Duration of the request in seconds
+        :type duration: float
+        """
+        size = self.page_size
+        if duration < self.target_time / 2 and size * 2 <= self.max_page_size and self.offset % (size * 2) == 0:
+            self.page_size = size * 2
+        elif duration > self.target_time * 2 and size // 2 >= self.min_page_size and size % 2 == 0:
+            self.page_size = size // 2
+
+    def fetch_page(self, limit, number):
+        """This method is used to fetch a page
+
+        :param limit: Size of the page
+        :type limit: int
+        :param number: Number of the page, starting at 0
+        :type number: int
+
+        :return: Returns the rows and the duration of the request
+        :rtype: tuple
+        """
+        start = time.perf_counter()
+        rows = self.fetch(limit, number)
+        if rows is None:
+            raise CentreonRequestFailedError("Page {} of size {} could not be fetched".format(number, limit))
+        return rows, time.perf_counter() - start
+
+    def __restart(self):
+        # Every iteration starts at the first page, with the page size the pager was created with
+        self.offset = 0
+        self.page_size = self.__first_page_size
+
+    def __iter__(self):
+        self.__restart()
+        with ThreadPoolExecutor(max_workers=self.window) as executor:
+            pending = collections.deque()
+            last = False
+            try:
+                while True:
+                    while not last and len(pending) < self.window:
+                        limit, number = self.next_page()
+                        pending.append((executor.submit(self.fetch_page, limit, number), limit))
+                    if not pending:
+                        return
+                    future, limit = pending.popleft()
+                    rows, duration = future.result()
+                    self.record(duration)
+                    if len(rows) < limit:
+                        # A page which is not full is the last one, the pages after it are empty
+                        last = True
+                        for future, _ in pending:
+                            future.cancel()
+                        pending.clear()
+                    yield from rows if self.select is None else self.select(rows)
+            finally:
+                for future, _ in pending:
+                    future.cancel()
+
+    async def __rows(self):
+        self.__restart()
+        loop = asyncio.get_event_loop()
+        executor = ThreadPoolExecutor(max_workers=self.window)
+        pending = collections.deque()
+        last = False
+        try:
+            while True:
+                while not last and len(pending) < self.window:
+                    limit, number = self.next_page()
+                    pending.append((loop.run_in_executor(executor, self.fetch_page, limit, number), limit))
+                if not pending:
+                    return
+                future, limit = pending.popleft()
+                rows, duration = await future
+                self.record(duration)
+                if len(rows) < limit:
+                    last = True
+                    for future, _ in pending:
+                        future.cancel()
+                    pending.clear()
+                for row in rows if self.select is None else self.select(rows):
+                    yield row
+        finally:
+            for future, _ in pending:
+                future.cancel()
+            # Waiting for requests which are still running would block the event loop
+            executor.shutdown(wait=False)
+
+    def __aiter__(self):
+        return self.__rows()
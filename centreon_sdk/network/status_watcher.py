@@ -0,0 +1,215 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import asyncio
+import enum
+import threading
+import time
+
+from centreon_sdk.exceptions.request_failed import CentreonRequestFailedError
+from centreon_sdk.util import method_utils
+
+
+class StatusEventKind(enum.Enum):
+    """This class represents the kinds of changes a :ref:`class_status_watcher` reports"""
+    ADDED = "added"
+    REMOVED = "removed"
+    NEW_PROBLEM = "new_problem"
+    STATE_CHANGED = "state_changed"
+    RECOVERED = "recovered"
+    ACKNOWLEDGED = "acknowledged"
+    OUTPUT_CHANGED = "output_changed"
+
+
+class StatusEvent:
+    """This class represents a change of the status of a host or service
+
+    :param kind: Kind of the change
+    :type kind: :ref:`class_status_event_kind`
+    :param key: Host name or (host name, service description)
+    :type key: Union[str, tuple]
+    :param old: Row before the change, None if the host or service was added
+    :type old: dict
+    :param new: Row after the change, None if the host or service was removed
+    :type new: dict
+    """
+    __slots__ = ("kind", "key", "old", "new")
+
+    def __init__(self, kind, key, old, new):
+        self.kind = kind
+        self.key = key
+        self.old = old
+        self.new = new
+
+    def __repr__(self):
+        return "StatusEvent({}, {!r})".format(self.kind.name, self.key)
+
+
+class StatusWatcher:
+    """This class is used to watch the status of hosts or services and report the changes.
+
+    Every poll requests the fields the watcher compares from the realtime endpoint and compares the rows with the last
+    snapshot, which is indexed by host name or by host name and service description. The first poll only takes the
+    snapshot. Changes are passed to the callbacks and can be consumed with ``async for``.
+
+    The interval between polls adapts: it is halved after a poll which found changes and grows by half after a poll
+    without changes, between the minimum and maximum interval. It is never shorter than twice the time of a poll.
+
+    :param api: API to use
+    :type api: ApiWrapper
+    :param service: Optional: Specify False to watch hosts instead of services. Default True
+    :type service: bool
+    :param where: Optional: Filter of the watched hosts or services. See :ref:`class_status_filter`
+    :type where: str
+    :param interval: Optional: First interval between polls in seconds. Default 30
+    :type interval: float
+    :param min_interval: Optional: Shortest interval in seconds. Default 5
+    :type min_interval: float
+    :param max_interval: Optional: Longest interval in seconds. Default 300
+    :type max_interval: float
+    """
+
+    def __init__(self, api, *, service=True, where=None, interval=30.0, min_interval=5.0, max_interval=300.0):
+        self.api = api
+        self.service = service
+        self.where = where
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.snapshot = None
+        self.__callbacks = []
+        self.__stop = threading.Event()
+
+    def subscribe(self, callback, kinds=None):
+        """This method is used to register a function which is called with every event
+
+        :param callback: Function which is called with a :ref:`class_status_event`
+        :type callback: callable
+        :param kinds: Optional: Kinds of events to pass to the function. Default all
+        :type kinds: Iterable[:ref:`class_status_event_kind`]
+        """
+        self.__callbacks.append((callback, frozenset(kinds) if kinds is not None else None))
+
+    def poll(self):
+        """This method is used to request the current status and report the changes since the last poll
+
+        :return: Returns the changes
+        :rtype: list of :ref:`class_status_event`
+        """
+        start = time.perf_counter()
+        if self.service:
+            rows = self.api.service_status_get(fields="name,description,state,acknowledged,output", where=self.where)
+        else:
+            rows = self.api.host_status_get(fields="name,state,acknowledged,output", where=self.where)
+        if rows is None:
+            raise CentreonRequestFailedError("The status could not be requested")
+        events = self.update(rows)
+        self.__adapt(bool(events), time.perf_counter() - start)
+        for event in events:
+            for callback, kinds in self.__callbacks:
+                if kinds is None or event.kind in kinds:
+                    callback(event)
+        return events
+
+    def update(self, rows):
+        """This method is used to compare rows with the snapshot and replace it
+
+        :param rows: Rows returned by the realtime endpoint
+        :type rows: list of dict
+
+        :return: Returns the changes, none for the first snapshot
+        :rtype: list of :ref:`class_status_event`
+        """
+        snapshot = {}
+        if self.service:
+            for row in rows:
+                snapshot[(row.get("name"), row.get("description"))] = row
+        else:
+            for row in rows:
+                snapshot[row.get("name")] = row
+        previous, self.snapshot = self.snapshot, snapshot
+        if previous is None:
+            return []
+
+        problems = (1, 2, 3) if self.service else (1, 2)
+        events = []
+        for key, new in snapshot.items():
+            old = previous.get(key)
+            if old is None:
+                events.append(StatusEvent(StatusEventKind.ADDED, key, None, new))
+                if _state(new) in problems:
+                    events.append(StatusEvent(StatusEventKind.NEW_PROBLEM, key, None, new))
+                continue
+            # Most rows did not change, they are skipped with one comparison
+            if old == new:
+                continue
+            old_state, new_state = _state(old), _state(new)
+            if old_state != new_state:
+                if new_state in problems:
+                    kind = StatusEventKind.STATE_CHANGED if old_state in problems else StatusEventKind.NEW_PROBLEM
+                    events.append(StatusEvent(kind, key, old, new))
+                elif new_state == 0 and old_state in problems:
+                    events.append(StatusEvent(StatusEventKind.RECOVERED, key, old, new))
+                else:
+                    events.append(StatusEvent(StatusEventKind.STATE_CHANGED, key, old, new))
+            if not _acknowledged(old) and _acknowledged(new):
+                events.append(StatusEvent(StatusEventKind.ACKNOWLEDGED, key, old, new))
+            if old.get("output") != new.get("output"):
+                events.append(StatusEvent(StatusEventKind.OUTPUT_CHANGED, key, old, new))
+        for key in previous.keys() - snapshot.keys():
+            events.append(StatusEvent(StatusEventKind.REMOVED, key, previous[key], None))
+        return events
+
+    def __adapt(self, changed, duration):
+        interval = self.interval / 2 if changed else self.interval * 1.5
+        self.interval = max(self.min_interval, duration * 2, min(self.max_interval, interval))
+
+    def run(self):
+        """This method is used to poll until :meth:`stop` is called. The changes are passed to the callbacks"""
+        self.__stop.clear()
+        while not self.__stop.is_set():
+            self.poll()
+            self.__stop.wait(self.interval)
+
+    def stop(self):
+        """This method is used to stop :meth:`run` and ``async for``"""
+        self.__stop.set()
+
+    async def __events(self):
+        loop = asyncio.get_event_loop()
+        self.__stop.clear()
+        while not self.__stop.is_set():
+            for event in await loop.run_in_executor(None, self.poll):
+                yield event
+            await asyncio.sleep(self.interval)
+
+    def __aiter__(self):
+        return self.__events()
+
+
+def _state(row):
+    try:
+        return int(row.get("state"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _acknowledged(row):
+    value = row.get("acknowledged")
+    return value is not None and method_utils.to_bool(value)
@@ -0,0 +1,244 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import collections
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+from centreon_sdk.objects.base.host import HostParam
+from centreon_sdk.objects.base.macro import MacroParam
+from centreon_sdk.objects.base.service import ServiceParam
+from centreon_sdk.objects.base.service_template import ServiceTemplateParam
+
+Definition = collections.namedtuple("Definition", ("templates", "params", "macros"))
+Definition.__doc__ = """Own configuration of a host, service or template: the names of its templates in the order of
+their priority, the parameters which are set and the macros"""
+
+EffectiveConfig = collections.namedtuple("EffectiveConfig", ("params", "macros"))
+EffectiveConfig.__doc__ = """Configuration of a host, service or template including everything inherited from its
+templates. The parameters and macros are read-only mappings"""
+
+EMPTY = Definition((), {}, {})
+
+
+class TemplateResolver:
+    """This class is used to compute the effective configuration of hosts and services from their templates.
+
+    :meth:`load` requests the templates, parameters and macros of all hosts and services in parallel, and those of
+    every template only once, no matter by how many hosts it is used. The effective configuration of every template
+    is computed once and memoized, so resolving all hosts and services visits every template once.
+
+    A host inherits from its templates in their order: the values of the first template, including the values it
+    inherits itself, have priority over the ones of the second template, and the values of the host have priority
+    over all templates. A service inherits from its chain of service templates. Parameters which are not set are
+    inherited.
+
+    :param api: Api wrapper to use
+    :type api: :ref:`class_api_wrapper`
+    :param host_params: Optional: Parameters of hosts to resolve. Default the check command and its arguments
+    :type host_params: Iterable[:ref:`class_host_param`]
+    :param service_params: Optional: Parameters of services to resolve. Default the check command and its arguments
+    :type service_params: Iterable[:ref:`class_service_param`]
+    :param max_workers: Optional: Maximum number of concurrent requests. Default 8
+    :type max_workers: int
+    """
+
+    def __init__(self, api, *, host_params=(HostParam.CHECK_COMMAND, HostParam.CHECK_COMMAND_ARGUMENTS),
+                 service_params=(ServiceParam.CHECK_COMMAND, ServiceParam.CHECK_COMMAND_ARGUMENTS), max_workers=8):
+        self.api = api
+        self.host_params = list(host_params)
+        self.service_params = list(service_params)
+        self.max_workers = max_workers
+        self.hosts = {}
+        self.host_templates = {}
+        self.services = {}
+        self.service_templates = {}
+        self.failed = {}
+        self.__effective = {}
+        self.__lock = threading.RLock()
+
+    def load(self, host_names=None, services=None):
+        """This method is used to request the configuration of hosts and services and of all their templates
+
+        :param host_names: Optional: Names of the hosts. Default all hosts
+        :type host_names: Iterable[str]
+        :param services: Optional: (host name, service description) of the services. Default all services
+        :type services: Iterable[tuple]
+
+        :return: Returns the objects whose configuration could not be requested together with their error
+        :rtype: dict
+        """
+        if host_names is None:
+            host_names = [x.get(HostParam.NAME) for x in self.api.host_show()]
+        if services is None:
+            services = [(x.host_name, x.description) for x in self.api.service_show()]
+        failed = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            hosts = _fetch(executor, self.__host, host_names, failed)
+            host_templates = _fetch_templates(executor, self.__host_template, hosts, failed)
+            services = _fetch(executor, self.__service, services, failed)
+            service_templates = _fetch_templates(executor, self.__service_template, services, failed)
+        with self.__lock:
+            self.hosts.update(hosts)
+            self.host_templates.update(host_templates)
+            self.services.update(services)
+            self.service_templates.update(service_templates)
+            self.failed = failed
+            self.__effective = {}
+        return failed
+
+    def __host(self, name):
+        params = self.api.host_get_params(name, self.host_params) if self.host_params else {}
+        return Definition(tuple(x.get(HostParam.NAME) for x in self.api.host_get_template(name)), _set(params),
+                          _macros(self.api.host_get_macro(name)))
+
+    def __host_template(self, name):
+        params = self.api.host_template_get_params(name, self.host_params) if self.host_params else {}
+        return Definition(tuple(x.get(HostParam.NAME) for x in self.api.host_template_get_template(name)),
+                          _set(params), _macros(self.api.host_template_get_macro(name)))
+
+    def __service(self, key):
+        params = _set(self.api.service_get_params(key[0], key[1], [ServiceParam.TEMPLATE] + self.service_params))
+        template = params.pop(ServiceParam.TEMPLATE, None)
+        return Definition((template,) if template else (), params,
+                          _macros(self.api.service_get_macro(key[0], key[1])))
+
+    def __service_template(self, description):
+        # Service templates have the same parameters as services, they are stored with the parameters of services
+        params = [ServiceTemplateParam.TEMPLATE] + [ServiceTemplateParam[x.name] for x in self.service_params]
+        values = _set(self.api.service_template_get_params(description, params))
+        template = values.pop(ServiceTemplateParam.TEMPLATE, None)
+        return Definition((template,) if template else (), {ServiceParam[x.name]: y for x, y in values.items()},
+                          _macros(self.api.service_template_get_macro(description)))
+
+    def host(self, host_name):
+        """This method is used to get the effective configuration of a host
+
+        :param host_name: Name of the host
+        :type host_name: str
+
+        :return: Returns the parameters and macros
+        :rtype: :ref:`class_effective_config`
+        """
+        return self.__resolve("host", host_name, self.hosts, self.host_templates, ())
+
+    def host_template(self, template_name):
+        """This method is used to get the effective configuration of a host template
+
+        :param template_name: Name of the host template
+        :type template_name: str
+
+        :return: Returns the parameters and macros
+        :rtype: :ref:`class_effective_config`
+        """
+        return self.__resolve("htpl", template_name, self.host_templates, self.host_templates, ())
+
+    def service(self, host_name, service_description):
+        """This method is used to get the effective configuration of a service
+
+        :param host_name: Name of the host
+        :type host_name: str
+        :param service_description: Description of the service
+        :type service_description: str
+
+        :return: Returns the parameters and macros
+        :rtype: :ref:`class_effective_config`
+        """
+        return self.__resolve("service", (host_name, service_description), self.services, self.service_templates,
+                              ())
+
+    def service_template(self, template_description):
+        """This method is used to get the effective configuration of a service template
+
+        :param template_description: Description of the service template
+        :type template_description: str
+
+        :return: Returns the parameters and macros
+        :rtype: :ref:`class_effective_config`
+        """
+        return self.__resolve("stpl", template_description, self.service_templates, self.service_templates, ())
+
+    def resolve_all(self):
+        """This method is used to get the effective configuration of all loaded hosts and services
+
+        :return: Returns the configuration by host name and the configuration by (host name, service description)
+        :rtype: tuple
+        """
+        with self.__lock:
+            return ({name: self.host(name) for name in self.hosts},
+                    {key: self.service(*key) for key in self.services})
+
+    def invalidate(self):
+        """This method is used to forget the memoized configurations, e.g. after definitions were changed"""
+        with self.__lock:
+            self.__effective = {}
+
+    def __resolve(self, kind, name, definitions, templates, stack):
+        effective = self.__effective.get((kind, name))
+        if effective is not None:
+            return effective
+        with self.__lock:
+            definition = definitions.get(name, EMPTY)
+            params, macros = {}, {}
+            # The first template has the highest priority, so it is applied last
+            for template in reversed(definition.templates):
+                if template in stack:
+                    # Templates which inherit from themselves are skipped
+                    continue
+                inherited = self.__resolve("htpl" if templates is self.host_templates else "stpl", template, templates,
+                                           templates, stack + (name,))
+                params.update(inherited.params)
+                macros.update(inherited.macros)
+            params.update(definition.params)
+            macros.update(definition.macros)
+            effective = EffectiveConfig(types.MappingProxyType(params), types.MappingProxyType(macros))
+            self.__effective[(kind, name)] = effective
+            return effective
+
+
+def _fetch(executor, function, items, failed):
+    futures = [(item, executor.submit(function, item)) for item in items]
+    results = {}
+    for item, future in futures:
+        error = future.exception()
+        if error is not None:
+            failed[item] = error
+        else:
+            results[item] = future.result()
+    return results
+
+
+def _fetch_templates(executor, function, definitions, failed):
+    # Templates are requested level by level, every template only once
+    templates = {}
+    pending = {name for x in definitions.values() for name in x.templates}
+    while pending:
+        fetched = _fetch(executor, function, pending, failed)
+        templates.update(fetched)
+        pending = {name for x in fetched.values() for name in x.templates} - templates.keys() - failed.keys()
+    return templates
+
+
+def _set(params):
+    return {param: value for param, value in params.items() if value not in (None, "")}
+
+
+def _macros(macros):
+    return {x.get(MacroParam.NAME): x.get(MacroParam.VALUE) for x in macros}
@@ -0,0 +1,313 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import collections
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from centreon_sdk.exceptions.request_failed import CentreonRequestFailedError
+from centreon_sdk.objects.base.host import HostParam
+
+
+class TopologyGraph:
+    """This class represents the network topology given by the parents of the hosts.
+
+    The parents are requested with one getparent call per host, which are run in parallel. The graph keeps the
+    parents and children of every host, so the calls are only repeated for the hosts passed to :meth:`refresh`. The
+    ancestors and descendants of a host are computed once in linear time and cached until the graph changes, after
+    that :meth:`is_ancestor` takes constant time. Cycles are found with Tarjan's algorithm in linear time.
+
+    :param api: Api wrapper to use
+    :type api: :ref:`class_api_wrapper`
+    :param max_workers: Optional: Maximum number of concurrent getparent calls. Default 8
+    :type max_workers: int
+    """
+
+    def __init__(self, api, *, max_workers=8):
+        self.api = api
+        self.max_workers = max_workers
+        self.parents = {}
+        self.children = {}
+        self.failed = {}
+        self.__ancestors = {}
+        self.__descendants = {}
+        self.__lock = threading.RLock()
+
+    def load(self, host_names=None):
+        """This method is used to request the parents of hosts
+
+        :param host_names: Optional: Names of the hosts. Default all hosts
+        :type host_names: Iterable[str]
+
+        :return: Returns the hosts whose parents could not be requested together with their error
+        :rtype: dict
+        """
+        if host_names is None:
+            host_names = [x.get(HostParam.NAME) for x in self.api.host_show()]
+        host_names = list(host_names)
+        failed = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [(name, executor.submit(self.api.host_get_parent, name)) for name in host_names]
+            results = {}
+            for name, future in futures:
+                error = future.exception()
+                if error is not None:
+                    failed[name] = error
+                else:
+                    results[name] = [x.get(HostParam.NAME) for x in future.result()]
+        with self.__lock:
+            for name, parents in results.items():
+                self.set_parents(name, parents)
+            self.failed.update(failed)
+            for name in results:
+                self.failed.pop(name, None)
+        return failed
+
+    def refresh(self, host_names=None):
+        """This method is used to update the graph. Without host names the list of hosts is requested, the parents
+        of new hosts are requested and removed hosts are removed from the graph
+
+        :param host_names: Optional: Names of the hosts whose parents changed
+        :type host_names: Iterable[str]
+
+        :return: Returns the hosts whose parents could not be requested together with their error
+        :rtype: dict
+        """
+        if host_names is not None:
+            return self.load(host_names)
+        current = {x.get(HostParam.NAME) for x in self.api.host_show()}
+        with self.__lock:
+            for name in set(self.parents) - current:
+                self.remove(name)
+            new = (current - set(self.parents)) | (set(self.failed) & current)
+        return self.load(new)
+
+    def set_parents(self, host_name, parent_names):
+        """This method is used to set the parents of a host in the graph, e.g. after they were changed
+
+        :param host_name: Name of the host
+        :type host_name: str
+        :param parent_names: Names of the parents
+        :type parent_names: Iterable[str]
+        """
+        parent_names = tuple(parent_names)
+        with self.__lock:
+            old = self.parents.get(host_name, ())
+            if host_name in self.parents and old == parent_names:
+                return
+            for parent in old:
+                self.children[parent].discard(host_name)
+            self.parents[host_name] = parent_names
+            self.children.setdefault(host_name, set())
+            for parent in parent_names:
+                self.children.setdefault(parent, set()).add(host_name)
+                # Parents which were not loaded are known without parents
+                self.parents.setdefault(parent, ())
+            self.__invalidate()
+
+    def remove(self, host_name):
+        """This method is used to remove a host from the graph
+
+        :param host_name: Name of the host
+        :type host_name: str
+        """
+        with self.__lock:
+            for parent in self.parents.pop(host_name, ()):
+                self.children[parent].discard(host_name)
+            for child in self.children.pop(host_name, ()):
+                self.parents[child] = tuple(x for x in self.parents[child] if x != host_name)
+            self.failed.pop(host_name, None)
+            self.__invalidate()
+
+    def __invalidate(self):
+        self.__ancestors = {}
+        self.__descendants = {}
+
+    def __len__(self):
+        return len(self.parents)
+
+    def __contains__(self, host_name):
+        return host_name in self.parents
+
+    def roots(self):
+        """This method is used to get the hosts without parents
+
+        :return: Returns the names of the hosts
+        :rtype: list of str
+        """
+        return [name for name, parents in self.parents.items() if not parents]
+
+    def ancestors(self, host_name):
+        """This method is used to get all hosts a host depends on
+
+        :param host_name: Name of the host
+        :type host_name: str
+
+        :return: Returns the names of the parents, their parents and so on
+        :rtype: frozenset
+        """
+        with self.__lock:
+            ancestors = self.__ancestors.get(host_name)
+            if ancestors is None:
+                ancestors = self.__ancestors[host_name] = _reachable(host_name, self.parents)
+            return ancestors
+
+    def descendants(self, host_name):
+        """This method is used to get all hosts which depend on a host
+
+        :param host_name: Name of the host
+        :type host_name: str
+
+        :return: Returns the names of the children, their children and so on
+        :rtype: frozenset
+        """
+        with self.__lock:
+            descendants = self.__descendants.get(host_name)
+            if descendants is None:
+                descendants = self.__descendants[host_name] = _reachable(host_name, self.children)
+            return descendants
+
+    def is_ancestor(self, ancestor, host_name):
+        """This method is used to check if a host depends on another host
+
+        :param ancestor: Name of the host which may be an ancestor
+        :type ancestor: str
+        :param host_name: Name of the host
+        :type host_name: str
+
+        :return: Returns True if the host depends on the ancestor
+        :rtype: bool
+        """
+        return ancestor in self.ancestors(host_name)
+
+    def impact(self, host_name, max_depth=None):
+        """This method is used to get the hosts which are affected by the failure of a host
+
+        :param host_name: Name of the host
+        :type host_name: str
+        :param max_depth: Optional: Maximum distance. Default no limit
+        :type max_depth: int
+
+        :return: Returns the distance of every affected host, the radius is the largest distance
+        :rtype: dict
+        """
+        distances = {}
+        queue = collections.deque([(host_name, 0)])
+        while queue:
+            name, distance = queue.popleft()
+            if max_depth is not None and distance >= max_depth:
+                continue
+            for child in self.children.get(name, ()):
+                if child not in distances and child != host_name:
+                    distances[child] = distance + 1
+                    queue.append((child, distance + 1))
+        return distances
+
+    def cycles(self):
+        """This method is used to find hosts which are their own ancestors
+
+        :return: Returns the groups of hosts which form a cycle
+        :rtype: list of list
+        """
+        index = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        cycles = []
+        counter = 0
+        for start in self.parents:
+            if start in index:
+                continue
+            # Tarjan's algorithm without recursion, every frame is a host and the iterator over its parents
+            work = [(start, iter(self.parents.get(start, ())))]
+            index[start] = low[start] = counter
+            counter += 1
+            stack.append(start)
+            on_stack.add(start)
+            while work:
+                name, parents = work[-1]
+                for parent in parents:
+                    if parent not in index:
+                        index[parent] = low[parent] = counter
+                        counter += 1
+                        stack.append(parent)
+                        on_stack.add(parent)
+                        work.append((parent, iter(self.parents.get(parent, ()))))
+                        break
+                    if parent in on_stack:
+                        low[name] = min(low[name], index[parent])
+                else:
+                    work.pop()
+                    if work:
+                        low[work[-1][0]] = min(low[work[-1][0]], low[name])
+                    if low[name] == index[name]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == name:
+                                break
+                        if len(component) > 1 or name in self.parents.get(name, ()):
+                            cycles.append(component)
+        return cycles
+
+    def unreachable(self, states=None):
+        """This method is used to find the hosts which are cut off by failed parents, like the monitoring engine does
+
+        A host is reachable if it has no parents or if one of its parents is reachable and up. The failed hosts
+        which are reachable are the causes of the outage. Hosts of a cycle which no host without parents leads to are
+        unreachable.
+
+        :param states: Optional: State by host name, 0 is up. Default the states of the realtime endpoint
+        :type states: dict
+
+        :return: Returns the names of the causes and the names of the unreachable hosts
+        :rtype: tuple
+        """
+        if states is None:
+            rows = self.api.host_status_get(fields="name,state")
+            if rows is None:
+                raise CentreonRequestFailedError("The host status could not be requested")
+            states = {row["name"]: int(row["state"]) for row in rows}
+        with self.__lock:
+            reachable = set(self.roots())
+            queue = collections.deque(reachable)
+            while queue:
+                name = queue.popleft()
+                if states.get(name, 0) != 0:
+                    continue
+                for child in self.children.get(name, ()):
+                    if child not in reachable:
+                        reachable.add(child)
+                        queue.append(child)
+            causes = {name for name in reachable if states.get(name, 0) != 0}
+            return causes, set(self.parents) - reachable
+
+
+def _reachable(start, edges):
+    seen = set()
+    stack = [start]
+    while stack:
+        for name in edges.get(stack.pop(), ()):
+            if name not in seen:
+                seen.add(name)
+                stack.append(name)
+    seen.discard(start)
+    return frozenset(seen)
@@ -0,0 +1,236 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import collections
+import contextlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from centreon_sdk.exceptions.request_failed import CentreonRequestFailedError
+from centreon_sdk.network.clapi_operation import ClapiOperation, OperationKind
+from centreon_sdk.network.network import HTTPVerb
+from centreon_sdk.network.relation_sync import Relation, SINGLE_DEL_RELATIONS, _member_name
+from centreon_sdk.util import method_utils
+
+GETPARAM_OBJECTS = ("host", "htpl", "service", "stpl")
+"""CLAPI objects whose parameters can be read before they are overwritten"""
+
+
+class Transaction:
+    """This class is used to undo the write operations of a failed commit with compensating operations.
+
+    It offers the same *make_request* method as :ref:`object_network`, so it can be put in front of an
+    :ref:`class_api_wrapper`. Write operations made inside a scope are recorded together with the operations which
+    restore the previous state. To know the previous state, the affected attribute is read before the operation is
+    sent:
+
+    - add is undone with del
+    - setparam is undone with setparam of the previous value, for objects which support getparam
+    - add, del and set on a relation are undone with the inverse change of the previous members
+
+    Other operations, e.g. del or setmacro, can not be undone and are collected in *irreversible*. Failed write
+    operations raise a CentreonRequestFailedError, so a commit stops at the first failure. When a scope
+    is left with an exception, its compensating operations are sent in reverse order, different objects are
+    restored concurrently.
+
+    Scopes belong to the thread which opened them, so every thread of a parallel commit can use its own scope.
+
+    :param network: Network to send the operations with
+    :type network: :ref:`object_network`
+    :param params: URL parameters of CLAPI requests
+    :type params: dict
+    :param max_workers: Optional: Maximum number of concurrent requests while rolling back. Default 8
+    :type max_workers: int
+    """
+    def __init__(self, network, params, *, max_workers=8):
+        self.network = network
+        self.params = params
+        self.max_workers = max_workers
+        self.irreversible = []
+        self.rollback_failed = []
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+
+    def make_request(self, verb, *, params=None, data=None, use_encode_json=True, use_header=True):
+        """This method is used to record write requests made inside a scope and to pass through all other requests
+
+        :param verb: HTTP Verb to use
+        :type :ref:object_http_verb:
+        :param params: Optional: dict to get encoded in url
+        :type params: dict
+        :param data: Optional: dict to get encoded in body
+        :type data: dict
+        :param use_encode_json: Optional: Set False to do not use json serialization in data
+        :type use_encode_json: bool
+        :param use_header: Optional: Set false to do not use header
+        :type use_header: bool
+
+        :return: Returns the decoded response
+        :rtype: dict
+        """
+        if self.__scopes() and verb == HTTPVerb.POST and use_encode_json and use_header and isinstance(data, dict) \
+                and "action" in data:
+            operation = ClapiOperation.from_data_dict(data)
+            if operation.kind is not OperationKind.READ:
+                return self.execute(operation)
+        return self.network.make_request(verb, params=params, data=data, use_encode_json=use_encode_json,
+                                         use_header=use_header)
+
+    @contextlib.contextmanager
+    def scope(self):
+        """This method is used to open a scope in the current thread. If the with block raises an exception, all
+        operations made inside the block are rolled back. A scope which succeeds is merged into the enclosing scope
+        of the same thread.
+
+        :return: Returns the compensating operations recorded so far, in the order they were recorded
+        :rtype: list of :ref:`class_clapi_operation`
+        """
+        scopes = self.__scopes()
+        compensations = []
+        scopes.append(compensations)
+        try:
+            yield compensations
+        except BaseException:
+            scopes.pop()
+            self.rollback(compensations)
+            raise
+        scopes.pop()
+        if scopes:
+            scopes[-1].extend(compensations)
+
+    def execute(self, operation):
+        """This method is used to send a single write operation and to record its compensating operations in the
+        scope of the current thread
+
+        :param operation: Operation to send
+        :type operation: :ref:`class_clapi_operation`
+
+        :return: Returns the decoded response
+        :rtype: dict
+        """
+        compensations = self.compensate(operation)
+        response = self.network.make_request(HTTPVerb.POST, params=self.params, data=operation.to_data_dict())
+        if not method_utils.check_if_empty_list(response):
+            raise CentreonRequestFailedError("Operation failed: {}".format(operation))
+        scopes = self.__scopes()
+        if compensations is None:
+            with self.__lock:
+                self.irreversible.append(operation)
+        elif scopes:
+            scopes[-1].extend(compensations)
+        return response
+
+    def compensate(self, operation):
+        """This method is used to build the operations which undo an operation, based on the current state
+
+        :param operation: Operation to undo
+        :type operation: :ref:`class_clapi_operation`
+
+        :return: Returns the compensating operations, None if the operation can not be undone
+        :rtype: list of :ref:`class_clapi_operation`
+        """
+        target_values = list(operation.target[1:]) if operation.target else []
+        if operation.kind is OperationKind.CREATE:
+            return [ClapiOperation(operation.object_name, "del", operation.values[:operation.width])]
+        if operation.kind is OperationKind.PARAM and operation.attribute[0] == "param" \
+                and operation.object_name in GETPARAM_OBJECTS:
+            name = operation.attribute[1]
+            rows = self.__read(ClapiOperation(operation.object_name, "getparam", target_values + [name]))
+            if not rows or not isinstance(rows[0], dict) or name not in rows[0]:
+                return None
+            return [ClapiOperation(operation.object_name, "setparam",
+                                   target_values + [name, method_utils.to_param_value(rows[0][name])])]
+        if operation.kind in (OperationKind.RELATION_ADD, OperationKind.RELATION_DEL, OperationKind.RELATION_SET):
+            suffix = operation.attribute
+            rows = self.__read(ClapiOperation(operation.object_name, "get" + suffix, target_values))
+            if rows is None:
+                return None
+            current = [_member_name(x) for x in rows]
+            if operation.kind is OperationKind.RELATION_ADD:
+                return self.__relation(operation, "del", [x for x in operation.members if x not in current])
+            if operation.kind is OperationKind.RELATION_DEL:
+                return self.__relation(operation, "add", [x for x in operation.members if x in current])
+            if current:
+                return self.__relation(operation, "set", current)
+            if _relation(operation) is None:
+                # Not every set action has a matching del action, e.g. setinstance
+                return None
+            return self.__relation(operation, "del", operation.members)
+        return None
+
+    def rollback(self, compensations):
+        """This method is used to send compensating operations. The operations of an object are sent in reverse
+        order, different objects are handled concurrently
+
+        :param compensations: Compensating operations in the order they were recorded
+        :type compensations: list of :ref:`class_clapi_operation`
+
+        :return: Returns the compensating operations which failed together with their error
+        :rtype: list of tuple
+        """
+        chains = collections.OrderedDict()
+        for operation in reversed(compensations):
+            chains.setdefault(operation.target, []).append(operation)
+        failed = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for chain_failed in executor.map(self.__run_chain, chains.values()):
+                failed.extend(chain_failed)
+        with self.__lock:
+            self.rollback_failed.extend(failed)
+        return failed
+
+    def __run_chain(self, chain):
+        failed = []
+        for operation in chain:
+            try:
+                response = self.network.make_request(HTTPVerb.POST, params=self.params,
+                                                     data=operation.to_data_dict())
+                if not method_utils.check_if_empty_list(response):
+                    raise CentreonRequestFailedError("Operation failed: {}".format(operation))
+            except Exception as err:
+                # Continue, so as much of the previous state as possible is restored
+                failed.append((operation, err))
+        return failed
+
+    def __relation(self, operation, prefix, members):
+        if not members:
+            return []
+        target_values = list(operation.target[1:])
+        action = prefix + operation.attribute
+        if prefix == "del" and _relation(operation) in SINGLE_DEL_RELATIONS:
+            return [ClapiOperation(operation.object_name, action, target_values + [x]) for x in members]
+        return [ClapiOperation(operation.object_name, action, target_values + ["|".join(members)])]
+
+    def __read(self, operation):
+        response = self.network.make_request(HTTPVerb.POST, params=self.params, data=operation.to_data_dict())
+        if not response or not isinstance(response.get("result"), list):
+            return None
+        return response["result"]
+
+    def __scopes(self):
+        if not hasattr(self.__local, "scopes"):
+            self.__local.scopes = []
+        return self.__local.scopes
+
+
+def _relation(operation):
+    try:
+        return Relation((operation.object_name, operation.attribute))
+    except ValueError:
+        return None
@@ -0,0 +1,255 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import collections
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from centreon_sdk.exceptions.item_exsting_error import CentreonItemAlreadyExistingError
+from centreon_sdk.exceptions.request_failed import CentreonRequestFailedError
+from centreon_sdk.network.clapi_operation import ClapiOperation, OperationKind, RELATION_KINDS
+from centreon_sdk.network.network import HTTPVerb
+from centreon_sdk.util import method_utils
+
+
+class WriteQueue:
+    """This class is used to buffer CLAPI write operations and flush them in a collapsed form.
+
+    It offers the same *make_request* method as :ref:`object_network`, so it can be put in front of an
+    :ref:`class_api_wrapper`. Write operations are buffered per object and collapsed before they are flushed:
+
+    - repeated setparam on the same attribute only keeps the last value
+    - add and del of the same relation member cancel out, as well as add and del of the same object
+    - set on a relation supersedes earlier add and del on the same relation
+
+    Any read operation flushes the queue before it is sent, so reads always see the queued writes.
+
+    :param network: Network to send the operations with
+    :type network: :ref:`object_network`
+    :param params: URL parameters of CLAPI requests
+    :type params: dict
+    :param max_workers: Optional: Maximum number of concurrent requests while flushing. Default 8
+    :type max_workers: int
+    """
+    def __init__(self, network, params, *, max_workers=8):
+        self.network = network
+        self.params = params
+        self.max_workers = max_workers
+        self.failed = []
+        self.__chains = collections.OrderedDict()
+        self.__lock = threading.RLock()
+
+    def __len__(self):
+        with self.__lock:
+            return sum(len(chain) for chain in self.__chains.values())
+
+    def make_request(self, verb, *, params=None, data=None, use_encode_json=True, use_header=True):
+        """This method is used to queue write requests and to pass through all other requests
+
+        :param verb: HTTP Verb to use
+        :type :ref:object_http_verb:
+        :param params: Optional: dict to get encoded in url
+        :type params: dict
+        :param data: Optional: dict to get encoded in body
+        :type data: dict
+        :param use_encode_json: Optional: Set False to do not use json serialization in data
+        :type use_encode_json: bool
+        :param use_header: Optional: Set false to do not use header
+        :type use_header: bool
+
+        :return: Returns an empty result for queued operations, else the decoded response
+        :rtype: dict
+        """
+        if verb == HTTPVerb.POST and use_encode_json and use_header and isinstance(data, dict) and "action" in data:
+            operation = ClapiOperation.from_data_dict(data)
+            if operation.kind not in (OperationKind.READ, OperationKind.GLOBAL):
+                self.enqueue(operation)
+                return {"result": []}
+        self.flush()
+        return self.network.make_request(verb, params=params, data=data, use_encode_json=use_encode_json,
+                                         use_header=use_header)
+
+    def enqueue(self, operation):
+        """This method is used to add an operation to the queue. Read and global operations flush the queue and are
+        executed immediately
+
+        :param operation: Operation to add
+        :type operation: :ref:`class_clapi_operation`
+        """
+        if operation.kind in (OperationKind.READ, OperationKind.GLOBAL):
+            self.flush()
+            return self.network.make_request(HTTPVerb.POST, params=self.params, data=operation.to_data_dict())
+        with self.__lock:
+            chain = self.__chains.setdefault(operation.target, [])
+            if operation.kind is OperationKind.DELETE:
+                self.__collapse_delete(chain, operation)
+            elif operation.kind is OperationKind.PARAM:
+                self.__drop(chain, lambda x: x.kind is OperationKind.PARAM and x.attribute == operation.attribute)
+                chain.append(operation)
+            elif operation.kind is OperationKind.RELATION_SET:
+                self.__drop(chain, lambda x: x.kind in RELATION_KINDS and x.attribute == operation.attribute)
+                chain.append(operation)
+            elif operation.kind in RELATION_KINDS:
+                self.__collapse_relation(chain, operation)
+            else:
+                chain.append(operation)
+            if not chain:
+                del self.__chains[operation.target]
+
+    def flush(self):
+        """This method is used to send all queued operations.
+
+        The operations of an object are sent in order, different objects are handled concurrently. Objects are
+        created first, in the order their types were queued, and deleted last, in reverse order. If an operation
+        fails, the remaining operations of the same object are skipped.
+
+        :return: Returns the failed operations together with their error
+        :rtype: list of tuple
+        """
+        with self.__lock:
+            chains = self.__chains
+            self.__chains = collections.OrderedDict()
+        if not chains:
+            return []
+
+        creates = collections.OrderedDict()
+        deletes = collections.OrderedDict()
+        bodies = []
+        for target, chain in chains.items():
+            if chain[0].kind is OperationKind.CREATE:
+                creates.setdefault(target[0], []).append(chain.pop(0))
+            if chain and chain[-1].kind is OperationKind.DELETE:
+                deletes.setdefault(target[0], []).append(chain.pop())
+            if chain:
+                bodies.append(chain)
+
+        failed = []
+        broken = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for operations in creates.values():
+                self.__run(executor, [[x] for x in operations], failed, broken)
+            self.__run(executor, [x for x in bodies if x[0].target not in broken], failed, broken)
+            for operations in reversed(deletes.values()):
+                self.__run(executor, [[x] for x in operations if x.target not in broken], failed, broken)
+        self.failed.extend(failed)
+        return failed
+
+    def execute(self, operation):
+        """This method is used to send a single write operation
+
+        :param operation: Operation to send
+        :type operation: :ref:`class_clapi_operation`
+
+        :return: Returns the decoded response
+        :rtype: dict
+        """
+        response = self.network.make_request(HTTPVerb.POST, params=self.params, data=operation.to_data_dict())
+        if not method_utils.check_if_empty_list(response):
+            raise CentreonRequestFailedError("Operation failed: {}".format(operation))
+        return response
+
+    def __run(self, executor, chains, failed, broken):
+        for chain, chain_failed in zip(chains, executor.map(self.__run_chain, chains)):
+            if chain_failed:
+                failed.extend(chain_failed)
+                if chain_failed[-1][0].kind is not OperationKind.CREATE \
+                        or not isinstance(chain_failed[-1][1], CentreonItemAlreadyExistingError):
+                    broken.add(chain[0].target)
+
+    def __run_chain(self, chain):
+        failed = []
+        for operation in chain:
+            try:
+                self.execute(operation)
+            except CentreonItemAlreadyExistingError as err:
+                # The object exists already, so the following operations can still be applied
+                failed.append((operation, err))
+                if operation.kind is not OperationKind.CREATE:
+                    return failed
+            except (CentreonRequestFailedError, requests.RequestException) as err:
+                failed.append((operation, err))
+                return failed
+        return failed
+
+    @staticmethod
+    def __window_start(chain):
+        # Operations can only be collapsed up to the last operation with unknown or structural effects
+        for index in range(len(chain) - 1, -1, -1):
+            if chain[index].kind not in RELATION_KINDS and chain[index].kind is not OperationKind.PARAM:
+                return index + 1
+        return 0
+
+    def __drop(self, chain, predicate):
+        start = self.__window_start(chain)
+        chain[start:] = [x for x in chain[start:] if not predicate(x)]
+
+    def __collapse_delete(self, chain, operation):
+        # Changes to an object which gets deleted afterwards are not needed
+        del chain[self.__window_start(chain):]
+        if chain and chain[-1].kind is OperationKind.CREATE:
+            chain.pop()
+        else:
+            chain.append(operation)
+
+    def __collapse_relation(self, chain, operation):
+        start = self.__window_start(chain)
+        related = {x.kind: x for x in chain[start:] if x.kind in RELATION_KINDS and x.attribute == operation.attribute}
+        members = operation.members
+
+        set_operation = related.get(OperationKind.RELATION_SET)
+        if set_operation:
+            if operation.kind is OperationKind.RELATION_ADD:
+                new_members = set_operation.members + [x for x in members if x not in set_operation.members]
+            else:
+                new_members = [x for x in set_operation.members if x not in members]
+            self.__replace(chain, set_operation, set_operation.with_members(new_members))
+            return
+
+        add_operation = related.get(OperationKind.RELATION_ADD)
+        del_operation = related.get(OperationKind.RELATION_DEL)
+        if operation.kind is OperationKind.RELATION_ADD:
+            if del_operation:
+                self.__replace(chain, del_operation,
+                               del_operation.with_members([x for x in del_operation.members if x not in members]))
+            if add_operation:
+                self.__replace(chain, add_operation, add_operation.with_members(
+                    add_operation.members + [x for x in members if x not in add_operation.members]))
+            else:
+                chain.append(operation)
+        else:
+            cancelled = add_operation.members if add_operation else []
+            if add_operation:
+                self.__replace(chain, add_operation,
+                               add_operation.with_members([x for x in cancelled if x not in members]))
+            remaining = [x for x in members if x not in cancelled]
+            if del_operation:
+                self.__replace(chain, del_operation, del_operation.with_members(
+                    del_operation.members + [x for x in remaining if x not in del_operation.members]))
+            elif remaining:
+                chain.append(operation.with_members(remaining))
+
+    @staticmethod
+    def __replace(chain, old, new):
+        index = next(i for i, x in enumerate(chain) if x is old)
+        if new.kind is not OperationKind.RELATION_SET and not new.members:
+            del chain[index]
+        else:
+            chain[index] = new
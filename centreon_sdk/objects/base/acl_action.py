@@ -20,6 +20,7 @@ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 import enum
 
 from centreon_sdk.objects.base.base import Base
+from centreon_sdk.util import method_utils
 
 
 class ACLAction(Base):
@@ -34,6 +35,9 @@ class ACLAction(Base):
     :param activate: Is the ACLAction enabled?
     :type activate: bool
     """
+    __slots__ = ("grant_rules", "revoke_rules")
+    field_coercers = {"activate": method_utils.to_bool}
+
     def __init__(self, **kwargs):
         super(ACLAction, self).__init__(ACLActionParam, [ACLActionParam.NAME, ACLActionParam.DESCRIPTION],
                                         kwargs)
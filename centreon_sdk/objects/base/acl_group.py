@@ -25,6 +25,7 @@ from centreon_sdk.objects.base.acl_resource import ACLResource
 from centreon_sdk.objects.base.base import Base
 from centreon_sdk.objects.base.contact import Contact
 from centreon_sdk.objects.base.contact_group import ContactGroup
+from centreon_sdk.util import method_utils
 
 
 class ACLGroup(Base):
@@ -39,6 +40,13 @@ class ACLGroup(Base):
     :param activate: Is the ACLGroup enabled?
     :type activate: bool
     """
+    __slots__ = ("linked_contacts",
+                 "linked_contact_groups",
+                 "linked_menu_rules",
+                 "linked_resource_rules",
+                 "linked_action_rules")
+    field_coercers = {"activate": method_utils.to_bool}
+
     def __init__(self, **kwargs):
         super(ACLGroup, self).__init__(ACLGroupParam, [ACLGroupParam.NAME, ACLGroupParam.ALIAS], kwargs)
 
@@ -20,6 +20,7 @@ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 import enum
 
 from centreon_sdk.objects.base.base import Base
+from centreon_sdk.util import method_utils
 
 
 class ACLMenu(Base):
@@ -36,6 +37,9 @@ class ACLMenu(Base):
     :param activate: Is the ACL menu rule enabled?
     :type activate: bool
     """
+    __slots__ = ("menu_grant_rw", "menu_grant_ro", "menu_revoke")
+    field_coercers = {"activate": method_utils.to_bool}
+
     def __init__(self, **kwargs):
         super(ACLMenu, self).__init__(ACLMenuParam, [ACLMenuParam.NAME, ACLMenuParam.ALIAS], kwargs)
         self.menu_grant_rw = []
@@ -20,6 +20,7 @@ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 import enum
 
 from centreon_sdk.objects.base.base import Base
+from centreon_sdk.util import method_utils
 
 
 class ACLResource(Base):
@@ -36,6 +37,14 @@ class ACLResource(Base):
     :param activate: Is the ACL resource enabled?
     :type activate: bool
     """
+    __slots__ = ("grant_resources_list",
+                 "revoke_resource_list",
+                 "add_host_exclusion_list",
+                 "del_host_exclusion_list",
+                 "add_filter_list",
+                 "del_filter_list")
+    field_coercers = {"activate": method_utils.to_bool}
+
     def __init__(self, **kwargs):
         super(ACLResource, self).__init__(ACLResourceParam, [ACLResourceParam.NAME, ACLResourceParam.ALIAS], kwargs)
         self.grant_resources_list = []
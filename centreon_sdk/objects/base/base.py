@@ -18,45 +18,183 @@ along with this program; if not, write to the Free Software
 Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 """
 from centreon_sdk.exceptions.attribute_not_found import AttributeNotFoundError
+from centreon_sdk.objects.base.result_set import ResultSet
+from centreon_sdk.util import method_utils
 
 
 class Base:
+    """This class is the base of all objects which are configured with params.
+
+    The values are stored compactly: the ordinals of the set params are kept in a bytes object and their values in a
+    tuple at the same position. Everything that is the same for all objects of a type, like the param class and the
+    required params, is shared between them.
+
+    The initial values are matched to the params with a field map which is compiled once per object type. A key
+    matches a param by its value, its name or one of the :attr:`field_aliases` of the type. Keys which do not match
+    a param, like "id_unique", are collected in :attr:`unknown_fields`.
+
+    :param param_class: Enum of the params of the object
+    :type param_class: enum.Enum
+    :param required_params: Params which are required to create the object
+    :type required_params: list
+    :param kwargs: Initial values of the params
+    :type kwargs: dict
+    """
+    __slots__ = ("_meta", "_ordinals", "_values", "_changed", "unset_params", "unknown_fields", "__weakref__")
+
+    #: Response keys which do not match the value or the name of a param, mapped to the name of the param
+    field_aliases = {}
+    #: Functions used to convert the values of response keys, e.g. the "0" and "1" CLAPI returns for booleans
+    field_coercers = {"id_unique": int}
+
     def __init__(self, param_class, required_params, kwargs):
-        self.required_params = required_params
-        self.unset_params = []
-        self.param_class = param_class
+        self._meta = ParamMeta.of(param_class, required_params, type(self))
+        self._ordinals = b""
+        self._values = ()
+        self.unset_params = ()
+        self.unknown_fields = None
+        # Ordinals of the params which were set or unset since the object was loaded. Only objects of an identity map
+        # are refreshed, so the others do not track their changes
+        self._changed = None
+        if kwargs:
+            self._load(kwargs)
 
-        for item in kwargs:
-            try:
-                param = param_class.__getattribute__(param_class, item)
-                if param is param_class.NAME and hasattr(self, item):
-                    if isinstance(self.get(param), list):
-                        self.set(param, [self.get(param)[0], kwargs[item]])
-                    else:
-                        self.set(param, [self.get(param), kwargs[item]])
-                else:
-                    self.set(param, kwargs[item])
-            except AttributeError:
-                print("Option {} is not in {}".format(item, str(self.param_class)))
+    @classmethod
+    def from_rows(cls, rows, *, lazy=False, identity_map=None):
+        """This method is used to create objects from the rows returned by CLAPI
 
-    def set(self, param_name, param_value):
-        if not isinstance(param_name, self.param_class):
-            raise TypeError("This method only supports the {}".format(str(self.param_class)))
-        if param_name is self.param_class.NAME and self.has(param_name):
-            if isinstance(self.get(param_name), list):
-                self.set(param_name, [self.get(param_name)[0], param_value])
+        :param rows: Rows returned by CLAPI
+        :type rows: list of dict
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the objects only when they \
+        are changed. Default False
+        :type lazy: bool
+        :param identity_map: Optional: Identity map, which returns the registered object of an entity instead of a new \
+        one. See :ref:`class_identity_map`
+        :type identity_map: :ref:`class_identity_map`
+
+        :return: Returns the objects
+        :rtype: Union[list, :ref:`class_result_set`]
+        """
+        if lazy:
+            return ResultSet(cls, rows, cls()._meta)
+        if identity_map is not None:
+            return [identity_map.load(cls, row) for row in rows]
+        return [cls(**row) for row in rows]
+
+    def _refresh(self, row):
+        # The values of the row are merged, rows with only some of the fields keep the other values. Params which
+        # were set or unset locally are left alone
+        fields = self._meta.fields
+        ordinals = self._ordinals
+        values = list(self._values)
+        for key, value in row.items():
+            field = fields.get(key)
+            if field is None:
+                field = self._meta.unknown_field(key)
+            param, ordinal, coercer = field
+            if param is not None and self._changed and ordinal in self._changed:
+                continue
+            if coercer is not None and value is not None:
+                try:
+                    value = coercer(value)
+                except (TypeError, ValueError):
+                    pass
+            if param is None:
+                if self.unknown_fields is None:
+                    self.unknown_fields = {}
+                self.unknown_fields[key] = value
+                continue
+            index = ordinals.find(ordinal)
+            if index < 0:
+                ordinals += ordinal
+                values.append(value)
             else:
-                self.set(param_name, [self.get(param_name), param_value])
+                values[index] = value
+        self._ordinals = ordinals
+        self._values = tuple(values)
+
+    def _track_changes(self):
+        # Called by an identity map, which refreshes the object with later reads
+        if self._changed is None:
+            self._changed = b""
+
+    def _mark_clean(self):
+        # Called after a commit, the params which were set or unset are refreshed by later reads again
+        if self._changed is not None:
+            self._changed = b""
+
+    def _load(self, row):
+        # The ordinals and values are collected first, so the bytes and the tuple are only created once
+        meta = self._meta
+        fields = meta.fields
+        ordinals = bytearray(self._ordinals)
+        values = list(self._values)
+        for key, value in row.items():
+            field = fields.get(key)
+            if field is None:
+                field = meta.unknown_field(key)
+            param, ordinal, coercer = field
+            if coercer is not None and value is not None:
+                try:
+                    value = coercer(value)
+                except (TypeError, ValueError):
+                    pass
+            if param is None:
+                if self.unknown_fields is None:
+                    self.unknown_fields = {}
+                self.unknown_fields[key] = value
+                continue
+            index = ordinals.find(ordinal)
+            if index < 0:
+                ordinals += ordinal
+                values.append(value)
+            elif param is meta.name_param:
+                # A second key of the name renames the object, like setting it again
+                name = values[index]
+                values[index] = [name[0] if isinstance(name, list) else name, value]
+            else:
+                values[index] = value
+        self._ordinals = bytes(ordinals)
+        self._values = tuple(values)
+
+    @property
+    def param_class(self):
+        """Enum of the params of the object"""
+        return self._meta.param_class
+
+    @property
+    def required_params(self):
+        """Params which are required to create the object"""
+        return self._meta.required_params
+
+    def set(self, param_name, param_value):
+        meta = self._meta
+        if not isinstance(param_name, meta.param_class):
+            raise TypeError("This method only supports the {}".format(str(meta.param_class)))
+        ordinal = meta.ordinals[param_name._name_]
+        index = self._ordinals.find(ordinal)
+        if index < 0:
+            self._ordinals += meta.ordinal_bytes[ordinal]
+            self._values += (param_value,)
         else:
-            self.__setattr__(param_name._name_, param_value)
-        if self.unset_params.__contains__(param_name):
+            values = self._values
+            if param_name is meta.name_param:
+                # Setting the name again renames the object: [old name, new name]
+                name = values[index]
+                param_value = [name[0] if isinstance(name, list) else name, param_value]
+            self._values = values[:index] + (param_value,) + values[index + 1:]
+        if self.unset_params and param_name in self.unset_params:
             self.unset_params.remove(param_name)
+        changed = self._changed
+        if changed is not None and ordinal not in changed:
+            self._changed = changed + meta.ordinal_bytes[ordinal]
 
     def get(self, param_name, *, default=None):
         if not isinstance(param_name, self.param_class):
             raise TypeError("This method only supports the {}".format(str(self.param_class)))
-        if hasattr(self, param_name._name_):
-            return self.__getattribute__(param_name._name_)
+        index = self._ordinals.find(self._meta.ordinals[param_name._name_])
+        if index >= 0:
+            return self._values[index]
         elif default is not None:
             return default
         else:
@@ -65,11 +203,122 @@ class Base:
     def has(self, param_name):
         if not isinstance(param_name, self.param_class):
             raise TypeError("This method only supports the {}".format(str(self.param_class)))
-        return True if hasattr(self, param_name._name_) else False
+        return self._ordinals.find(self._meta.ordinals[param_name._name_]) >= 0
 
     def unset(self, param_name):
         if not isinstance(param_name, self.param_class):
             raise TypeError("This method only supports the {}".format(str(self.param_class)))
-        if self.has(param_name):
-            self.__delattr__(param_name._name_)
+        ordinal = self._meta.ordinals[param_name._name_]
+        index = self._ordinals.find(ordinal)
+        if index >= 0:
+            self._ordinals = self._ordinals[:index] + self._ordinals[index + 1:]
+            self._values = self._values[:index] + self._values[index + 1:]
+        if not isinstance(self.unset_params, list):
+            self.unset_params = list(self.unset_params)
         self.unset_params.append(param_name)
+        self.__change(ordinal)
+
+    def __change(self, ordinal):
+        changed = self._changed
+        if changed is not None and ordinal not in changed:
+            self._changed = changed + self._meta.ordinal_bytes[ordinal]
+
+    def params(self):
+        """This method is used to get the params which are set, in the order they were set
+
+        :return: Returns the params
+        :rtype: list
+        """
+        params = self._meta.params
+        return [params[x] for x in self._ordinals]
+
+    def __copy__(self):
+        clone = type(self).__new__(type(self))
+        for name, value in method_utils.attributes(self).items():
+            setattr(clone, name, value)
+        if clone.unknown_fields is not None:
+            clone.unknown_fields = dict(clone.unknown_fields)
+        return clone
+
+
+class ParamMeta:
+    """This class holds the information about the params of an object type, which is shared by all its objects
+
+    :param param_class: Enum of the params
+    :type param_class: enum.Enum
+    :param required_params: Params which are required to create an object
+    :type required_params: tuple
+    :param object_type: Optional: Type of the objects, which declares the field aliases and coercers
+    :type object_type: type
+    """
+    __cache = {}
+
+    def __init__(self, param_class, required_params, object_type=None):
+        self.param_class = param_class
+        self.required_params = required_params
+        self.object_type = object_type
+        self.params = list(param_class)
+        if len(self.params) > 256:
+            raise ValueError("{} has more than 256 params".format(param_class))
+        self.ordinals = {param._name_: ordinal for ordinal, param in enumerate(self.params)}
+        self.ordinal_bytes = [bytes((x,)) for x in range(len(self.params))]
+        self.name_param = getattr(param_class, "NAME", None)
+
+        aliases = {}
+        self.coercers = {}
+        for klass in reversed(object_type.__mro__ if object_type is not None else ()):
+            aliases.update(vars(klass).get("field_aliases", {}))
+            self.coercers.update(vars(klass).get("field_coercers", {}))
+        params = {}
+        for key, name in aliases.items():
+            params[key] = param_class[name]
+        for param in self.params:
+            params.setdefault(param.value, param)
+        for param in self.params:
+            params.setdefault(param._name_, param)
+            params.setdefault(param._name_.lower(), param)
+        self.fields = {key: (param, self.ordinal_bytes[self.ordinals[param._name_]], self.coercers.get(key))
+                       for key, param in params.items()}
+
+    def unknown_field(self, key):
+        """This method is used to get the field of a key which does not match a param
+
+        :param key: Key of the field
+        :type key: str
+
+        :return: Returns the field: (None, None, coercer of the key)
+        :rtype: tuple
+        """
+        field = (None, None, self.coercers.get(key))
+        # The keys of the responses are limited, so they are remembered like the keys of the params
+        self.fields[key] = field
+        return field
+
+    @classmethod
+    def of(cls, param_class, required_params, object_type=None):
+        """This method is used to get the shared information of an object type
+
+        :param param_class: Enum of the params
+        :type param_class: enum.Enum
+        :param required_params: Params which are required to create an object
+        :type required_params: list
+        :param object_type: Optional: Type of the objects, which declares the field aliases and coercers
+        :type object_type: type
+
+        :return: Returns the shared information
+        :rtype: :ref:`class_param_meta`
+        """
+        meta = cls.__cache.get(object_type)
+        if meta is not None and meta.param_class is param_class:
+            return meta
+        key = (param_class, tuple(required_params), object_type)
+        meta = cls.__cache.get(key)
+        if meta is None:
+            meta = cls.__cache.setdefault(key, cls(param_class, key[1], object_type))
+        if object_type is not None:
+            cls.__cache.setdefault(object_type, meta)
+        return meta
+
+    def __reduce__(self):
+        # Unpickled objects share the information again
+        return ParamMeta.of, (self.param_class, self.required_params, self.object_type)
@@ -32,6 +32,8 @@ class CentBrokerCFG(Base):
     :param instance: Instance that is linked to the centreon broker configuration
     :type instance: str
     """
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super(CentBrokerCFG, self).__init__(CentBrokerCFGParam, [CentBrokerCFGParam.NAME, CentBrokerCFGParam.INSTANCE],
                                             kwargs)
@@ -34,6 +34,10 @@ class CMD(Base):
     :param line: Command line arguments for the command
     :type line: str
     """
+    __slots__ = ()
+    field_aliases = {"cmd_type": "TYPE"}
+    field_coercers = {"cmd_type": lambda value: CMDType(value)}
+
     def __init__(self, **kwargs):
         super(CMD, self).__init__(CMDParam, [CMDParam.NAME, CMDParam.TYPE, CMDParam.LINE], kwargs)
 
@@ -20,6 +20,7 @@ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 import enum
 
 from centreon_sdk.objects.base.base import Base
+from centreon_sdk.util import method_utils
 
 
 class Contact(Base):
@@ -42,6 +43,11 @@ class Contact(Base):
     :param activate: Is the user activated?
     :type activate: bool
     """
+    __slots__ = ()
+    field_aliases = {"activate": "ENABLED"}
+    field_coercers = {"gui_access": method_utils.to_bool, "admin": method_utils.to_bool,
+                      "activate": method_utils.to_bool}
+
     def __init__(self, **kwargs):
         super(Contact, self).__init__(ContactParam, [ContactParam.NAME, ContactParam.ALIAS, ContactParam.EMAIL,
                                                      ContactParam.PASSWORD, ContactParam.ADMIN, ContactParam.GUI_ACCESS,
@@ -32,6 +32,8 @@ class ContactGroup(Base):
     :param alias: Alias of the contact group
     :type alias: str
     """
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super(ContactGroup, self).__init__(ContactGroupParam, [ContactGroupParam.NAME, ContactGroupParam.ALIAS], kwargs)
 
@@ -35,15 +35,24 @@ class Dependency:
     :type execution_failure_criteria: :ref:`class_failure_criteria`
     :param notification_failure_criteria: Defines which parent states prevent notifications on dependent resources
     :type notification_failure_criteria: :ref:`class_failure_criteria`
+    :param dependency_type: Optional: Type of the dependency, required to create it
+    :type dependency_type: :ref:`class_dependency_type`
+    :param parent_names: Optional: Names of the parent resources, required to create it
+    :type parent_names: list of str
+    :param child_names: Optional: Names of the child resources
+    :type child_names: list of str
     """
     def __init__(self, id_unique, name, description, inherits_parent, execution_failure_criteria,
-                 notification_failure_criteria):
+                 notification_failure_criteria, dependency_type=None, parent_names=None, child_names=None):
         self.id_unique = id_unique
         self.name = name
         self.description = description
         self.inherits_parent = inherits_parent
         self.execution_failure_criteria = execution_failure_criteria
         self.notification_failure_criteria = notification_failure_criteria
+        self.dependency_type = dependency_type
+        self.parent_names = parent_names
+        self.child_names = child_names
 
 
 class FailureCriteria(enum.Enum):
@@ -20,6 +20,7 @@ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 import enum
 
 from centreon_sdk.objects.base.base import Base
+from centreon_sdk.util import method_utils
 
 
 class Host(Base):
@@ -36,6 +37,9 @@ class Host(Base):
     :param id_unique: Id of the host
     :type id_unique: int
     """
+    __slots__ = ()
+    field_coercers = {"activate": method_utils.to_bool}
+
     def __init__(self, **kwargs):
         super(Host, self).__init__(HostParam, [HostParam.NAME, HostParam.ALIAS, HostParam.ADDRESS, HostParam.INSTANCE],
                                    kwargs)
@@ -20,6 +20,7 @@ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 import enum
 
 from centreon_sdk.objects.base.base import Base
+from centreon_sdk.util import method_utils
 
 
 class HostGroup(Base):
@@ -32,6 +33,9 @@ class HostGroup(Base):
     :param alias: Alias of the hostgroup
     :type alias: str
     """
+    __slots__ = ()
+    field_coercers = {"activate": method_utils.to_bool}
+
     def __init__(self, **kwargs):
         super(HostGroup, self).__init__(HostGroupParam, [HostGroupParam.NAME, HostGroupParam.ALIAS], kwargs)
             
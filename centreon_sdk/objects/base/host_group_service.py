@@ -46,6 +46,10 @@ class HostGroupService:
     :param passive_checks_enabled: Are passive checks enabled?
     :type passive_checks_enabled: :ref:`class_general_three_way_option`
     """
+    __slots__ = ("host_group_id", "host_group_name", "id_unique", "description", "check_command", "check_command_arg",
+                 "normal_check_interval", "retry_check_interval", "max_check_attempts", "active_checks_enabled",
+                 "passive_checks_enabled")
+
     def __init__(self, host_group_id, host_group_name, id_unique, description, check_command, check_command_arg,
                  normal_check_interval, retry_check_interval, max_check_attempts, active_checks_enabled,
                  passive_checks_enabled):
@@ -17,6 +17,9 @@ You should have received a copy of the GNU General Public License
 along with this program; if not, write to the Free Software
 Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 """
+import functools
+
+from centreon_sdk.objects.base.projection import Projection
 
 
 class HostStatus:
@@ -53,6 +56,17 @@ class HostStatus:
     :param criticality: A specific criticity
     :type criticality: str
     """
+    #: Fields of the realtime endpoint by attribute
+    status_fields = {"id_unique": "id", "name": "name", "alias": "alias", "address": "address", "state": "state",
+                     "state_type": "state_type", "output": "output", "max_check_attempts": "max_check_attempts",
+                     "check_attempt": "check_attempt", "last_check": "last_check",
+                     "last_state_change": "last_state_change", "last_hard_state_change": "last_hard_state_change",
+                     "acknowledged": "acknowledged", "instance_name": "instance", "criticality": "criticality"}
+    #: Type codes of the typed columns of a :ref:`class_status_table`
+    column_types = {"id_unique": "q", "state": "b", "state_type": "b", "max_check_attempts": "l", "check_attempt": "l",
+                    "last_check": "q", "last_state_change": "q", "last_hard_state_change": "q", "acknowledged": "b",
+                    "instance_id": "q"}
+
     def __init__(self, *, id_unique=None, name=None, alias=None, address=None, state=None, state_type=None,
                  output=None, max_check_attempts=None, check_attempt=None, last_check=None, last_state_change=None,
                  last_hard_state_change=None, acknowledged=None, instance_name=None, criticality=None):
@@ -71,3 +85,16 @@ class HostStatus:
         self.acknowledged = acknowledged
         self.instance_name = instance_name
         self.criticality = criticality
+
+    @classmethod
+    @functools.lru_cache()
+    def project(cls, *attributes):
+        """This method is used to create a projection, which only requests the given attributes
+
+        :param attributes: Names of the attributes
+        :type attributes: str
+
+        :return: Returns the projection
+        :rtype: :ref:`class_projection`
+        """
+        return Projection(cls, attributes)
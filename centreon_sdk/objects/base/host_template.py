@@ -22,5 +22,7 @@ from centreon_sdk.objects.base.base import Base
 
 
 class HostTemplate(Base):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(HostParam, [HostParam.NAME, HostParam.ALIAS], kwargs)
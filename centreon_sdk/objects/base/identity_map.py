@@ -0,0 +1,107 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import threading
+import weakref
+
+
+class IdentityMap:
+    """This class is used to return the same object for every read of a Centreon entity.
+
+    Objects are registered by their type and their ID as well as by their type and their name. The map only holds weak
+    references, so an object is forgotten as soon as it is no longer used elsewhere. Reading an entity again merges the
+    values of the row into the registered object: values which are not in the row, e.g. of the partial rows of
+    gettemplate or getparent, are kept, and so are params which were set or unset locally.
+    """
+
+    def __init__(self):
+        self.__objects = weakref.WeakValueDictionary()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(set(map(id, self.__objects.values())))
+
+    @staticmethod
+    def __keys(object_type, id_unique, name):
+        keys = []
+        if id_unique is not None and id_unique != "":
+            keys.append((object_type, "id", str(id_unique)))
+        if isinstance(name, str):
+            keys.append((object_type, "name", name))
+        return keys
+
+    def get(self, object_type, *, id_unique=None, name=None):
+        """This method is used to get a registered object
+
+        :param object_type: Type of the object
+        :type object_type: type
+        :param id_unique: Optional: ID of the entity
+        :type id_unique: Union[int, str]
+        :param name: Optional: Name of the entity
+        :type name: str
+
+        :return: Returns the object or None if no object is registered
+        """
+        for key in self.__keys(object_type, id_unique, name):
+            obj = self.__objects.get(key)
+            if obj is not None:
+                return obj
+        return None
+
+    def load(self, object_type, row):
+        """This method is used to get the object of a row returned by CLAPI. The values of the row are merged into a
+        registered object, otherwise a new object is created and registered
+
+        :param object_type: Type of the object, a :ref:`class_base`
+        :type object_type: type
+        :param row: Row returned by CLAPI
+        :type row: dict
+
+        :return: Returns the object
+        """
+        keys = self.__keys(object_type, row.get("id_unique"), row.get("name"))
+        with self.__lock:
+            obj = None
+            for key in keys:
+                obj = self.__objects.get(key)
+                if obj is not None:
+                    break
+            if obj is None:
+                obj = object_type(**row)
+                obj._track_changes()
+            else:
+                obj._refresh(row)
+            for key in keys:
+                self.__objects[key] = obj
+        return obj
+
+    def discard(self, obj):
+        """This method is used to forget an object, the next read of the entity creates a new object
+
+        :param obj: Object to forget
+        """
+        with self.__lock:
+            for key, value in list(self.__objects.items()):
+                if value is obj:
+                    del self.__objects[key]
+
+    def clear(self):
+        """This method is used to forget all objects"""
+        with self.__lock:
+            self.__objects.clear()
@@ -20,6 +20,7 @@ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 import enum
 
 from centreon_sdk.objects.base.base import Base
+from centreon_sdk.util import method_utils
 
 
 class Macro(Base):
@@ -36,6 +37,10 @@ class Macro(Base):
     :param source: Source the macro came from
     :type source: str
     """
+    __slots__ = ()
+    field_aliases = {"macro_name": "NAME", "macro_value": "VALUE"}
+    field_coercers = {"is_password": method_utils.to_bool}
+
     def __init__(self, **kwargs):
         super(Macro, self).__init__(MacroParam, [MacroParam.NAME, MacroParam.VALUE], kwargs)
 
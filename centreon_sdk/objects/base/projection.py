@@ -0,0 +1,77 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import collections
+
+
+class Projection:
+    """This class represents the attributes of a status type which a caller needs.
+
+    The projection sends only the fields of these attributes to a realtime endpoint. It builds compact records with
+    only these attributes, which are converted to the types of the ``column_types`` of the status type. Projections
+    are created with ``project`` of :ref:`class_host_status` and :ref:`class_service_status`.
+
+    :param status_type: Status type, which declares the fields of its attributes in ``status_fields``
+    :type status_type: type
+    :param attributes: Names of the attributes
+    :type attributes: tuple of str
+    """
+
+    def __init__(self, status_type, attributes):
+        if not attributes:
+            raise ValueError("A projection needs at least one attribute")
+        unknown = [x for x in attributes if x not in status_type.status_fields]
+        if unknown:
+            raise ValueError("Unknown attributes of {}: {}".format(status_type.__name__, ", ".join(unknown)))
+        self.status_type = status_type
+        self.attributes = tuple(attributes)
+        self.fields = ",".join(status_type.status_fields[x] for x in self.attributes)
+        self.record_type = collections.namedtuple(status_type.__name__ + "Record", self.attributes)
+        convert = {"b": int, "h": int, "i": int, "l": int, "q": int, "f": float, "d": float}
+        self.__columns = []
+        for attribute in self.attributes:
+            field = status_type.status_fields[attribute]
+            type_code = status_type.column_types.get(attribute, status_type.column_types.get(field))
+            self.__columns.append((field, attribute, convert.get(type_code)))
+
+    def records(self, rows):
+        """This method is used to build the records of the rows returned by a realtime endpoint
+
+        :param rows: Rows returned by a realtime endpoint
+        :type rows: list of dict
+
+        :return: Returns a record for every row
+        :rtype: list of collections.namedtuple
+        """
+        columns = self.__columns
+        record_type = self.record_type
+        records = []
+        for row in rows:
+            values = []
+            for field, attribute, convert in columns:
+                # Renamed keys, like id to id_unique, are found by the name of the attribute
+                value = row.get(field, row.get(attribute))
+                if convert is not None and value is not None:
+                    try:
+                        value = convert(value)
+                    except (TypeError, ValueError):
+                        pass
+                values.append(value)
+            records.append(record_type._make(values))
+        return records
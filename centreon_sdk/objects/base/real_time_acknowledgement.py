@@ -20,6 +20,7 @@ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 import enum
 
 from centreon_sdk.objects.base.base import Base
+from centreon_sdk.util import method_utils
 
 
 class RealTimeAcknowledgement(Base):
@@ -42,6 +43,12 @@ class RealTimeAcknowledgement(Base):
     :param persistent_comment: Acknowledgement will be maintained in the case of a restart of the scheduler
     :type persistent_comment: bool
     """
+    __slots__ = ()
+    field_aliases = {"notify_contacts": "NOTIFY", "persistent_comment": "PERSISTENT"}
+    # CLAPI returns 2 for sticky acknowledgements
+    field_coercers = {"sticky": lambda value: str(value) == "2", "notify_contacts": method_utils.to_bool,
+                      "persistent_comment": method_utils.to_bool}
+
     def __init__(self, **kwargs):
         super(RealTimeAcknowledgement, self).__init__(RealTimeAcknowledgementParam,
                                                       [RealTimeAcknowledgementParam.NAME,
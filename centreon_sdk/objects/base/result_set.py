@@ -0,0 +1,193 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import collections.abc
+
+from centreon_sdk.exceptions.attribute_not_found import AttributeNotFoundError
+
+
+class ResultSet(collections.abc.Sequence):
+    """This class represents the result of a show request, which is backed by the rows returned by CLAPI.
+
+    The rows are handed out as :ref:`class_row_view`, which read their values from the row. The object of a row is only
+    created when it is changed.
+
+    :param object_type: Type of the objects
+    :type object_type: type
+    :param rows: Rows returned by CLAPI
+    :type rows: list of dict
+    :param meta: Optional: Shared information of the object type, if it is a :ref:`class_base`
+    :type meta: :ref:`class_param_meta`
+    """
+
+    def __init__(self, object_type, rows, meta=None):
+        self.object_type = object_type
+        self.rows = rows
+        self.meta = meta
+        self.coercers = meta.coercers if meta is not None else getattr(object_type, "field_coercers", {})
+        self.__views = [None] * len(rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[x] for x in range(*index.indices(len(self.rows)))]
+        view = self.__views[index]
+        if view is None:
+            view = self.__views[index] = RowView(self, self.rows[index])
+        return view
+
+    def changed(self):
+        """This method is used to get the objects of the rows which were changed
+
+        :return: Returns the objects
+        :rtype: list
+        """
+        return [x.object for x in self.__views if x is not None and x.dirty]
+
+    def objects(self):
+        """This method is used to create the objects of all rows
+
+        :return: Returns the objects
+        :rtype: list
+        """
+        return [x.object for x in self]
+
+    def build(self, row):
+        """This method is used to create the object of a row
+
+        :param row: Row returned by CLAPI
+        :type row: dict
+
+        :return: Returns the object
+        """
+        if self.meta is not None:
+            # Base objects coerce their values themselves
+            return self.object_type(**row)
+        return self.object_type(**{key: self.coerce(key, value) for key, value in row.items()})
+
+    def coerce(self, key, value):
+        """This method is used to convert the value of a key of a row
+
+        :param key: Key of the value
+        :type key: str
+        :param value: Value to convert
+
+        :return: Returns the converted value
+        """
+        coercer = self.coercers.get(key)
+        if coercer is None or value is None:
+            return value
+        try:
+            return coercer(value)
+        except (TypeError, ValueError):
+            return value
+
+
+class RowView:
+    """This class represents a row of a :ref:`class_result_set`.
+
+    Values are read from the row and converted when they are accessed. The first change creates the object of the row,
+    which is used for everything afterwards. Reading a value the row does not have creates the object as well, but only
+    changes mark the row as changed.
+
+    :param result_set: Result set of the row
+    :type result_set: :ref:`class_result_set`
+    :param row: Row returned by CLAPI
+    :type row: dict
+    """
+    __slots__ = ("_result_set", "_row", "_object", "_dirty")
+
+    def __init__(self, result_set, row):
+        object.__setattr__(self, "_result_set", result_set)
+        object.__setattr__(self, "_row", row)
+        object.__setattr__(self, "_object", None)
+        object.__setattr__(self, "_dirty", False)
+
+    @property
+    def object(self):
+        """Object of the row, which is created on first access"""
+        if self._object is None:
+            object.__setattr__(self, "_object", self._result_set.build(self._row))
+        return self._object
+
+    @property
+    def materialized(self):
+        """True if the object of the row was created"""
+        return self._object is not None
+
+    @property
+    def dirty(self):
+        """True if the row was changed with :meth:`set`, :meth:`unset` or by setting an attribute"""
+        return self._dirty
+
+    def __matches(self, param_name):
+        fields = self._result_set.meta.fields
+        return [key for key in self._row if fields.get(key, (None,))[0] is param_name]
+
+    def get(self, param_name, *, default=None):
+        if self._object is not None:
+            return self._object.get(param_name, default=default)
+        keys = self.__matches(param_name)
+        if len(keys) == 1:
+            return self._result_set.coerce(keys[0], self._row[keys[0]])
+        elif keys:
+            # A param which is set by more than one key is combined by the object, e.g. a renamed NAME
+            return self.object.get(param_name, default=default)
+        elif default is not None:
+            return default
+        else:
+            raise AttributeNotFoundError("Attribute {} not found in {}".format(param_name, self))
+
+    def has(self, param_name):
+        if self._object is not None:
+            return self._object.has(param_name)
+        return bool(self.__matches(param_name))
+
+    def params(self):
+        if self._object is not None:
+            return self._object.params()
+        fields = self._result_set.meta.fields
+        params = []
+        for key in self._row:
+            param = fields.get(key, (None,))[0]
+            if param is not None and param not in params:
+                params.append(param)
+        return params
+
+    def set(self, param_name, param_value):
+        self.object.set(param_name, param_value)
+        object.__setattr__(self, "_dirty", True)
+
+    def unset(self, param_name):
+        self.object.unset(param_name)
+        object.__setattr__(self, "_dirty", True)
+
+    def __getattr__(self, name):
+        if self._object is None and self._result_set.meta is None and name in self._row:
+            return self._result_set.coerce(name, self._row[name])
+        return getattr(self.object, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.object, name, value)
+        object.__setattr__(self, "_dirty", True)
+
+    def __repr__(self):
+        return "<{} of {}>".format(type(self).__name__, self._row if self._object is None else self._object)
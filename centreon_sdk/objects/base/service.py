@@ -19,6 +19,9 @@ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 """
 import enum
 
+from centreon_sdk.objects.base.result_set import ResultSet
+from centreon_sdk.util import method_utils
+
 
 class Service:
     """This class represents a service
@@ -48,6 +51,12 @@ class Service:
     :param activate: Is the service enabled?
     :type activate: int
     """
+    __slots__ = ("host_id", "host_name", "id_unique", "description", "check_command", "check_command_arg",
+                 "normal_check_interval", "retry_check_interval", "max_check_attempts", "active_checks_enabled",
+                 "passive_checks_enabled", "activate")
+    #: Functions used to convert the values of response keys
+    field_coercers = {"activate": method_utils.to_bool, "id_unique": int, "host_id": int}
+
     def __init__(self, host_id, host_name, id_unique, description, check_command, check_command_arg, 
                  normal_check_interval, retry_check_interval, max_check_attempts, active_checks_enabled,
                  passive_checks_enabled, activate):
@@ -64,6 +73,22 @@ class Service:
         self.passive_checks_enabled = passive_checks_enabled
         self.activate = activate
 
+    @classmethod
+    def from_rows(cls, rows, *, lazy=False):
+        """This method is used to create services from the rows returned by CLAPI
+
+        :param rows: Rows returned by CLAPI
+        :type rows: list of dict
+        :param lazy: Optional: Specify True to get a :ref:`class_result_set`, which creates the services only when \
+        they are changed. Default False
+        :type lazy: bool
+
+        :return: Returns the services
+        :rtype: Union[list, :ref:`class_result_set`]
+        """
+        result_set = ResultSet(cls, rows)
+        return result_set if lazy else [result_set.build(row) for row in rows]
+
 
 class ServiceParam(enum.Enum):
     """This class represents the parameters of a service"""
@@ -17,6 +17,9 @@ You should have received a copy of the GNU General Public License
 along with this program; if not, write to the Free Software
 Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 """
+import functools
+
+from centreon_sdk.objects.base.projection import Projection
 
 
 class ServiceStatus:
@@ -52,13 +55,32 @@ class ServiceStatus:
     :type instance_name: str
     :param criticality: What type of criticality is set?
     :type criticality: str
-    :param id_unique: Unique id of host
+    :param id_unique: Unique id of the service
     :type id_unique: int
+    :param host_id: ID of the host
+    :type host_id: int
+    :param description: Description of the service
+    :type description: str
+    :param perfdata: Performance data of the last check
+    :type perfdata: str
     """
+    #: Fields of the realtime endpoint by attribute
+    status_fields = {"id_unique": "service_id", "host_id": "host_id", "name": "name", "description": "description",
+                     "alias": "alias", "address": "address", "state": "state", "state_type": "state_type",
+                     "output": "output", "perfdata": "perfdata", "max_check_attempts": "max_check_attempts",
+                     "check_attempt": "check_attempt", "last_check": "last_check",
+                     "last_check_state": "last_check_state", "last_state_change": "last_state_change",
+                     "last_hard_state_change": "last_hard_state_change", "acknowledged": "acknowledged",
+                     "instance_name": "instance", "criticality": "criticality"}
+    #: Type codes of the typed columns of a :ref:`class_status_table`
+    column_types = {"id_unique": "q", "host_id": "q", "service_id": "q", "state": "b", "state_type": "b",
+                    "max_check_attempts": "l", "check_attempt": "l", "last_check": "q", "last_state_change": "q",
+                    "last_hard_state_change": "q", "acknowledged": "b", "instance_id": "q"}
+
     def __init__(self, *, name=None, alias=None, address=None, state=None, state_type=None, output=None,
                  max_check_attempts=None, check_attempt=None, last_check=None, last_check_state=None,
                  last_state_change=None, last_hard_state_change=None, acknowledged=None, instance_name=None,
-                 criticality=None, id_unique=None):
+                 criticality=None, id_unique=None, host_id=None, description=None, perfdata=None):
 
         self.name = name
         self.alias = alias
@@ -75,4 +97,20 @@ class ServiceStatus:
         self.instance_name = instance_name
         self.criticality = criticality
         self.id_unique = id_unique
-        self.last_check_state = last_state_change
+        self.last_state_change = last_state_change
+        self.host_id = host_id
+        self.description = description
+        self.perfdata = perfdata
+
+    @classmethod
+    @functools.lru_cache()
+    def project(cls, *attributes):
+        """This method is used to create a projection, which only requests the given attributes
+
+        :param attributes: Names of the attributes
+        :type attributes: str
+
+        :return: Returns the projection
+        :rtype: :ref:`class_projection`
+        """
+        return Projection(cls, attributes)
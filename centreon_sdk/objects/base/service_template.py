@@ -44,6 +44,9 @@ class ServiceTemplate:
     :param passive_checks_enabled: Are passive checks enabled?
     :type passive_checks_enabled: bool
     """
+    __slots__ = ("id_unique", "description", "alias", "check_command", "check_command_arg", "normal_check_interval",
+                 "retry_check_interval", "max_check_attempts", "active_checks_enabled", "passive_checks_enabled")
+
     def __init__(self, id_unique, description, alias, check_command, check_command_arg, normal_check_interval,
                  retry_check_interval, max_check_attempts, active_checks_enabled, passive_checks_enabled):
         self.id_unique = id_unique
@@ -74,7 +77,7 @@ class ServiceTemplateParam(enum.Enum):
     """Name of the check period (str)"""
     CHECK_COMMAND = "check_command"
     """Name of the check command (str)"""
-    CHECK_COMMAND_ARGUMENTS = "check_arguments_arguments"
+    CHECK_COMMAND_ARGUMENTS = "check_command_arguments"
     """Arguments that go along with the check command (list of str)"""
     MAX_CHECK_ATTEMPTS = "max_check_attempts"
     """Maximum number of attempts before a HARD state is declared (int)"""
@@ -0,0 +1,200 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import array
+import collections
+import itertools
+
+
+class StatusTable:
+    """This class represents a columnar result of the realtime endpoints.
+
+    Every field is stored in a column. Fields with a type code in ``column_types`` are stored in a typed
+    :class:`array.array`, all other fields in a list. Filters, groups and counts work on whole columns, so they do not
+    need an object or a dict per row.
+
+    :param columns: Columns of the table
+    :type columns: dict
+    :param length: Number of rows
+    :type length: int
+    """
+
+    def __init__(self, columns, length):
+        self.columns = columns
+        self.length = length
+
+    @classmethod
+    def from_rows(cls, rows, column_types=None):
+        """This method is used to create a table from the rows returned by the realtime endpoints
+
+        :param rows: Rows returned by the realtime endpoints
+        :type rows: list of dict
+        :param column_types: Optional: Type codes of :class:`array.array` by field, e.g. "q" for integers
+        :type column_types: dict
+
+        :return: Returns the table
+        :rtype: :ref:`class_status_table`
+        """
+        column_types = column_types or {}
+        # Rows may miss fields, so the columns are collected from all rows
+        names = dict.fromkeys(itertools.chain.from_iterable(rows))
+        columns = {}
+        for name in names:
+            values = [row.get(name) for row in rows]
+            type_code = column_types.get(name)
+            if type_code is not None:
+                try:
+                    convert = float if type_code in "fd" else int
+                    values = array.array(type_code, map(convert, values))
+                except (TypeError, ValueError, OverflowError):
+                    # Columns with missing or invalid values are kept as they are
+                    pass
+            columns[name] = values
+        return cls(columns, len(rows))
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __iter__(self):
+        names = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield dict(zip(names, values))
+
+    def row(self, index):
+        """This method is used to get a row of the table
+
+        :param index: Index of the row
+        :type index: int
+
+        :return: Returns the row
+        :rtype: dict
+        """
+        return {name: values[index] for name, values in self.columns.items()}
+
+    def mask(self, name, predicate):
+        """This method is used to evaluate a predicate for every value of a column
+
+        :param name: Name of the column
+        :type name: str
+        :param predicate: Function which is called with a value
+        :type predicate: callable
+
+        :return: Returns a boolean for every row
+        :rtype: list of bool
+        """
+        return list(map(predicate, self.columns[name]))
+
+    def filter(self, mask):
+        """This method is used to select the rows of the table
+
+        :param mask: A boolean for every row, see :meth:`mask`
+        :type mask: list of bool
+
+        :return: Returns a table with the rows for which the mask is true
+        :rtype: :ref:`class_status_table`
+        """
+        return self.take([index for index, selected in enumerate(mask) if selected])
+
+    def where(self, name, *values):
+        """This method is used to select the rows in which a column has one of the given values
+
+        :param name: Name of the column
+        :type name: str
+        :param values: Values to select
+        :type values: Any
+
+        :return: Returns a table with the selected rows
+        :rtype: :ref:`class_status_table`
+        """
+        values = set(values)
+        return self.filter(map(values.__contains__, self.columns[name]))
+
+    def take(self, indices):
+        """This method is used to select rows by their index
+
+        :param indices: Indices of the rows
+        :type indices: list of int
+
+        :return: Returns a table with the rows
+        :rtype: :ref:`class_status_table`
+        """
+        columns = {}
+        for name, values in self.columns.items():
+            selected = [values[x] for x in indices]
+            columns[name] = array.array(values.typecode, selected) if isinstance(values, array.array) else selected
+        return StatusTable(columns, len(indices))
+
+    def count_by(self, *names):
+        """This method is used to count the rows by the values of columns, e.g. by state and instance
+
+        :param names: Names of the columns
+        :type names: str
+
+        :return: Returns the count by value. The values of multiple columns are counted as tuple
+        :rtype: collections.Counter
+        """
+        if len(names) == 1:
+            return collections.Counter(self.columns[names[0]])
+        return collections.Counter(zip(*(self.columns[x] for x in names)))
+
+    def group_by(self, name):
+        """This method is used to split the table by the values of a column
+
+        :param name: Name of the column
+        :type name: str
+
+        :return: Returns a table by value
+        :rtype: dict
+        """
+        groups = collections.defaultdict(list)
+        for index, value in enumerate(self.columns[name]):
+            groups[value].append(index)
+        return {value: self.take(indices) for value, indices in groups.items()}
+
+    def to_numpy(self):
+        """This method is used to convert the columns to NumPy arrays. NumPy has to be installed
+
+        :return: Returns the arrays by name of the column
+        :rtype: dict
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumPy is required to convert a StatusTable, install centreon-sdk[numpy]")
+        # Typed columns are converted without copying their values one by one
+        return {name: numpy.frombuffer(values, dtype=values.typecode) if isinstance(values, array.array)
+                else numpy.array(values, dtype=object) for name, values in self.columns.items()}
+
+    def to_pandas(self):
+        """This method is used to convert the table to a pandas DataFrame. pandas has to be installed
+
+        :return: Returns the data frame
+        :rtype: pandas.DataFrame
+        """
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError("pandas is required to convert a StatusTable, install centreon-sdk[pandas]")
+        return pandas.DataFrame(self.to_numpy(), index=range(self.length))
@@ -0,0 +1,209 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import array
+import itertools
+import operator
+
+from centreon_sdk.network.status_watcher import StatusEventKind
+
+
+class FlapDetector:
+    """This class is used to detect hosts and services which change their state too often.
+
+    Like the flap detection of the monitoring engines, the detector looks at the last states of every host or service.
+    Every change between two polls sets a bit in a bitmap of the window, the changes are weighted from 0.8 for the
+    oldest to 1.2 for the newest and their sum is the percent state change. A host or service starts flapping when
+    the percent is above the high threshold and stops when it falls below the low threshold.
+
+    The bitmaps are shifted when they are used, so a poll only costs the time to find the changes and to look at the
+    hosts and services which changed in the window. Snapshots are passed to :meth:`update`, the changes found by a
+    :ref:`class_status_watcher` can be passed to :meth:`apply` after its first snapshot was passed to :meth:`update`.
+
+    :param window: Optional: Number of states which are compared, at most 64. Default 21
+    :type window: int
+    :param low_threshold: Optional: Percent state change below which the flapping stops. Default 20.0
+    :type low_threshold: float
+    :param high_threshold: Optional: Percent state change above which the flapping starts. Default 30.0
+    :type high_threshold: float
+    """
+
+    def __init__(self, *, window=21, low_threshold=20.0, high_threshold=30.0):
+        if not 2 <= window <= 64:
+            raise ValueError("The window must contain between 2 and 64 states")
+        if low_threshold > high_threshold:
+            raise ValueError("The low threshold must not be above the high threshold")
+        self.window = window
+        self.low_threshold = low_threshold
+        self.high_threshold = high_threshold
+        self.polls = 0
+        self.keys = []
+        self.flapping = set()
+        self.__key_ids = {}
+        self.__states = array.array("b")
+        self.__bitmaps = array.array("Q")
+        self.__shifted = array.array("q")
+        self.__active = set()
+        self.__mask = (1 << (window - 1)) - 1
+        # Sum of the weights of the changes in every byte of a bitmap, bit 0 is the newest change
+        changes = window - 1
+        weights = [1.2 - 0.4 * age / (changes - 1) if changes > 1 else 1.0 for age in range(changes)]
+        self.__tables = []
+        for offset in range(0, changes, 8):
+            self.__tables.append([sum(weights[offset + bit] for bit in range(8)
+                                      if value >> bit & 1 and offset + bit < changes) * 100.0 / changes
+                                  for value in range(256)])
+
+    def update(self, states):
+        """This method is used to pass the states of a poll
+
+        :param states: State by host name or (host name, service description), e.g. like the states recorded by a \
+        :ref:`class_status_history`
+        :type states: dict
+
+        :return: Returns the keys which started and which stopped flapping
+        :rtype: tuple
+        """
+        self.polls += 1
+        key_ids = self.__key_ids
+        ids = list(map(key_ids.get, states))
+        if None in ids:
+            for key in [x for x, key_id in zip(states, ids) if key_id is None]:
+                self.__add(key, states[key])
+            ids = list(map(key_ids.get, states))
+        # The states are compared in map and compress, only the changed states are handled in Python
+        previous = self.__states
+        changed = list(itertools.compress(ids, map(operator.ne, map(previous.__getitem__, ids), states.values())))
+        keys = self.keys
+        for key_id in changed:
+            previous[key_id] = states[keys[key_id]]
+        return self.__evaluate(changed)
+
+    def update_rows(self, rows):
+        """This method is used to pass the rows of a realtime endpoint. Rows with a description are services
+
+        :param rows: Rows with the name, the state and the description of services
+        :type rows: list of dict
+
+        :return: Returns the keys which started and which stopped flapping
+        :rtype: tuple
+        """
+        return self.update({(row["name"], row["description"]) if "description" in row else row["name"]:
+                            int(row["state"]) for row in rows})
+
+    def apply(self, events):
+        """This method is used to pass the changes of a poll of a :ref:`class_status_watcher`
+
+        :param events: Changes of one poll, i.e. the result of ``poll``
+        :type events: list of :ref:`class_status_event`
+
+        :return: Returns the keys which started and which stopped flapping
+        :rtype: tuple
+        """
+        self.polls += 1
+        changed = []
+        for event in events:
+            if event.kind is StatusEventKind.REMOVED:
+                self.remove(event.key)
+                continue
+            state = int(event.new["state"])
+            key_id = self.__key_ids.get(event.key)
+            if key_id is None:
+                self.__add(event.key, state)
+            elif self.__states[key_id] != state:
+                self.__states[key_id] = state
+                changed.append(key_id)
+        return self.__evaluate(changed)
+
+    def remove(self, key):
+        """This method is used to forget the changes of a host or service
+
+        :param key: Host name or (host name, service description)
+        :type key: Union[str, tuple]
+        """
+        key_id = self.__key_ids.get(key)
+        if key_id is not None:
+            self.__bitmaps[key_id] = 0
+            self.__active.discard(key_id)
+            self.flapping.discard(key)
+
+    def percent(self, key):
+        """This method is used to get the weighted percent state change of a host or service
+
+        :param key: Host name or (host name, service description)
+        :type key: Union[str, tuple]
+
+        :return: Returns the percent state change, None for unknown keys
+        :rtype: float
+        """
+        key_id = self.__key_ids.get(key)
+        return self.__percent(self.__bitmap(key_id)) if key_id is not None else None
+
+    def flapping_hosts(self):
+        """This method is used to get the hosts which flap or which have flapping services
+
+        :return: Returns the host names
+        :rtype: set
+        """
+        return {key[0] if isinstance(key, tuple) else key for key in self.flapping}
+
+    def __add(self, key, state):
+        self.__key_ids[key] = len(self.keys)
+        self.keys.append(key)
+        self.__states.append(state)
+        self.__bitmaps.append(0)
+        self.__shifted.append(self.polls)
+
+    def __bitmap(self, key_id):
+        # Shifts the bitmap by the polls since it was used, a poll without a change adds a zero bit
+        bitmap = self.__bitmaps[key_id]
+        if bitmap:
+            bitmap = bitmap << min(self.polls - self.__shifted[key_id], 64) & self.__mask
+            self.__bitmaps[key_id] = bitmap
+        self.__shifted[key_id] = self.polls
+        return bitmap
+
+    def __percent(self, bitmap):
+        percent = 0.0
+        for table in self.__tables:
+            percent += table[bitmap & 255]
+            bitmap >>= 8
+        return percent
+
+    def __evaluate(self, changed):
+        for key_id in changed:
+            # Bit 0 is the change between the last poll and this one
+            self.__bitmaps[key_id] = self.__bitmap(key_id) | 1
+            self.__active.add(key_id)
+        started, stopped = [], []
+        keys = self.keys
+        for key_id in list(self.__active):
+            bitmap = self.__bitmap(key_id)
+            if not bitmap:
+                self.__active.discard(key_id)
+            key = keys[key_id]
+            percent = self.__percent(bitmap)
+            if key in self.flapping:
+                if percent < self.low_threshold:
+                    self.flapping.discard(key)
+                    stopped.append(key)
+            elif percent > self.high_threshold:
+                self.flapping.add(key)
+                started.append(key)
+        return started, stopped
@@ -17,6 +17,7 @@ You should have received a copy of the GNU General Public License
 along with this program; if not, write to the Free Software
 Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 """
+import enum
 import json
 from json import JSONEncoder
 
@@ -24,11 +25,29 @@ from json import JSONEncoder
 class MyEncoder(JSONEncoder):
     def default(self, o):
         if isinstance(o, object):
-            return o.__dict__
+            return attributes(o)
         else:
             return json.JSONEncoder.default(self, o)
 
 
+def attributes(obj):
+    """This method is used to get the attributes of an object, regardless if they are stored in a dict or in slots
+
+    :param obj: Object to get the attributes of
+    :type obj: object
+
+    :return: Returns the names and values of the attributes
+    :rtype: dict
+    """
+    ret_dict = {}
+    for cls in reversed(type(obj).__mro__):
+        for name in cls.__dict__.get("__slots__", ()):
+            if name != "__weakref__" and hasattr(obj, name):
+                ret_dict[name] = getattr(obj, name)
+    ret_dict.update(getattr(obj, "__dict__", {}))
+    return ret_dict
+
+
 def pack_locals(kwargs):
     """This method is used to pack the locals to another dict
 
@@ -47,6 +66,56 @@ def pack_locals(kwargs):
     return ret_dict
 
 
+def to_list(value):
+    """This method is used to wrap a single value in a list
+
+    :param value: Value or list of values
+    :type value: Union[list, object]
+
+    :return: Returns the list
+    :rtype: list
+    """
+    if isinstance(value, list):
+        return value
+    if isinstance(value, tuple):
+        return list(value)
+    return [value]
+
+
+def to_param_value(value):
+    """This method is used to convert a value to the string representation used by CLAPI
+
+    :param value: Value to convert
+    :type value: Union[str, int, bool, enum.Enum, list, None]
+
+    :return: Returns the converted value
+    :rtype: str
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, enum.Enum):
+        return to_param_value(value.value)
+    if isinstance(value, (list, tuple)):
+        return "|".join(to_param_value(x) for x in value)
+    return str(value)
+
+
+def to_bool(value):
+    """This method is used to convert a value returned by CLAPI to a boolean. CLAPI returns booleans as "0" and "1"
+
+    :param value: Value to convert
+    :type value: Union[str, int, bool]
+
+    :return: Returns the converted value
+    :rtype: bool
+    """
+    if isinstance(value, str):
+        return value.strip().lower() not in ("", "0", "false", "no")
+    return bool(value)
+
+
 def check_if_empty_list(response) -> bool:
     """This method is used to check if the result in a dict is an empty list
 
@@ -0,0 +1,190 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import array
+import collections
+import functools
+import itertools
+import math
+import re
+import sys
+
+from centreon_sdk.objects.base.status_table import StatusTable
+
+#: 'label'=value[unit];[warn];[crit];[min];[max], labels with spaces are quoted and quotes are doubled
+PERFDATA = re.compile(r"('(?:[^']|'')+'|[^\s'=]+)=([-+]?[0-9.,]+(?:[eE][-+]?[0-9]+)?|U)([^;\s]*)"
+                      r"(?:;([^;\s]*))?(?:;([^;\s]*))?(?:;([^;\s]*))?(?:;([^;\s]*))?")
+
+NAN = float("nan")
+
+# Services parsed at once by table. The tuples of the regex are freed before the cyclic garbage collector looks at them
+# as long as a chunk allocates fewer objects than its first generation threshold (700)
+_CHUNK = 100
+
+Metric = collections.namedtuple("Metric", ("label", "value", "unit", "warn", "crit", "min", "max"))
+Metric.__doc__ = """A metric of the performance data. Missing values are None, unknown values ("U") are NaN"""
+
+Threshold = collections.namedtuple("Threshold", ("start", "end", "inside"))
+Threshold.__doc__ = """A warning or critical range. An alert is raised for values outside of start and end, or inside of
+them if inside is True. Open bounds are infinite"""
+
+
+def parse(perfdata):
+    """This function is used to parse the performance data of a check
+
+    :param perfdata: Performance data, e.g. "rta=0.2ms;100;500;0 pl=0%;20;60;0;100"
+    :type perfdata: str
+
+    :return: Returns the metrics
+    :rtype: list of :ref:`class_metric`
+    """
+    if not perfdata:
+        return []
+    return [Metric(_label(label), _number(value), unit or None, parse_threshold(warn), parse_threshold(crit),
+                   _bound(minimum), _bound(maximum))
+            for label, value, unit, warn, crit, minimum, maximum in PERFDATA.findall(perfdata)]
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_threshold(threshold):
+    """This function is used to parse a warning or critical range like "10", "5:", "~:10" or "@10:20"
+
+    :param threshold: Range of the plugin guidelines
+    :type threshold: str
+
+    :return: Returns the range or None if there is no valid range. Ranges are cached, as they repeat for many services
+    :rtype: :ref:`class_threshold`
+    """
+    if not threshold:
+        return None
+    inside = threshold.startswith("@")
+    if inside:
+        threshold = threshold[1:]
+    start, separator, end = threshold.rpartition(":")
+    if not separator:
+        start = "0"
+    try:
+        return Threshold(-math.inf if start == "~" else float(start.replace(",", ".")) if start else 0.0,
+                         float(end.replace(",", ".")) if end else math.inf, inside)
+    except ValueError:
+        return None
+
+
+def metrics(rows):
+    """This function is used to parse the performance data of realtime services
+
+    The rows are consumed one by one, so a :ref:`class_status_pager` can be used to parse all services without
+    loading them at once.
+
+    :param rows: Dicts of the realtime endpoint, :ref:`class_service_status` or records of a
+    :ref:`class_projection` with the perfdata field
+    :type rows: Iterable
+
+    :return: Returns the row and metric for every metric
+    :rtype: Iterator[tuple]
+    """
+    for row in rows:
+        for metric in parse(row.get("perfdata") if isinstance(row, dict) else getattr(row, "perfdata", None)):
+            yield row, metric
+
+
+def table(rows, fields=("name", "description")):
+    """This function is used to parse the performance data of realtime services into a table with a row per metric
+
+    The numbers are stored in :class:`array.array` columns of doubles, missing and unknown numbers are NaN. Warning
+    and critical ranges are kept as strings, see :func:`parse_threshold`. The "row" column holds the index of the
+    service the metric belongs to.
+
+    :param rows: Dicts of the realtime endpoint, or a :ref:`class_status_table` with a perfdata column
+    :type rows: Union[Iterable, :ref:`class_status_table`]
+    :param fields: Optional: Fields of the services which are copied to every metric. Default name and description
+    :type fields: tuple
+
+    :return: Returns the table with the columns row, the fields, label, value, unit, warn, crit, min and max
+    :rtype: :ref:`class_status_table`
+    """
+    if isinstance(rows, StatusTable):
+        sources = [rows[field] if field in rows else [None] * len(rows) for field in fields]
+        perfdata = rows["perfdata"] if "perfdata" in rows else [None] * len(rows)
+    else:
+        rows = rows if isinstance(rows, list) else list(rows)
+        sources = [[row.get(field) for row in rows] for field in fields]
+        perfdata = [row.get("perfdata") for row in rows]
+    # The loops run in map, chain and zip, the only Python code is called for every distinct string
+    counts = array.array("l")
+    labels, values, units, warnings, criticals, minimums, maximums = parsed = [], [], [], [], [], [], []
+    for start in range(0, len(perfdata), _CHUNK):
+        found = list(map(PERFDATA.findall, [x or "" for x in perfdata[start:start + _CHUNK]]))
+        counts.extend(map(len, found))
+        for column, chunk in zip(parsed, zip(*itertools.chain.from_iterable(found))):
+            column.extend(chunk)
+    indices = array.array("l", itertools.chain.from_iterable(map(itertools.repeat, range(len(counts)), counts)))
+    columns = {"row": indices}
+    for field, source in zip(fields, sources):
+        columns[field] = list(map(source.__getitem__, indices))
+    columns["label"] = _unique(labels, _label)
+    columns["value"] = _numbers(values)
+    columns["unit"] = _unique(units, _optional)
+    columns["warn"] = _unique(warnings, _optional)
+    columns["crit"] = _unique(criticals, _optional)
+    columns["min"] = _numbers(minimums)
+    columns["max"] = _numbers(maximums)
+    return StatusTable(columns, len(indices))
+
+
+def _label(label):
+    return sys.intern(label[1:-1].replace("''", "'") if label.startswith("'") else label)
+
+
+def _optional(value):
+    return sys.intern(value) if value else None
+
+
+def _unique(values, convert):
+    # Labels, units and ranges repeat for every service, so every value is converted and stored only once
+    converted = {x: convert(x) for x in set(values)}
+    return list(map(converted.__getitem__, values))
+
+
+def _number(value):
+    try:
+        return float(value)
+    except ValueError:
+        # Unknown values and locales with a decimal comma
+        try:
+            return float(value.replace(",", "."))
+        except ValueError:
+            return NAN
+
+
+def _bound(value):
+    return _number(value) if value else None
+
+
+def _numbers(values):
+    try:
+        # Fast path for columns which contain only numbers
+        return array.array("d", map(float, values))
+    except ValueError:
+        # Columns with missing values are converted by distinct value, as missing minimums and maximums repeat
+        return array.array("d", _unique(values, _missing))
+
+
+def _missing(value):
+    return _number(value) if value else NAN
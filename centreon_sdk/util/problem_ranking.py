@@ -0,0 +1,306 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import collections
+import heapq
+import time
+
+from centreon_sdk.network.status_watcher import StatusEventKind
+
+#: Rank of the states of services for the ranking by state, critical is the worst
+SEVERITY = {2: 3, 3: 2, 1: 1}
+
+
+class RankedProblem:
+    """This class represents a service in a :ref:`class_problem_ranking`
+
+    :param key: (host name, service description)
+    :type key: tuple
+    :param state: State of the service
+    :type state: int
+    :param since: Time of the last state change in seconds
+    :type since: float
+    :param criticality: Criticality level of the service, None if there is none
+    :type criticality: int
+    :param acknowledged: Is the problem acknowledged?
+    :type acknowledged: bool
+    :param changes: Number of state changes in the flapping window
+    :type changes: int
+    """
+    __slots__ = ("key", "state", "since", "criticality", "acknowledged", "changes")
+
+    def __init__(self, key, state, since, criticality=None, acknowledged=False, changes=0):
+        self.key = key
+        self.state = state
+        self.since = since
+        self.criticality = criticality
+        self.acknowledged = acknowledged
+        self.changes = changes
+
+    def __repr__(self):
+        return "RankedProblem({!r}, state={}, since={}, changes={})".format(self.key, self.state, self.since,
+                                                                             self.changes)
+
+
+class ProblemRanking:
+    """This class is used to rank the worst services, updated with every change of a service.
+
+    Every ranking is an indexed binary heap with the position of every service, so a change moves the service up or
+    down in O(log n). The top N are read by walking the heap from its root, which takes O(N log N) no matter how many
+    services are ranked. The rankings are:
+
+    * *state*: critical before unknown before warning, the longest problem first
+    * *duration*: the longest problem first
+    * *criticality*: the highest criticality level first, then the longest problem
+    * *flapping*: the most state changes in the flapping window first, including services which are ok now
+
+    The ranking can be fed by a :ref:`class_status_watcher`: ``watcher.subscribe(ranking.apply)``.
+
+    :param flapping_window: Optional: Period in seconds in which the state changes are counted. Default 3600
+    :type flapping_window: float
+    :param include_acknowledged: Optional: Specify True to rank acknowledged problems. Default False
+    :type include_acknowledged: bool
+    """
+    rankings = ("state", "duration", "criticality", "flapping")
+
+    def __init__(self, *, flapping_window=3600.0, include_acknowledged=False):
+        self.flapping_window = flapping_window
+        self.include_acknowledged = include_acknowledged
+        self.services = {}
+        self.__heaps = {name: _IndexedHeap() for name in self.rankings}
+        self.__changes = {}
+        self.__expiry = []
+
+    def load(self, rows, timestamp=None):
+        """This method is used to add the rows of a realtime endpoint, e.g. the first snapshot of a watcher
+
+        :param rows: Rows of the realtime services
+        :type rows: Iterable[dict]
+        :param timestamp: Optional: Time of the rows in seconds. Default now
+        :type timestamp: float
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        for row in rows:
+            self.update((row.get("name"), row.get("description")), row, timestamp)
+
+    def apply(self, event, timestamp=None):
+        """This method is used to apply a change reported by a :ref:`class_status_watcher`
+
+        :param event: Change of a service
+        :type event: :ref:`class_status_event`
+        :param timestamp: Optional: Time of the change in seconds. Default now
+        :type timestamp: float
+        """
+        if event.kind is StatusEventKind.REMOVED:
+            self.remove(event.key)
+        else:
+            self.update(event.key, event.new, timestamp)
+
+    def update(self, key, row, timestamp=None):
+        """This method is used to add or update a service
+
+        :param key: (host name, service description)
+        :type key: tuple
+        :param row: Row of the realtime endpoint. last_state_change, criticality and acknowledged are optional
+        :type row: dict
+        :param timestamp: Optional: Time of the row in seconds. Default now
+        :type timestamp: float
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        self.expire(timestamp)
+        state = _int(row.get("state"))
+        service = self.services.get(key)
+        if service is None:
+            service = self.services[key] = RankedProblem(key, state, timestamp)
+        elif service.state != state:
+            # A change of the state counts for flapping, even if the row does not contain the time of the change
+            service.state = state
+            service.since = timestamp
+            self.__changes.setdefault(key, collections.deque()).append(timestamp)
+            heapq.heappush(self.__expiry, (timestamp + self.flapping_window, key))
+        since = _int(row.get("last_state_change"))
+        if since:
+            service.since = since
+        service.criticality = _int(row.get("criticality"))
+        acknowledged = row.get("acknowledged")
+        service.acknowledged = acknowledged not in (None, "", "0", 0, False, "false")
+        service.changes = len(self.__changes.get(key, ()))
+        self.__rank(service)
+
+    def remove(self, key):
+        """This method is used to remove a service
+
+        :param key: (host name, service description)
+        :type key: tuple
+        """
+        if self.services.pop(key, None) is not None:
+            self.__changes.pop(key, None)
+            for heap in self.__heaps.values():
+                heap.remove(key)
+
+    def expire(self, timestamp=None):
+        """This method is used to stop counting the state changes which are older than the flapping window
+
+        :param timestamp: Optional: Current time in seconds. Default now
+        :type timestamp: float
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        expiry = self.__expiry
+        while expiry and expiry[0][0] <= timestamp:
+            _, key = heapq.heappop(expiry)
+            changes = self.__changes.get(key)
+            # The changes of removed services are dropped, the entries of a service removed and added again may be
+            # already expired
+            if not changes or changes[0] + self.flapping_window > timestamp:
+                continue
+            while changes and changes[0] + self.flapping_window <= timestamp:
+                changes.popleft()
+            service = self.services[key]
+            service.changes = len(changes)
+            if not changes:
+                del self.__changes[key]
+            self.__rank(service)
+
+    def top(self, count, by="state"):
+        """This method is used to get the worst services
+
+        :param count: Number of services
+        :type count: int
+        :param by: Optional: Name of the ranking, one of :attr:`rankings`. Default "state"
+        :type by: str
+
+        :return: Returns the worst services, the worst first
+        :rtype: list of :ref:`class_ranked_problem`
+        """
+        if by not in self.__heaps:
+            raise ValueError("Unknown ranking {!r}, use one of {}".format(by, ", ".join(self.rankings)))
+        return [self.services[key] for key in self.__heaps[by].smallest(count)]
+
+    def __len__(self):
+        return len(self.services)
+
+    def __rank(self, service):
+        key = service.key
+        heaps = self.__heaps
+        problem = service.state in SEVERITY and (self.include_acknowledged or not service.acknowledged)
+        if problem:
+            heaps["state"].set(key, (-SEVERITY[service.state], service.since, key))
+            heaps["duration"].set(key, (service.since, key))
+            if service.criticality is not None:
+                heaps["criticality"].set(key, (-service.criticality, service.since, key))
+            else:
+                heaps["criticality"].remove(key)
+        else:
+            for name in ("state", "duration", "criticality"):
+                heaps[name].remove(key)
+        if service.changes:
+            heaps["flapping"].set(key, (-service.changes, key))
+        else:
+            heaps["flapping"].remove(key)
+
+
+class _IndexedHeap:
+    # Binary min heap of (priority, key) with the position of every key, so priorities can be changed and keys
+    # removed in O(log n)
+
+    def __init__(self):
+        self.items = []
+        self.positions = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def set(self, key, priority):
+        position = self.positions.get(key)
+        if position is None:
+            self.items.append((priority, key))
+            self.positions[key] = len(self.items) - 1
+            self.__up(len(self.items) - 1)
+            return
+        old = self.items[position][0]
+        if old == priority:
+            return
+        self.items[position] = (priority, key)
+        if priority < old:
+            self.__up(position)
+        else:
+            self.__down(position)
+
+    def remove(self, key):
+        position = self.positions.pop(key, None)
+        if position is None:
+            return
+        last = self.items.pop()
+        if position < len(self.items):
+            self.items[position] = last
+            self.positions[last[1]] = position
+            self.__up(position)
+            self.__down(self.positions[last[1]])
+
+    def smallest(self, count):
+        # The children of a node are never smaller, so the next smallest item is always a child of the items taken
+        # so far. Only these candidates are kept in a second heap
+        items = self.items
+        result = []
+        candidates = [(items[0][0], 0)] if items else []
+        while candidates and len(result) < count:
+            _, position = heapq.heappop(candidates)
+            result.append(items[position][1])
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(items):
+                    heapq.heappush(candidates, (items[child][0], child))
+        return result
+
+    def __up(self, position):
+        items, positions = self.items, self.positions
+        item = items[position]
+        while position > 0:
+            parent = (position - 1) // 2
+            if items[parent][0] <= item[0]:
+                break
+            items[position] = items[parent]
+            positions[items[position][1]] = position
+            position = parent
+        items[position] = item
+        positions[item[1]] = position
+
+    def __down(self, position):
+        items, positions = self.items, self.positions
+        item = items[position]
+        size = len(items)
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and items[child + 1][0] < items[child][0]:
+                child += 1
+            if item[0] <= items[child][0]:
+                break
+            items[position] = items[child]
+            positions[items[position][1]] = position
+            position = child
+        items[position] = item
+        positions[item[1]] = position
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
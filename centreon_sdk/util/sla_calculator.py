@@ -0,0 +1,312 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import bisect
+import calendar
+import datetime
+
+PENDING = 4
+"""State of hosts and services which were not checked yet, it counts neither as available nor as problem"""
+
+
+class SlaResult:
+    """This class represents the availability of a host, service or group in a period
+
+    :param time_in_state: Seconds by state, without downtimes
+    :type time_in_state: dict
+    :param downtime: Seconds in downtime
+    :type downtime: int
+    :param failures: Number of changes from an ok state to a problem
+    :type failures: int
+    :param ok_states: States which count as available
+    :type ok_states: tuple
+    """
+    __slots__ = ("time_in_state", "downtime", "failures", "ok_states")
+
+    def __init__(self, time_in_state=None, downtime=0, failures=0, ok_states=(0,)):
+        self.time_in_state = time_in_state if time_in_state is not None else {}
+        self.downtime = downtime
+        self.failures = failures
+        self.ok_states = ok_states
+
+    @property
+    def ok_time(self):
+        """Seconds in an ok state"""
+        return sum(self.time_in_state.get(x, 0) for x in self.ok_states)
+
+    @property
+    def problem_time(self):
+        """Seconds in a problem state"""
+        return sum(value for state, value in self.time_in_state.items()
+                   if state not in self.ok_states and state != PENDING)
+
+    @property
+    def uptime(self):
+        """Share of the time in an ok state in percent, None if nothing was recorded"""
+        total = self.ok_time + self.problem_time
+        return 100.0 * self.ok_time / total if total else None
+
+    @property
+    def mttr(self):
+        """Mean time to repair: average seconds of a problem, None without failures"""
+        return self.problem_time / self.failures if self.failures else None
+
+    @property
+    def mtbf(self):
+        """Mean time between failures: average seconds in an ok state per failure, None without failures"""
+        return self.ok_time / self.failures if self.failures else None
+
+    def merge(self, other):
+        """This method is used to add the times and failures of another result, e.g. to get the result of a group
+
+        :param other: Result to add
+        :type other: :ref:`class_sla_result`
+        """
+        for state, value in other.time_in_state.items():
+            self.time_in_state[state] = self.time_in_state.get(state, 0) + value
+        self.downtime += other.downtime
+        self.failures += other.failures
+
+    def __repr__(self):
+        uptime = self.uptime
+        return "SlaResult(uptime={}, failures={}, downtime={})".format(
+            "{:.3f}%".format(uptime) if uptime is not None else None, self.failures, self.downtime)
+
+
+class SlaCalculator:
+    """This class is used to calculate the availability of hosts and services from a :ref:`class_status_history`.
+
+    Every key is calculated in one pass over its transitions in the history. Time in a downtime is not counted.
+    Recurrent downtimes are expanded for the period of a report, flexible periods are counted as if they were fixed.
+
+    :param history: History of the states
+    :type history: :ref:`class_status_history`
+    :param ok_states: Optional: States which count as available. Default (0,)
+    :type ok_states: tuple
+    :param timezone: Optional: Time zone of the times of recurrent downtimes. Default the local time zone
+    :type timezone: datetime.tzinfo
+    """
+
+    def __init__(self, history, *, ok_states=(0,), timezone=None):
+        self.history = history
+        self.ok_states = tuple(ok_states)
+        self.timezone = timezone
+        self.__recurrent = []
+        self.__fixed = []
+
+    def add_downtime(self, downtime, periods, members=()):
+        """This method is used to add a recurrent downtime
+
+        :param downtime: Recurrent downtime
+        :type downtime: :ref:`class_downtime`
+        :param periods: Periods of the downtime
+        :type periods: list of :ref:`class_downtime_period`
+        :param members: Optional: Keys of the hosts and services of the host groups and service groups of the downtime
+        :type members: Iterable
+        """
+        if downtime.activate is not None and not downtime.activate:
+            return
+        hosts = set(downtime.hosts or ())
+        services = {_service_key(x) for x in downtime.services or ()}
+        self.__recurrent.append((hosts, services | set(members), list(periods)))
+
+    def add_realtime_downtime(self, downtime):
+        """This method is used to add a realtime downtime
+
+        :param downtime: Realtime downtime of a host or service
+        :type downtime: Union[:ref:`class_real_time_downtime_host`, :ref:`class_real_time_downtime_service`]
+        """
+        start = _timestamp(downtime.actual_start_time) or _timestamp(downtime.start_time)
+        end = _timestamp(downtime.actual_end_time) or _timestamp(downtime.end_time)
+        if start is None or end is None:
+            return
+        service = getattr(downtime, "service_name", None)
+        if service is None:
+            self.__fixed.append(({downtime.host_name}, set(), start, end))
+        else:
+            self.__fixed.append((set(), {(downtime.host_name, service)}, start, end))
+
+    def report(self, start, end, *, keys=None):
+        """This method is used to calculate the availability of hosts or services in a period
+
+        :param start: Start of the period in seconds
+        :type start: int
+        :param end: End of the period in seconds
+        :type end: int
+        :param keys: Optional: Host names or (host name, service description). Default all keys of the history
+        :type keys: Iterable
+
+        :return: Returns the result by key
+        :rtype: dict
+        """
+        history = self.history
+        downtimes = self.__downtimes(start, end)
+        ok_states = self.ok_states
+        results = {}
+        for key in (history.keys if keys is None else keys):
+            times, states = history.series(key)
+            excluded = _merge(downtimes.get(key, []) + downtimes.get(_host(key), []) if downtimes else [])
+            time_in_state = {}
+            failures = 0
+            previous = None
+            count = len(times)
+            for index in range(count):
+                begin = times[index]
+                finish = times[index + 1] if index + 1 < count else history.last_time
+                state = states[index]
+                if start <= begin < end and previous in ok_states and state not in ok_states and \
+                        state != PENDING and not _inside(begin, excluded):
+                    failures += 1
+                previous = state
+                begin, finish = max(begin, start), min(finish, end)
+                if finish <= begin:
+                    continue
+                duration = finish - begin - (_overlap(begin, finish, excluded) if excluded else 0)
+                time_in_state[state] = time_in_state.get(state, 0) + duration
+            results[key] = SlaResult(time_in_state, _overlap(start, end, excluded) if excluded else 0, failures,
+                                     ok_states)
+        return results
+
+    def group_report(self, start, end, groups):
+        """This method is used to calculate the availability of groups of hosts or services in a period
+
+        :param start: Start of the period in seconds
+        :type start: int
+        :param end: End of the period in seconds
+        :type end: int
+        :param groups: Keys of the members by group name
+        :type groups: dict
+
+        :return: Returns the result by group name
+        :rtype: dict
+        """
+        members = {key for keys in groups.values() for key in keys}
+        results = self.report(start, end, keys=members)
+        group_results = {}
+        for name, keys in groups.items():
+            group_results[name] = result = SlaResult(ok_states=self.ok_states)
+            for key in keys:
+                result.merge(results[key])
+        return group_results
+
+    def __downtimes(self, start, end):
+        # Intervals of downtime by key, a host name also applies to the services of the host
+        downtimes = {}
+        for hosts, services, periods in self.__recurrent:
+            intervals = [x for period in periods for x in self.__expand(period, start, end)]
+            for key in hosts | services:
+                downtimes.setdefault(key, []).extend(intervals)
+        for hosts, services, begin, finish in self.__fixed:
+            if begin < end and finish > start:
+                for key in hosts | services:
+                    downtimes.setdefault(key, []).append((begin, finish))
+        return downtimes
+
+    def __expand(self, period, start, end):
+        begin_time, end_time = _seconds(period.start_time), _seconds(period.end_time)
+        if begin_time is None or end_time is None:
+            return []
+        if end_time <= begin_time:
+            end_time += 86400
+        intervals = []
+        day = datetime.datetime.fromtimestamp(start, self.timezone).date() - datetime.timedelta(days=1)
+        last = datetime.datetime.fromtimestamp(end, self.timezone).date()
+        while day <= last:
+            if _applies(period, day):
+                midnight = datetime.datetime(day.year, day.month, day.day, tzinfo=self.timezone).timestamp()
+                interval = (int(midnight) + begin_time, int(midnight) + end_time)
+                if interval[0] < end and interval[1] > start:
+                    intervals.append(interval)
+            day += datetime.timedelta(days=1)
+        return intervals
+
+
+def _applies(period, day):
+    if period.day_of_month:
+        return day.day in period.day_of_month
+    if period.day_of_week:
+        if day.isoweekday() not in period.day_of_week:
+            return False
+        cycle = (period.month_cycle or "none").lower()
+        if cycle == "first":
+            return day.day <= 7
+        if cycle == "last":
+            return day.day > calendar.monthrange(day.year, day.month)[1] - 7
+        return True
+    return False
+
+
+def _seconds(value):
+    # hh:mm or hh:mm:ss
+    try:
+        parts = [int(x) for x in str(value).split(":")]
+    except ValueError:
+        return None
+    return parts[0] * 3600 + parts[1] * 60 + (parts[2] if len(parts) > 2 else 0) if len(parts) >= 2 else None
+
+
+def _timestamp(value):
+    if value is None or value == "":
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        pass
+    for date_format in ("%Y/%m/%d %H:%M", "%Y/%m/%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S"):
+        try:
+            return int(datetime.datetime.strptime(str(value), date_format).timestamp())
+        except ValueError:
+            continue
+    return None
+
+
+def _service_key(value):
+    for separator in ("|", ",", ";"):
+        if separator in value:
+            return tuple(value.split(separator, 1))
+    return value
+
+
+def _host(key):
+    return key[0] if isinstance(key, tuple) else None
+
+
+def _merge(intervals):
+    merged = []
+    for begin, finish in sorted(intervals):
+        if merged and begin <= merged[-1][1]:
+            if finish > merged[-1][1]:
+                merged[-1] = (merged[-1][0], finish)
+        else:
+            merged.append((begin, finish))
+    return merged
+
+
+def _inside(moment, intervals):
+    index = bisect.bisect_right(intervals, (moment, float("inf"))) - 1
+    return index >= 0 and intervals[index][0] <= moment < intervals[index][1]
+
+
+def _overlap(begin, finish, intervals):
+    total = 0
+    index = max(0, bisect.bisect_right(intervals, (begin, float("inf"))) - 1)
+    while index < len(intervals) and intervals[index][0] < finish:
+        total += max(0, min(finish, intervals[index][1]) - max(begin, intervals[index][0]))
+        index += 1
+    return total
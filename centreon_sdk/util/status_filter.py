@@ -0,0 +1,252 @@
+"""
+This program is a library to communicate with the Centreon REST API
+
+Copyright (C) 2019 Niklas Pfister, contact@omikron.pw
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+import operator
+import re
+
+TOKENS = re.compile(r"""\s*(?:(?P<regex>/(?:\\.|[^/\\])*/)|(?P<string>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|"""
+                    r"""(?P<op>==|!=|<=|>=|!~|[<>~(),])|(?P<word>[^\s()<>=!~,"'/]+))""")
+
+HOST_STATES = {"up": 0, "down": 1, "unreachable": 2, "pending": 4}
+SERVICE_STATES = {"ok": 0, "warning": 1, "critical": 2, "unknown": 3, "pending": 4}
+
+#: Parameters of host_status_get by field and operator
+HOST_PUSHDOWN = {("status", "=="): "status", ("hostgroup", "=="): "hostgroup", ("instance", "=="): "instance",
+                 ("criticality", "=="): "critically", ("name", "~"): "search"}
+#: Parameters of service_status_get by field and operator
+SERVICE_PUSHDOWN = {("status", "=="): "status", ("hostgroup", "=="): "hostgroup", ("servicegroup", "=="): "servicegroup",
+                    ("instance", "=="): "instance", ("criticality", "=="): "criticality",
+                    ("description", "~"): "search", ("name", "~"): "searchHost", ("output", "~"): "searchOutput"}
+#: Fields which are not part of the rows, so they can only be filtered by the endpoint
+SERVER_ONLY = ("hostgroup", "servicegroup")
+
+COMPARE = {"==": operator.eq, "!=": operator.ne, "<": operator.lt, "<=": operator.le, ">": operator.gt,
+           ">=": operator.ge}
+
+
+class StatusFilter:
+    """This class represents a filter over host or service status.
+
+    A filter is written as expression, e.g. ``status in (critical, warning) and hostgroup == 12 and output ~ /timeout/``.
+    Comparisons are ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in (a, b)`` and ``~ /regex/`` or ``!~ /regex/``, they
+    are combined with ``and``, ``or``, ``not`` and parentheses. Values are numbers, words or quoted strings. ``status``
+    compares the state by its name.
+
+    The comparisons of the top level ``and`` which the endpoint supports are sent as its parameters, everything else is
+    compiled into a predicate which is evaluated for every row. Patterns which are sent to the endpoint are evaluated
+    again, as the endpoint matches them less strictly.
+
+    :param expression: Expression of the filter
+    :type expression: str
+    :param service: Optional: Specify True for a filter over service status. Default False
+    :type service: bool
+    """
+
+    def __init__(self, expression, *, service=False):
+        self.expression = expression
+        self.states = SERVICE_STATES if service else HOST_STATES
+        self.params = {}
+        self.fields = set()
+        tokens = list(_tokenize(expression))
+        tree, position = self.__parse_or(tokens, 0)
+        if position != len(tokens):
+            raise ValueError("Unexpected {} in filter: {}".format(tokens[position][1], expression))
+
+        local = []
+        pushdown = SERVICE_PUSHDOWN if service else HOST_PUSHDOWN
+        for node in tree[1] if tree[0] == "and" else [tree]:
+            param = self.__pushdown(node, pushdown)
+            if param is None or node[2] == "~":
+                # Patterns are evaluated again, the endpoint only searches for a substring
+                local.append(node)
+        self.predicate = self.__compile(("and", local)) if local else None
+
+    def __pushdown(self, node, pushdown):
+        if node[0] != "cmp":
+            return None
+        _, field, op, value = node
+        if op == "in" and len(value) == 1:
+            op, value = "==", value[0]
+        if op == "~" and re.escape(value.pattern) != value.pattern:
+            # Only literal patterns can be sent, the endpoint searches for a substring
+            return None
+        param = pushdown.get((field, op))
+        if param is None or param in self.params:
+            return None
+        if field == "status":
+            # The endpoint only knows the lower case names of the states
+            value = str(value).lower()
+            if value not in self.states:
+                return None
+        self.params[param] = value.pattern if op == "~" else value
+        return param
+
+    def filter(self, rows):
+        """This method is used to select the rows which match the part of the filter evaluated locally
+
+        :param rows: Rows returned by the endpoint
+        :type rows: list of dict
+
+        :return: Returns the matching rows
+        :rtype: list of dict
+        """
+        if self.predicate is None:
+            return rows
+        return [x for x in rows if self.predicate(x)]
+
+    def __parse_or(self, tokens, position):
+        node, position = self.__parse_and(tokens, position)
+        nodes = [node]
+        while _is_word(tokens, position, "or"):
+            node, position = self.__parse_and(tokens, position + 1)
+            nodes.append(node)
+        return (("or", nodes) if len(nodes) > 1 else node), position
+
+    def __parse_and(self, tokens, position):
+        node, position = self.__parse_not(tokens, position)
+        nodes = [node]
+        while _is_word(tokens, position, "and"):
+            node, position = self.__parse_not(tokens, position + 1)
+            nodes.append(node)
+        return (("and", nodes) if len(nodes) > 1 else node), position
+
+    def __parse_not(self, tokens, position):
+        if _is_word(tokens, position, "not"):
+            node, position = self.__parse_not(tokens, position + 1)
+            return ("not", node), position
+        if position < len(tokens) and tokens[position] == ("op", "("):
+            node, position = self.__parse_or(tokens, position + 1)
+            return node, self.__expect(tokens, position, ")")
+        if position + 2 > len(tokens) or tokens[position][0] != "word":
+            raise ValueError("Expected a field at {} in filter: {}".format(position, self.expression))
+        field = tokens[position][1]
+        kind, op = tokens[position + 1]
+        if kind == "word" and op == "in":
+            position = self.__expect(tokens, position + 2, "(")
+            values = [self.__value(field, tokens, position)]
+            position += 1
+            while position < len(tokens) and tokens[position] == ("op", ","):
+                values.append(self.__value(field, tokens, position + 1))
+                position += 2
+            return ("cmp", field, "in", values), self.__expect(tokens, position, ")")
+        if kind != "op" or op not in COMPARE and op not in ("~", "!~"):
+            raise ValueError("Expected a comparison after {} in filter: {}".format(field, self.expression))
+        if op in ("~", "!~"):
+            if position + 2 >= len(tokens) or tokens[position + 2][0] != "regex":
+                raise ValueError("Expected a /regex/ after {} in filter: {}".format(op, self.expression))
+            return ("cmp", field, op, re.compile(tokens[position + 2][1])), position + 3
+        return ("cmp", field, op, self.__value(field, tokens, position + 2)), position + 3
+
+    def __value(self, field, tokens, position):
+        if position >= len(tokens) or tokens[position][0] not in ("word", "string"):
+            raise ValueError("Expected a value for {} in filter: {}".format(field, self.expression))
+        kind, value = tokens[position]
+        if kind == "word":
+            try:
+                return int(value)
+            except ValueError:
+                try:
+                    return float(value)
+                except ValueError:
+                    return value
+        return value
+
+    def __expect(self, tokens, position, op):
+        if position >= len(tokens) or tokens[position] != ("op", op):
+            raise ValueError("Expected {} in filter: {}".format(op, self.expression))
+        return position + 1
+
+    def __compile(self, node):
+        kind = node[0]
+        if kind in ("and", "or"):
+            predicates = [self.__compile(x) for x in node[1]]
+            if len(predicates) == 1:
+                return predicates[0]
+            if kind == "and":
+                return lambda row: all(x(row) for x in predicates)
+            return lambda row: any(x(row) for x in predicates)
+        if kind == "not":
+            predicate = self.__compile(node[1])
+            return lambda row: not predicate(row)
+
+        _, field, op, value = node
+        if field in SERVER_ONLY:
+            raise ValueError("{} can only be filtered with == at the top level: {}".format(field, self.expression))
+        key = field
+        if field == "status":
+            key = "state"
+            values = value if op == "in" else [value]
+            unknown = [x for x in values if str(x).lower() not in self.states]
+            if unknown:
+                raise ValueError("Unknown status {}: {}".format(", ".join(map(str, unknown)), self.expression))
+            value = [self.states[str(x).lower()] for x in values] if op == "in" else self.states[str(value).lower()]
+        self.fields.add(key)
+
+        if op in ("~", "!~"):
+            search = value.search
+            if op == "~":
+                return lambda row: row.get(key) is not None and search(str(row[key])) is not None
+            return lambda row: row.get(key) is None or search(str(row[key])) is None
+        if op == "in":
+            numbers = {x for x in value if isinstance(x, (int, float))}
+            strings = {str(x) for x in value}
+            return lambda row: _convert(row.get(key), numbers) in numbers or str(row.get(key)) in strings
+        compare = COMPARE[op]
+        if isinstance(value, (int, float)):
+            return lambda row: _compare_number(compare, row.get(key), value)
+        return lambda row: row.get(key) is not None and compare(str(row[key]), value)
+
+
+def _tokenize(expression):
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = TOKENS.match(expression, position)
+        if match is None or match.end() == position:
+            raise ValueError("Unexpected character at {} in filter: {}".format(position, expression))
+        position = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "regex":
+            value = value[1:-1].replace("\\/", "/")
+        elif kind == "string":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        yield kind, value
+
+
+def _is_word(tokens, position, word):
+    return position < len(tokens) and tokens[position][0] == "word" and tokens[position][1].lower() == word
+
+
+def _convert(value, numbers):
+    if not numbers or value is None:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _compare_number(compare, value, number):
+    if value is None:
+        return compare is operator.ne
+    try:
+        return compare(float(value), number)
+    except (TypeError, ValueError):
+        return compare is operator.ne
@@ -22,5 +22,9 @@ setuptools.setup(
     install_requires=[
         "wheel",
         "requests"
-    ]
+    ],
+    extras_require={
+        "numpy": ["numpy"],
+        "pandas": ["pandas"]
+    }
 )